@@ -0,0 +1,60 @@
+"""
+JSON helpers for MQTT payloads.
+
+Payloads are encoded once, compactly, straight to UTF-8 bytes so paho can
+queue them without a further str → bytes conversion. Encoding and decoding use
+orjson when it is installed (``pip install lucid-agent-core[fast]``) and fall
+back to the stdlib otherwise.
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import fields, is_dataclass
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # optional speedup
+    orjson = None  # type: ignore[assignment]
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so one except clause covers both.
+JSONDecodeError = json.JSONDecodeError
+
+
+# Dataclass type -> field names, resolved once per result type.
+_FIELD_NAMES: dict[type, tuple[str, ...]] = {}
+
+
+def _default(obj: Any) -> Any:
+    # Dataclass instances (e.g. upgrade results) encode field by field, without
+    # the recursive deepcopy that dataclasses.asdict() performs.
+    cls = type(obj)
+    names = _FIELD_NAMES.get(cls)
+    if names is None:
+        if not is_dataclass(cls):
+            raise TypeError(f"Object of type {cls.__name__} is not JSON serializable")
+        names = _FIELD_NAMES[cls] = tuple(f.name for f in fields(cls))
+    return {name: getattr(obj, name) for name in names}
+
+
+_encoder = json.JSONEncoder(separators=(",", ":"), default=_default)
+
+
+def dumps(obj: Any) -> bytes:
+    """Encode *obj* (including dataclass instances) as compact JSON bytes."""
+    if orjson is not None:
+        # orjson encodes dataclasses natively; non-str keys are stringified like the stdlib does.
+        return orjson.dumps(obj, default=_default, option=orjson.OPT_NON_STR_KEYS)
+    return _encoder.encode(obj).encode("utf-8")
+
+
+def loads(data: str | bytes) -> Any:
+    """Decode a JSON document from str or UTF-8 bytes; raises JSONDecodeError on bad input."""
+    if orjson is not None:
+        return orjson.loads(data)
+    try:
+        return json.loads(data)
+    except UnicodeDecodeError as exc:
+        # Match orjson: invalid UTF-8 is reported as a decode error, not a ValueError subclass.
+        raise JSONDecodeError(f"invalid UTF-8: {exc.reason}", "", exc.start) from exc
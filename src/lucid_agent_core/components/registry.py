@@ -2,6 +2,11 @@
 Component registry — persistent JSON store of installed components.
 
 Path: {base_dir}/data/components_registry.json. Atomic writes with fsync.
+
+Writes are serialised through a single background writer thread. The most
+recently submitted snapshot is served by load_registry() until it reaches
+disk, so readers always observe in-flight writes. Reads of an unchanged file
+are served from an in-memory copy keyed by the file's stat identity.
 """
 
 from __future__ import annotations
@@ -10,9 +15,11 @@ import json
 import logging
 import os
 import tempfile
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Any
+from typing import Any, Optional
 
 from lucid_agent_core.paths import get_paths
 
@@ -23,6 +30,23 @@ class RegistryError(RuntimeError):
     """Raised when registry operations fail in a non-recoverable way."""
 
 
+_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="registry-writer")
+_pending_lock = threading.Lock()
+_pending: Optional[dict[str, dict[str, Any]]] = None
+_pending_seq = 0
+# Highest snapshot sequence known to be on disk; queued writes at or below it are skipped.
+_written_seq = 0
+
+# Parsed registry keyed by the file's identity (path, inode, mtime_ns, size).
+_cache_lock = threading.Lock()
+_cache_key: Optional[tuple[str, int, int, int]] = None
+_cache_data: dict[str, dict[str, Any]] = {}
+
+
+def _copy_registry(data: dict[str, dict[str, Any]]) -> dict[str, dict[str, Any]]:
+    return {k: dict(v) for k, v in data.items()}
+
+
 def _fsync_dir(path: Path) -> None:
     """
     Ensure directory metadata is flushed so atomic rename is durable.
@@ -52,19 +76,34 @@ def _validate_registry_shape(data: Any) -> dict[str, dict[str, Any]]:
 
 
 def load_registry() -> dict[str, dict[str, Any]]:
+    with _pending_lock:
+        if _pending is not None:
+            logger.debug("Registry served from pending write (%d component(s))", len(_pending))
+            return _copy_registry(_pending)
+
     paths = get_paths()
     registry_path = paths.registry_path
-    logger.debug("Loading registry from %s", registry_path)
 
-    if not registry_path.exists():
+    try:
+        st = os.stat(registry_path)
+    except FileNotFoundError:
         logger.debug("Registry file not found at %s, returning empty", registry_path)
         return {}
+    except OSError as exc:
+        raise RegistryError(f"failed to read registry: {exc}") from exc
+
+    key = (str(registry_path), st.st_ino, st.st_mtime_ns, st.st_size)
+    with _cache_lock:
+        if key == _cache_key:
+            return _copy_registry(_cache_data)
 
+    logger.debug("Loading registry from %s", registry_path)
     try:
         with registry_path.open("r", encoding="utf-8") as f:
             data = json.load(f)
         result = _validate_registry_shape(data)
         logger.info("Registry loaded: %d component(s)", len(result))
+        _prime_cache(key, result)
         return result
     except json.JSONDecodeError:
         # Preserve corrupted file for debugging instead of silently hiding it.
@@ -80,7 +119,89 @@ def load_registry() -> dict[str, dict[str, Any]]:
         raise RegistryError(f"failed to read registry: {exc}") from exc
 
 
+def _prime_cache(key: tuple[str, int, int, int], data: dict[str, dict[str, Any]]) -> None:
+    """Seed the read cache with data just written, so the next load skips the re-read."""
+    global _cache_key, _cache_data
+    with _cache_lock:
+        _cache_key = key
+        _cache_data = _copy_registry(data)
+
+
+def write_registry_async(data: dict[str, dict[str, Any]]) -> Future:
+    """
+    Queue *data* for writing on the registry writer thread and return immediately.
+
+    The snapshot is visible to load_registry() straight away. The returned future
+    resolves once the write is durable (or carries the write error).
+    """
+    return _queue_write(data)[2]
+
+
+def _queue_write(
+    data: dict[str, dict[str, Any]],
+) -> tuple[int, Optional[dict[str, dict[str, Any]]], Future]:
+    """Make *data* the pending snapshot and queue its write; return (seq, previous, future)."""
+    global _pending, _pending_seq
+    snapshot = _copy_registry(_validate_registry_shape(data))
+    with _pending_lock:
+        _pending_seq += 1
+        seq = _pending_seq
+        previous, _pending = _pending, snapshot
+    return seq, previous, _writer.submit(_write_pending, seq, snapshot)
+
+
 def write_registry(data: dict[str, dict[str, Any]]) -> None:
+    """
+    Write *data* through the registry writer and block until it is durable.
+
+    On failure the caller is told and rolls back, so the snapshot is not kept
+    pending: the pending state from before the call is restored.
+    """
+    global _pending
+    seq, previous, future = _queue_write(data)
+    try:
+        future.result()
+    except Exception:
+        with _pending_lock:
+            # A snapshot queued on top of this one has taken over; leave it.
+            if _pending_seq == seq:
+                _pending = previous
+        raise
+
+
+def flush_registry_writes(timeout: Optional[float] = None) -> None:
+    """Block until all queued registry writes have completed."""
+    _writer.submit(lambda: None).result(timeout=timeout)
+
+
+def _write_pending(seq: int, snapshot: dict[str, dict[str, Any]]) -> None:
+    """
+    Write the newest queued snapshot, coalescing a burst of writes into one.
+
+    A snapshot queued after *seq* supersedes it, so that one is written instead;
+    the writes queued behind this one then find their data already on disk.
+    A failed write leaves its snapshot pending: readers keep seeing the state
+    already published from it, and the next queued write retries it.
+    write_registry() undoes that for its own, synchronous, failures.
+    """
+    global _pending, _written_seq
+    with _pending_lock:
+        if _written_seq >= seq:
+            return
+        if _pending is not None:
+            seq, snapshot = _pending_seq, _pending
+    try:
+        _write_registry_file(snapshot)
+    except Exception:
+        logger.exception("Registry write failed")
+        raise
+    with _pending_lock:
+        _written_seq = max(_written_seq, seq)
+        if _pending_seq == seq:
+            _pending = None
+
+
+def _write_registry_file(data: dict[str, dict[str, Any]]) -> None:
     """
     Atomic, durable write:
     - lock
@@ -112,10 +233,13 @@ def write_registry(data: dict[str, dict[str, Any]]) -> None:
             json.dump(cleaned, tf, indent=2, sort_keys=True)
             tf.flush()
             os.fsync(tf.fileno())
+            # Rename keeps inode, mtime and size, so this is the key the file will have.
+            st = os.fstat(tf.fileno())
             tmp_path = Path(tf.name)
 
         os.replace(tmp_path, registry_path)
         _fsync_dir(registry_path.parent)
+        _prime_cache((str(registry_path), st.st_ino, st.st_mtime_ns, st.st_size), cleaned)
         logger.debug("Registry write complete (atomic rename + fsync)")
 
         fcntl.flock(lockf.fileno(), fcntl.LOCK_UN)
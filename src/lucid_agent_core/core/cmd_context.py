@@ -6,15 +6,32 @@ Provides MQTT publishing, topic schema, and result payload shape: request_id, ok
 
 from __future__ import annotations
 
-import json
 import logging
 from dataclasses import dataclass
-from typing import Any, Optional, Protocol
+from json.encoder import encode_basestring_ascii
+from typing import Any, Iterable, Optional, Protocol
 
+from lucid_agent_core import _json
 from lucid_agent_core.mqtt_topics import TopicSchema
 
 logger = logging.getLogger(__name__)
 
+# Retained snapshots republished in response to commands (state, cfg, metadata) go out
+# at QoS 0. The broker only keeps the latest retained value and every later command
+# republishes it, so a lost packet is harmless. Command results stay at QoS 1.
+RETAINED_REPUBLISH_QOS = 0
+
+_OK_RESULT_PREFIX = b'{"request_id":'
+_OK_RESULT_SUFFIX = b',"ok":true,"error":null}'
+
+
+def ok_result_bytes(request_id: Any) -> bytes:
+    """Encode the success result {request_id, ok: true, error: null} from a byte template."""
+    if not isinstance(request_id, str):
+        return _json.dumps({"request_id": request_id, "ok": True, "error": None})
+    rid = encode_basestring_ascii(request_id).encode("ascii")
+    return _OK_RESULT_PREFIX + rid + _OK_RESULT_SUFFIX
+
 
 class MqttPublisher(Protocol):
     """Minimal MQTT publisher interface for command context."""
@@ -29,6 +46,10 @@ class ConfigStore(Protocol):
         """Return cached configuration."""
         ...
 
+    def peek_cached(self) -> dict[str, Any]:
+        """Return cached configuration without copying; read-only."""
+        ...
+
     def apply_set_general(self, payload: dict[str, Any]) -> tuple[dict[str, Any], dict[str, Any]]:
         """Apply general cfg changes (heartbeat_s)."""
         ...
@@ -50,7 +71,7 @@ class ComponentManager(Protocol):
     def start_component(self, component_id: str, registry: dict[str, dict]) -> bool: ...
 
 
-@dataclass
+@dataclass(slots=True)
 class CoreCommandContext:
     """
     Command execution context for core handlers.
@@ -63,20 +84,57 @@ class CoreCommandContext:
     agent_version: str
     config_store: ConfigStore
     component_manager: Optional[ComponentManager] = None
+    state_publisher: Optional[Any] = None
 
     def publish(
         self, topic: str, payload: dict[str, Any], *, retain: bool = False, qos: int = 1
     ) -> Any:
-        """Publish a dict payload to MQTT with JSON encoding."""
+        """Publish a dict payload to MQTT as compact JSON bytes."""
         try:
-            payload_str = json.dumps(payload)
+            payload_bytes = _json.dumps(payload)
         except (TypeError, ValueError) as exc:
             logger.error("Failed to JSON-encode payload for %s: %s", topic, exc)
             raise
-        result = self.mqtt.publish(topic, payload_str, qos=qos, retain=retain)
-        logger.debug("Published to %s (retain=%s qos=%d)", topic, retain, qos)
+        result = self.mqtt.publish(topic, payload_bytes, qos=qos, retain=retain)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Published to %s (retain=%s qos=%d)", topic, retain, qos)
         return result
 
+    def publish_bytes(
+        self, topic: str, payload: bytes, *, retain: bool = False, qos: int = 1
+    ) -> Any:
+        """Publish an already-encoded JSON payload to MQTT."""
+        result = self.mqtt.publish(topic, payload, qos=qos, retain=retain)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Published to %s (retain=%s qos=%d)", topic, retain, qos)
+        return result
+
+    def publish_dataclass(
+        self, topic: str, obj: Any, *, retain: bool = False, qos: int = 1
+    ) -> Any:
+        """Publish a dataclass instance as JSON without an intermediate asdict() copy."""
+        return self.publish_bytes(topic, _json.dumps(obj), retain=retain, qos=qos)
+
+    def publish_many(
+        self, messages: Iterable[tuple[str, dict[str, Any] | bytes, bool, int]]
+    ) -> list[Any]:
+        """
+        Publish several (topic, payload, retain, qos) messages back-to-back.
+
+        Payloads may be dicts or pre-encoded JSON bytes. Does not wait for
+        acknowledgements; paho delivers QoS 1 messages in order, so callers
+        that need confirmation can wait on the last handle.
+        """
+        publish = self.mqtt.publish
+        infos = []
+        for topic, payload, retain, qos in messages:
+            if not isinstance(payload, bytes):
+                payload = _json.dumps(payload)
+            infos.append(publish(topic, payload, qos=qos, retain=retain))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Published batch of %d messages", len(infos))
+        return infos
+
     def publish_result(
         self,
         action: str,
@@ -86,9 +144,12 @@ class CoreCommandContext:
     ) -> None:
         """Publish evt/<action>/result. Contract: request_id, ok, error."""
         topic = self.topics.evt_result(action)
-        payload = {"request_id": request_id, "ok": ok, "error": error}
         try:
-            self.publish(topic, payload, retain=False, qos=1)
+            if ok and error is None:
+                self.publish_bytes(topic, ok_result_bytes(request_id), retain=False, qos=1)
+            else:
+                payload = {"request_id": request_id, "ok": ok, "error": error}
+                self.publish(topic, payload, retain=False, qos=1)
             logger.debug("Result published: action=%s request_id=%s ok=%s", action, request_id, ok)
         except Exception as exc:
             logger.exception("Failed to publish result to %s: %s", topic, exc)
@@ -9,7 +9,6 @@ from __future__ import annotations
 import json
 import os
 import tempfile
-from datetime import datetime, timezone
 from pathlib import Path
 
 
@@ -22,11 +21,6 @@ def fsync_dir(path: Path) -> None:
         os.close(fd)
 
 
-def utc_iso() -> str:
-    """Return the current UTC time as an ISO8601 string."""
-    return datetime.now(timezone.utc).isoformat()
-
-
 def atomic_write(path: Path, cfg: dict) -> None:
     """
     Write *cfg* to *path* atomically using a temp file, fsync, and rename.
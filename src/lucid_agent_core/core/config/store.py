@@ -13,12 +13,13 @@ import logging
 from pathlib import Path
 from typing import Any, Optional
 
-from lucid_agent_core.core.config._file_io import atomic_write, utc_iso
+from lucid_agent_core.core.config._file_io import atomic_write
 from lucid_agent_core.core.config._validation import (
     CFG_GENERAL_KEYS,
     CFG_LOGGING_KEYS,
     validate,
 )
+from lucid_agent_core.core.timeutil import utc_iso
 from lucid_agent_core.paths import get_paths
 
 logger = logging.getLogger(__name__)
@@ -110,6 +111,15 @@ class ConfigStore:
             return {}
         return self._cache.copy()
 
+    def peek_cached(self) -> dict[str, Any]:
+        """
+        Return the cached config itself, without copying. The caller must not mutate it.
+
+        Safe because a cached dict is never modified once installed: apply_set_*
+        build a new dict and save() swaps it in.
+        """
+        return self._cache if self._cache is not None else {}
+
     # ------------------------------------------------------------------
     # Apply helpers
     # ------------------------------------------------------------------
@@ -163,10 +173,11 @@ class ConfigStore:
         if not ok:
             return current, {"request_id": request_id, "ok": False, "error": validate_error, "ts": ts}
 
-        try:
-            self.save(new_cfg)
-        except ConfigStoreError as exc:
-            return current, {"request_id": request_id, "ok": False, "error": str(exc), "ts": ts}
+        if new_cfg != current:
+            try:
+                self.save(new_cfg)
+            except ConfigStoreError as exc:
+                return current, {"request_id": request_id, "ok": False, "error": str(exc), "ts": ts}
 
         applied = {k: set_dict[k] for k in set_dict if k in allowed_keys}
         return new_cfg, {"request_id": request_id, "ok": True, "applied": applied, "ts": ts}
@@ -222,9 +233,10 @@ class ConfigStore:
         if not ok:
             return current, {"request_id": request_id, "ok": False, "error": validate_error, "ts": ts}
 
-        try:
-            self.save(new_cfg)
-        except ConfigStoreError as exc:
-            return current, {"request_id": request_id, "ok": False, "error": str(exc), "ts": ts}
+        if new_cfg != current:
+            try:
+                self.save(new_cfg)
+            except ConfigStoreError as exc:
+                return current, {"request_id": request_id, "ok": False, "error": str(exc), "ts": ts}
 
         return new_cfg, {"request_id": request_id, "ok": True, "applied": set_dict, "ts": ts}
@@ -3,8 +3,13 @@ Core command handlers for LUCID Agent Core — unified v1.0.0 contract.
 
 All on_* handler functions are re-exported here so call sites only need to
 import from this package rather than from individual handler modules.
+HANDLERS maps each agent command action (the topic suffix after cmd/) to its handler.
 """
 
+from typing import Callable
+
+from lucid_agent_core.core.cmd_context import CoreCommandContext
+
 from lucid_agent_core.core.handlers._dedup import _seen_request_ids
 from lucid_agent_core.core.handlers.config_handlers import (
     on_cfg_logging_set,
@@ -22,7 +27,28 @@ from lucid_agent_core.core.handlers.restart_handler import on_restart
 from lucid_agent_core.core.handlers.uninstall_handler import on_components_uninstall
 from lucid_agent_core.core.handlers.upgrade_handler import on_components_upgrade, on_core_upgrade
 
+HANDLERS: dict[str, Callable[[CoreCommandContext, str | bytes, dict | None], None]] = {
+    "ping": on_ping,
+    "restart": on_restart,
+    "refresh": on_refresh,
+    "cfg/set": on_cfg_set,
+    "cfg/logging/set": on_cfg_logging_set,
+    "cfg/telemetry/set": on_cfg_telemetry_set,
+    "components/install": on_components_install,
+    "components/uninstall": on_components_uninstall,
+    "components/enable": on_components_enable,
+    "components/disable": on_components_disable,
+    "components/upgrade": on_components_upgrade,
+    "core/upgrade": on_core_upgrade,
+}
+
+# Actions whose handlers only need the request_id and scan it from the raw payload;
+# the dispatcher does not pre-parse their payloads.
+RAW_PAYLOAD_ACTIONS = frozenset({"ping"})
+
 __all__ = [
+    "HANDLERS",
+    "RAW_PAYLOAD_ACTIONS",
     # Dedup state (exposed for test fixtures: handlers._seen_request_ids._seen.clear())
     "_seen_request_ids",
     # Handler functions
@@ -8,7 +8,8 @@ from __future__ import annotations
 
 import logging
 import threading
-from collections import deque
+from collections import OrderedDict, deque
+from typing import Any, Optional
 
 from lucid_agent_core.core.cmd_context import CoreCommandContext
 
@@ -16,6 +17,7 @@ logger = logging.getLogger(__name__)
 
 
 _MAX_SEEN = 10_000
+_MAX_RESULTS = 128
 
 
 class _SeenRequestIds:
@@ -47,12 +49,62 @@ class _SeenRequestIds:
             return False
 
 
+class _RecentResults:
+    """Thread-safe LRU of recently published results, keyed by request_id.
+
+    Lets a redelivered install/upgrade command (e.g. after a broker reconnect)
+    receive the original result again instead of a bare "duplicate" error,
+    without re-running the download, pip install, and restart cycle.
+    """
+
+    def __init__(self, maxsize: int = _MAX_RESULTS) -> None:
+        self._lock = threading.Lock()
+        self._maxsize = maxsize
+        self._results: OrderedDict[str, tuple[str, Any]] = OrderedDict()
+
+    def get(self, request_id: str) -> Optional[tuple[str, Any]]:
+        """Return (result_topic, payload) for *request_id*, or None if not cached."""
+        if not request_id:
+            return None
+        with self._lock:
+            entry = self._results.get(request_id)
+            if entry is not None:
+                self._results.move_to_end(request_id)
+            return entry
+
+    def put(self, request_id: str, result_topic: str, payload: Any) -> None:
+        """Remember the result published for *request_id*, evicting the oldest at capacity."""
+        if not request_id:
+            return
+        with self._lock:
+            self._results[request_id] = (result_topic, payload)
+            self._results.move_to_end(request_id)
+            while len(self._results) > self._maxsize:
+                self._results.popitem(last=False)
+
+
 _seen_request_ids = _SeenRequestIds()
+_recent_results = _RecentResults()
+
+
+def remember_result(request_id: str, result_topic: str, result: Any) -> None:
+    """Cache a published result dataclass so duplicate deliveries of *request_id* can be replayed."""
+    _recent_results.put(request_id, result_topic, result)
 
 
 def check_duplicate(ctx: CoreCommandContext, request_id: str, result_topic: str) -> bool:
-    """Return True and publish an error if *request_id* was already seen. Caller should return early."""
+    """Return True if *request_id* was already seen. Caller should return early.
+
+    Replays the cached result when one was remembered for *request_id*;
+    otherwise publishes a "duplicate request_id" error.
+    """
     if _seen_request_ids.check_and_add(request_id):
+        cached = _recent_results.get(request_id)
+        if cached is not None:
+            logger.info("Duplicate request_id=%s; replaying cached result", request_id)
+            cached_topic, cached_result = cached
+            ctx.publish_dataclass(cached_topic, cached_result, retain=False, qos=1)
+            return True
         logger.warning("Duplicate request_id=%s rejected", request_id)
         ctx.publish(
             result_topic,
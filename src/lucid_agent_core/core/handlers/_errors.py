@@ -0,0 +1,43 @@
+"""
+Shared error boundary for command handlers.
+
+Handlers decorated with with_error_publish() never raise: any unhandled
+exception is logged and reported on evt/<action>/result with ok=False.
+"""
+
+from __future__ import annotations
+
+import functools
+import logging
+from typing import Callable
+
+from lucid_agent_core.core.cmd_context import CoreCommandContext
+from lucid_agent_core.core.handlers._parsing import command_payload
+
+logger = logging.getLogger(__name__)
+
+Handler = Callable[[CoreCommandContext, str | bytes, dict | None], None]
+
+
+def with_error_publish(action: str) -> Callable[[Handler], Handler]:
+    """
+    Wrap a handler so unhandled exceptions publish an error result.
+
+    *action* is the result action path, e.g. "refresh" or "components/install".
+    """
+
+    def wrap(fn: Handler) -> Handler:
+        @functools.wraps(fn)
+        def inner(
+            ctx: CoreCommandContext, raw_payload: str | bytes, payload: dict | None = None
+        ) -> None:
+            try:
+                return fn(ctx, raw_payload, payload)
+            except Exception as exc:
+                logger.exception("Unhandled error in %s", fn.__name__)
+                rid = command_payload(raw_payload, payload).get("request_id", "")
+                ctx.publish_result(action, rid, ok=False, error=f"unhandled error: {exc}")
+
+        return inner
+
+    return wrap
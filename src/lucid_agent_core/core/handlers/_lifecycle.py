@@ -0,0 +1,101 @@
+"""
+Shared command flow for component install, uninstall, and upgrade.
+
+Each lifecycle command runs its handle_* function, publishes and remembers the
+result, refreshes retained state, and restarts the agent when the result
+requires it. Only the business function and a few hooks differ per command.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from typing import Any, Callable, Optional
+
+from lucid_agent_core.core.cmd_context import CoreCommandContext
+from lucid_agent_core.core.handlers._dedup import check_duplicate, remember_result
+from lucid_agent_core.core.handlers._errors import Handler, with_error_publish
+from lucid_agent_core.core.handlers._parsing import command_payload
+from lucid_agent_core.core.handlers.refresh_handler import invalidate_component_metadata
+from lucid_agent_core.core.restart import request_systemd_restart
+from lucid_agent_core.core.state_publisher import flush_state, publish_state
+
+logger = logging.getLogger(__name__)
+
+_RESTART_PUBLISH_TIMEOUT_S = 2.0
+
+
+def defer_restart(msg_info: Any, reason: str, label: str) -> threading.Thread:
+    """
+    Restart the agent from a background thread once *msg_info* is published.
+
+    Waiting for the result acknowledgement can take up to two seconds; doing it
+    off the command worker lets the commands queued behind this one proceed.
+    The restart is requested even if the publish is not confirmed.
+    """
+
+    def run() -> None:
+        try:
+            msg_info.wait_for_publish(timeout=_RESTART_PUBLISH_TIMEOUT_S)
+        except Exception as exc:
+            logger.warning("%s result not confirmed, proceeding with restart anyway: %s", label, exc)
+        request_systemd_restart(reason=reason)
+
+    thread = threading.Thread(target=run, name="agent-restart", daemon=True)
+    thread.start()
+    return thread
+
+
+def make_lifecycle_handler(
+    action: str,
+    handle: Callable[[str | bytes], Any],
+    *,
+    restart_reason: Callable[[Any], str],
+    after: Optional[Callable[[CoreCommandContext, Any], None]] = None,
+    doc: Optional[str] = None,
+) -> Handler:
+    """
+    Build the cmd handler for a component lifecycle *action* (e.g. "components/install").
+
+    *handle* maps the raw payload to a result dataclass with ok, component_id and
+    restart_required. *after* runs once the result and state are published, before
+    any restart; *restart_reason* labels the restart request.
+    """
+    topic_attr = "evt_" + action.replace("/", "_") + "_result"
+    label = action.replace("/", " ")
+
+    def handler(
+        ctx: CoreCommandContext, raw_payload: str | bytes, payload: dict | None = None
+    ) -> None:
+        rid = command_payload(raw_payload, payload).get("request_id", "")
+        result_topic = getattr(ctx.topics, topic_attr)
+        if check_duplicate(ctx, rid, result_topic):
+            return
+        result = handle(raw_payload)
+
+        msg_info = ctx.publish_dataclass(result_topic, result, retain=False, qos=1)
+        remember_result(rid, result_topic, result)
+
+        if result.ok:
+            invalidate_component_metadata(result.component_id)
+        publish_state(ctx, component_id=result.component_id)
+
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "%s result: ok=%s component=%s restart=%s",
+                label,
+                result.ok,
+                result.component_id,
+                result.restart_required,
+            )
+
+        if after is not None:
+            after(ctx, result)
+
+        if result.ok and result.restart_required:
+            flush_state(ctx)
+            defer_restart(msg_info, restart_reason(result), label)
+
+    handler.__name__ = handler.__qualname__ = "on_" + action.replace("/", "_")
+    handler.__doc__ = doc
+    return with_error_publish(action)(handler)
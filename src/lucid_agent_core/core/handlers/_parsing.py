@@ -6,21 +6,73 @@ Pure functions with no side effects — safe to import anywhere.
 
 from __future__ import annotations
 
-import json
+import re
+from types import MappingProxyType
+from typing import Any, Mapping
 
+from lucid_agent_core import _json
 
-def request_id(payload_str: str) -> str:
-    """Extract request_id from a JSON payload string, or return empty string."""
-    try:
-        payload = json.loads(payload_str) if payload_str else {}
-        return payload.get("request_id", "")
-    except json.JSONDecodeError:
-        return ""
+# Shared read-only result for empty or unparseable payloads; handlers only read from it.
+EMPTY_PAYLOAD: Mapping[str, Any] = MappingProxyType({})
+
+# A plain (escape-free) "request_id" string. search() matches at any depth; see
+# scan_request_id for the checks that keep the fast path to the top-level key.
+_RID_RE = re.compile(r'"request_id"\s*:\s*"([^"\\]*)"')
+_RID_BYTES_RE = re.compile(rb'"request_id"\s*:\s*"([^"\\]*)"')
 
 
-def parse_payload(payload_str: str) -> dict:
-    """Parse a JSON payload string into a dict, returning {} on any error."""
+def parse_payload(raw_payload: str | bytes) -> Mapping[str, Any]:
+    """Parse a JSON payload (str or bytes) into a dict, returning EMPTY_PAYLOAD on any error."""
+    if not raw_payload:
+        return EMPTY_PAYLOAD
     try:
-        return json.loads(payload_str) if payload_str else {}
-    except json.JSONDecodeError:
-        return {}
+        payload = _json.loads(raw_payload)
+    except _json.JSONDecodeError:
+        return EMPTY_PAYLOAD
+    return payload if isinstance(payload, dict) else EMPTY_PAYLOAD
+
+
+def command_payload(
+    raw_payload: str | bytes, payload: Mapping[str, Any] | None
+) -> Mapping[str, Any]:
+    """Return the dispatcher's pre-parsed *payload*, parsing *raw_payload* only when absent."""
+    return payload if payload is not None else parse_payload(raw_payload)
+
+
+# (key, object opener, array opener) for str and bytes payloads.
+_RID_TOKENS = ('"request_id"', "{", "[")
+_RID_BYTES_TOKENS = (b'"request_id"', b"{", b"[")
+
+
+def _is_sole_root_key(raw: Any, start: int, tokens: tuple[Any, Any, Any]) -> bool:
+    """True if the key matched at *start* is the root object's one and only request_id."""
+    key, brace, bracket = tokens
+    prefix = raw[:start]
+    # Only the root "{" may precede the key (a brace inside a string value just
+    # forces the slow path), and no later duplicate may override it.
+    return (
+        prefix.count(brace) == 1
+        and bracket not in prefix
+        and raw.find(key, start + len(key)) == -1
+    )
+
+
+def scan_request_id(raw_payload: str | bytes) -> str:
+    """
+    Return the payload's request_id, scanning for it before falling back to a full parse.
+
+    Meant for small fixed-schema commands such as ping, where the request_id
+    is the only field the handler needs. The scan is trusted only for a single
+    "request_id" key with no object or array opened before it, i.e. a key of
+    the root object; anything else falls back to the parse.
+    """
+    if isinstance(raw_payload, bytes):
+        match = _RID_BYTES_RE.search(raw_payload)
+        if match is not None and _is_sole_root_key(raw_payload, match.start(), _RID_BYTES_TOKENS):
+            return match.group(1).decode("utf-8", "replace")
+    else:
+        match = _RID_RE.search(raw_payload)
+        if match is not None and _is_sole_root_key(raw_payload, match.start(), _RID_TOKENS):
+            return match.group(1)
+    rid = parse_payload(raw_payload).get("request_id", "")
+    return rid if isinstance(rid, str) else ""
@@ -4,125 +4,117 @@ from __future__ import annotations
 
 import logging
 
-from lucid_agent_core.components.registry import load_registry, write_registry
-from lucid_agent_core.core.cmd_context import CoreCommandContext
+from lucid_agent_core.components.registry import load_registry, write_registry_async
+from lucid_agent_core.core.cmd_context import CoreCommandContext, ok_result_bytes
 from lucid_agent_core.core.handlers._dedup import check_duplicate
-from lucid_agent_core.core.handlers._parsing import parse_payload
-from lucid_agent_core.core.snapshots import build_components_list, build_state
+from lucid_agent_core.core.handlers._errors import with_error_publish
+from lucid_agent_core.core.handlers._parsing import command_payload
+from lucid_agent_core.core.state_publisher import publish_state
 
 logger = logging.getLogger(__name__)
 
 
-def on_components_enable(ctx: CoreCommandContext, payload_str: str) -> None:
+@with_error_publish("components/enable")
+def on_components_enable(
+    ctx: CoreCommandContext, raw_payload: str | bytes, payload: dict | None = None
+) -> None:
     """
     Handle cmd/components/enable → evt/components/enable/result.
 
     Sets enabled=True in registry, starts the component if loaded, republishes state.
     """
-    payload = parse_payload(payload_str)
+    payload = command_payload(raw_payload, payload)
     rid = payload.get("request_id", "")
     component_id = payload.get("component_id", "")
 
-    if check_duplicate(ctx, rid, ctx.topics.evt_components_result("enable")):
+    if check_duplicate(ctx, rid, ctx.topics.evt_components_enable_result):
         return
 
     if not component_id:
         ctx.publish_result_error(
-            ctx.topics.evt_components_result("enable"), rid, "component_id is required"
+            ctx.topics.evt_components_enable_result, rid, "component_id is required"
         )
         return
 
-    try:
-        registry = load_registry()
-        if component_id not in registry:
-            ctx.publish_result_error(
-                ctx.topics.evt_components_result("enable"),
-                rid,
-                f"component not found: {component_id}",
-            )
-            return
-
-        registry[component_id]["enabled"] = True
-        write_registry(registry)
-
-        started = False
-        if ctx.component_manager:
-            started = ctx.component_manager.start_component(component_id, registry)
-            if not started:
-                logger.warning(
-                    "Component %s enable: start_component returned False (component may not be loaded)",
-                    component_id,
-                )
-        else:
-            logger.warning("Component %s enable: component_manager not available", component_id)
-
-        components_list = build_components_list(registry)
-        ctx.publish(ctx.topics.state(), build_state(components_list), retain=True, qos=1)
-        ctx.publish(
-            ctx.topics.evt_components_result("enable"),
-            {"request_id": rid, "ok": True, "error": None},
-            retain=False,
-            qos=1,
-        )
-        logger.info("Component enabled: %s (started=%s)", component_id, started)
-
-    except Exception as exc:
-        logger.exception("Error enabling component")
+    registry = load_registry()
+    entry = registry.get(component_id)
+    if entry is None:
         ctx.publish_result_error(
-            ctx.topics.evt_components_result("enable"), rid, f"error: {exc}"
+            ctx.topics.evt_components_enable_result,
+            rid,
+            f"component not found: {component_id}",
         )
+        return
+
+    # Registry entries without an explicit flag are enabled (see build_component_entry).
+    changed = entry.get("enabled", True) is not True
+    if changed:
+        entry["enabled"] = True
+        write_registry_async(registry)
+
+    started = False
+    if ctx.component_manager:
+        started = ctx.component_manager.start_component(component_id, registry)
+        if not started:
+            logger.warning(
+                "Component %s enable: start_component returned False (component may not be loaded)",
+                component_id,
+            )
+    else:
+        logger.warning("Component %s enable: component_manager not available", component_id)
 
+    if changed:
+        publish_state(ctx, registry, component_id=component_id)
+    ctx.publish_bytes(
+        ctx.topics.evt_components_enable_result, ok_result_bytes(rid), retain=False, qos=1
+    )
+    logger.info("Component enabled: %s (started=%s)", component_id, started)
 
-def on_components_disable(ctx: CoreCommandContext, payload_str: str) -> None:
+
+@with_error_publish("components/disable")
+def on_components_disable(
+    ctx: CoreCommandContext, raw_payload: str | bytes, payload: dict | None = None
+) -> None:
     """
     Handle cmd/components/disable → evt/components/disable/result.
 
     Stops the component, sets enabled=False in registry, republishes state.
     """
-    payload = parse_payload(payload_str)
+    payload = command_payload(raw_payload, payload)
     rid = payload.get("request_id", "")
     component_id = payload.get("component_id", "")
 
-    if check_duplicate(ctx, rid, ctx.topics.evt_components_result("disable")):
+    if check_duplicate(ctx, rid, ctx.topics.evt_components_disable_result):
         return
 
     if not component_id:
         ctx.publish_result_error(
-            ctx.topics.evt_components_result("disable"), rid, "component_id is required"
+            ctx.topics.evt_components_disable_result, rid, "component_id is required"
         )
         return
 
-    try:
-        registry = load_registry()
-        if component_id not in registry:
-            ctx.publish_result_error(
-                ctx.topics.evt_components_result("disable"),
-                rid,
-                f"component not found: {component_id}",
-            )
-            return
-
-        stopped = False
-        if ctx.component_manager:
-            stopped = ctx.component_manager.stop_component(component_id)
-            if stopped:
-                logger.info("Stopped component: %s", component_id)
-
-        registry[component_id]["enabled"] = False
-        write_registry(registry)
-
-        components_list = build_components_list(registry)
-        ctx.publish(ctx.topics.state(), build_state(components_list), retain=True, qos=1)
-        ctx.publish(
-            ctx.topics.evt_components_result("disable"),
-            {"request_id": rid, "ok": True, "error": None},
-            retain=False,
-            qos=1,
-        )
-        logger.info("Component disabled: %s (stopped=%s)", component_id, stopped)
-
-    except Exception as exc:
-        logger.exception("Error disabling component")
+    registry = load_registry()
+    entry = registry.get(component_id)
+    if entry is None:
         ctx.publish_result_error(
-            ctx.topics.evt_components_result("disable"), rid, f"error: {exc}"
+            ctx.topics.evt_components_disable_result,
+            rid,
+            f"component not found: {component_id}",
         )
+        return
+
+    stopped = False
+    if ctx.component_manager:
+        stopped = ctx.component_manager.stop_component(component_id)
+        if stopped:
+            logger.info("Stopped component: %s", component_id)
+
+    changed = entry.get("enabled", True) is not False
+    if changed:
+        entry["enabled"] = False
+        write_registry_async(registry)
+        publish_state(ctx, registry, component_id=component_id)
+    ctx.publish_bytes(
+        ctx.topics.evt_components_disable_result, ok_result_bytes(rid), retain=False, qos=1
+    )
+    logger.info("Component disabled: %s (stopped=%s)", component_id, stopped)
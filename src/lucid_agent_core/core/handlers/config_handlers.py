@@ -4,75 +4,106 @@ from __future__ import annotations
 
 import logging
 
-from lucid_agent_core.core.cmd_context import CoreCommandContext
+from lucid_agent_core.core.cmd_context import RETAINED_REPUBLISH_QOS, CoreCommandContext
 from lucid_agent_core.core.handlers._dedup import check_duplicate
-from lucid_agent_core.core.handlers._parsing import parse_payload
+from lucid_agent_core.core.handlers._errors import with_error_publish
+from lucid_agent_core.core.handlers._parsing import command_payload
 from lucid_agent_core.core.log_config import apply_log_level
 from lucid_agent_core.core.snapshots import build_cfg, build_cfg_logging, build_cfg_telemetry
 
 logger = logging.getLogger(__name__)
 
 
-def on_cfg_set(ctx: CoreCommandContext, payload_str: str) -> None:
+@with_error_publish("cfg/set")
+def on_cfg_set(
+    ctx: CoreCommandContext, raw_payload: str | bytes, payload: dict | None = None
+) -> None:
     """Handle cmd/cfg/set — update general config and republish /cfg."""
-    payload = parse_payload(payload_str)
+    payload = command_payload(raw_payload, payload)
     rid = payload.get("request_id", "")
 
-    if check_duplicate(ctx, rid, ctx.topics.evt_result("cfg/set")):
+    if check_duplicate(ctx, rid, ctx.topics.evt_cfg_set_result):
         return
 
+    previous = ctx.config_store.get_cached()
     new_cfg, result = ctx.config_store.apply_set_general(payload)
     result["request_id"] = rid
 
     if result.get("ok"):
-        ctx.publish(ctx.topics.cfg(), build_cfg(new_cfg), retain=True, qos=1)
-        if "heartbeat_s" in new_cfg:
-            ctx.mqtt.set_heartbeat_interval(int(new_cfg["heartbeat_s"]))
-
-    ctx.publish(ctx.topics.evt_result("cfg/set"), result, retain=False, qos=1)
+        cfg_snapshot = build_cfg(new_cfg)
+        if new_cfg == previous or cfg_snapshot == build_cfg(previous):
+            logger.debug("cmd/cfg/set left /cfg unchanged; skipping retained publish")
+        else:
+            ctx.publish(ctx.topics.cfg_topic, cfg_snapshot, retain=True, qos=RETAINED_REPUBLISH_QOS)
+            if "heartbeat_s" in new_cfg:
+                ctx.mqtt.set_heartbeat_interval(int(new_cfg["heartbeat_s"]))
+
+    ctx.publish(ctx.topics.evt_cfg_set_result, result, retain=False, qos=1)
     if result.get("ok"):
         logger.info("Config updated via cmd/cfg/set")
     else:
         logger.warning("Config set failed: %s", result.get("error"))
 
 
-def on_cfg_logging_set(ctx: CoreCommandContext, payload_str: str) -> None:
+@with_error_publish("cfg/logging/set")
+def on_cfg_logging_set(
+    ctx: CoreCommandContext, raw_payload: str | bytes, payload: dict | None = None
+) -> None:
     """Handle cmd/cfg/logging/set — update log level and republish /cfg/logging."""
-    payload = parse_payload(payload_str)
+    payload = command_payload(raw_payload, payload)
     rid = payload.get("request_id", "")
 
-    if check_duplicate(ctx, rid, ctx.topics.evt_result("cfg/logging/set")):
+    if check_duplicate(ctx, rid, ctx.topics.evt_cfg_logging_set_result):
         return
 
+    previous = ctx.config_store.get_cached()
     new_cfg, result = ctx.config_store.apply_set_logging(payload)
     result["request_id"] = rid
 
-    if result.get("ok"):
+    if result.get("ok") and new_cfg == previous:
+        logger.debug("cmd/cfg/logging/set left config unchanged; skipping retained publish")
+    elif result.get("ok"):
         apply_log_level(new_cfg)
-        ctx.publish(ctx.topics.cfg_logging(), build_cfg_logging(new_cfg), retain=True, qos=1)
-
-    ctx.publish(ctx.topics.evt_result("cfg/logging/set"), result, retain=False, qos=1)
+        ctx.publish(
+            ctx.topics.cfg_logging_topic,
+            build_cfg_logging(new_cfg),
+            retain=True,
+            qos=RETAINED_REPUBLISH_QOS,
+        )
+
+    ctx.publish(ctx.topics.evt_cfg_logging_set_result, result, retain=False, qos=1)
     if result.get("ok"):
         logger.info("Config updated via cmd/cfg/logging/set")
     else:
         logger.warning("Config logging set failed: %s", result.get("error"))
 
 
-def on_cfg_telemetry_set(ctx: CoreCommandContext, payload_str: str) -> None:
+@with_error_publish("cfg/telemetry/set")
+def on_cfg_telemetry_set(
+    ctx: CoreCommandContext, raw_payload: str | bytes, payload: dict | None = None
+) -> None:
     """Handle cmd/cfg/telemetry/set — update telemetry config and republish /cfg/telemetry."""
-    payload = parse_payload(payload_str)
+    payload = command_payload(raw_payload, payload)
     rid = payload.get("request_id", "")
 
-    if check_duplicate(ctx, rid, ctx.topics.evt_result("cfg/telemetry/set")):
+    if check_duplicate(ctx, rid, ctx.topics.evt_cfg_telemetry_set_result):
         return
 
+    previous = ctx.config_store.get_cached()
     new_cfg, result = ctx.config_store.apply_set_telemetry(payload)
     result["request_id"] = rid
 
-    if result.get("ok"):
-        ctx.publish(ctx.topics.cfg_telemetry(), build_cfg_telemetry(new_cfg), retain=True, qos=1)
-
-    ctx.publish(ctx.topics.evt_result("cfg/telemetry/set"), result, retain=False, qos=1)
+    if result.get("ok") and new_cfg == previous:
+        logger.debug("cmd/cfg/telemetry/set left config unchanged; skipping retained publish")
+    elif result.get("ok"):
+        ctx.publish(
+            ctx.topics.cfg_telemetry_topic,
+            build_cfg_telemetry(new_cfg),
+            retain=True,
+            qos=RETAINED_REPUBLISH_QOS,
+        )
+
+    ctx.publish(ctx.topics.evt_cfg_telemetry_set_result, result, retain=False, qos=1)
     if result.get("ok"):
         logger.info("Config updated via cmd/cfg/telemetry/set")
     else:
@@ -4,18 +4,30 @@ from __future__ import annotations
 
 import logging
 
-from lucid_agent_core.core.cmd_context import CoreCommandContext
+from lucid_agent_core.core.cmd_context import CoreCommandContext, ok_result_bytes
 from lucid_agent_core.core.handlers._dedup import check_duplicate
-from lucid_agent_core.core.handlers._parsing import request_id
+from lucid_agent_core.core.handlers._errors import with_error_publish
+from lucid_agent_core.core.handlers._parsing import scan_request_id
 
 logger = logging.getLogger(__name__)
 
+# Pings are liveness probes: a lost result just looks like a timeout and the caller
+# pings again, so the broker acknowledgement round trip is not worth waiting for.
+_PING_RESULT_QOS = 0
 
-def on_ping(ctx: CoreCommandContext, payload_str: str) -> None:
+
+@with_error_publish("ping")
+def on_ping(
+    ctx: CoreCommandContext, raw_payload: str | bytes, payload: dict | None = None
+) -> None:
     """Handle cmd/ping → evt/ping/result."""
-    rid = request_id(payload_str)
-    logger.debug("cmd/ping received request_id=%s", rid)
-    if check_duplicate(ctx, rid, ctx.topics.evt_result("ping")):
+    rid = payload.get("request_id", "") if payload is not None else scan_request_id(raw_payload)
+    debug = logger.isEnabledFor(logging.DEBUG)
+    if debug:
+        logger.debug("cmd/ping received request_id=%s", rid)
+    topic = ctx.topics.evt_ping_result
+    if check_duplicate(ctx, rid, topic):
         return
-    ctx.publish_result("ping", rid, ok=True, error=None)
-    logger.debug("Ping result published for request_id=%s", rid)
+    ctx.publish_bytes(topic, ok_result_bytes(rid), retain=False, qos=_PING_RESULT_QOS)
+    if debug:
+        logger.debug("Ping result published for request_id=%s", rid)
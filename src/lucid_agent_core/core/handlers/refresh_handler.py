@@ -3,11 +3,16 @@
 from __future__ import annotations
 
 import logging
+import threading
+import weakref
+from typing import Any
 
+from lucid_agent_core import _json
 from lucid_agent_core.components.registry import load_registry
-from lucid_agent_core.core.cmd_context import CoreCommandContext
+from lucid_agent_core.core.cmd_context import RETAINED_REPUBLISH_QOS, CoreCommandContext
 from lucid_agent_core.core.handlers._dedup import check_duplicate
-from lucid_agent_core.core.handlers._parsing import request_id
+from lucid_agent_core.core.handlers._errors import with_error_publish
+from lucid_agent_core.core.handlers._parsing import command_payload
 from lucid_agent_core.core.snapshots import (
     build_cfg,
     build_cfg_logging,
@@ -16,59 +21,154 @@ from lucid_agent_core.core.snapshots import (
     build_metadata,
     build_state,
 )
+from lucid_agent_core.core.state_publisher import forget_published_state
 
 logger = logging.getLogger(__name__)
 
 
+# Upper bound on waiting for the component metadata batch before acknowledging a refresh.
+_METADATA_PUBLISH_TIMEOUT_S = 2.0
+
+# Both caches are filled from command worker threads; _CACHE_LOCK guards every access.
+_CACHE_LOCK = threading.Lock()
+
+# (component_id, version) -> (capabilities, encoded metadata payload)
+_META_CACHE: dict[tuple[str, str], tuple[Any, bytes]] = {}
+
+# component instance -> capabilities. Weakly keyed so a stopped or reloaded component
+# is not kept alive by the cache; a new instance always misses.
+_CAPS_CACHE: weakref.WeakKeyDictionary[Any, Any] = weakref.WeakKeyDictionary()
+
+
+def invalidate_component_metadata(component_id: str) -> None:
+    """Drop cached metadata payloads for *component_id* (after install/upgrade/uninstall)."""
+    with _CACHE_LOCK:
+        for key in [k for k in _META_CACHE if k[0] == component_id]:
+            del _META_CACHE[key]
+
+
+def _component_capabilities(ctx: CoreCommandContext, component_id: str) -> Any:
+    if not ctx.component_manager:
+        return []
+    comp = ctx.component_manager.get_component(component_id)
+    if not comp:
+        return []
+    try:
+        with _CACHE_LOCK:
+            return _CAPS_CACHE[comp]
+    except (KeyError, TypeError):
+        pass
+    capabilities: Any = []
+    if hasattr(comp, "capabilities") and callable(comp.capabilities):
+        capabilities = comp.capabilities()
+    try:
+        with _CACHE_LOCK:
+            _CAPS_CACHE[comp] = capabilities
+    except TypeError:
+        # Unhashable or not weak-referenceable instance; skip caching.
+        pass
+    return capabilities
+
+
+def _component_metadata(ctx: CoreCommandContext, component_id: str, version: str) -> bytes:
+    """Return the encoded retained metadata payload for one component."""
+    capabilities = _component_capabilities(ctx, component_id)
+
+    key = (component_id, version)
+    with _CACHE_LOCK:
+        cached = _META_CACHE.get(key)
+    if cached is not None and cached[0] == capabilities:
+        return cached[1]
+
+    payload = _json.dumps(
+        {"component_id": component_id, "version": version, "capabilities": capabilities}
+    )
+    with _CACHE_LOCK:
+        _META_CACHE[key] = (capabilities, payload)
+    return payload
+
+
 def _publish_component_metadata(
     ctx: CoreCommandContext, component_id: str, version: str
 ) -> None:
     """Publish retained metadata for one component."""
-    meta: dict = {"component_id": component_id, "version": version, "capabilities": []}
-    if ctx.component_manager:
-        comp = ctx.component_manager.get_component(component_id)
-        if comp and hasattr(comp, "capabilities") and callable(comp.capabilities):
-            meta["capabilities"] = comp.capabilities()
     try:
-        ctx.publish(ctx.topics.component_metadata(component_id), meta, retain=True, qos=1)
+        payload = _component_metadata(ctx, component_id, version)
+        ctx.publish_bytes(
+            ctx.topics.component_metadata(component_id),
+            payload,
+            retain=True,
+            qos=RETAINED_REPUBLISH_QOS,
+        )
     except Exception as exc:
         logger.warning("Failed to publish component metadata for %s: %s", component_id, exc)
 
 
-def on_refresh(ctx: CoreCommandContext, payload_str: str) -> None:
+@with_error_publish("refresh")
+def on_refresh(
+    ctx: CoreCommandContext, raw_payload: str | bytes, payload: dict | None = None
+) -> None:
     """
     Handle cmd/refresh → evt/refresh/result.
 
     Republishes all retained topics and each component's metadata.
     """
-    rid = request_id(payload_str)
-    if check_duplicate(ctx, rid, ctx.topics.evt_result("refresh")):
+    rid = command_payload(raw_payload, payload).get("request_id", "")
+    if check_duplicate(ctx, rid, ctx.topics.evt_refresh_result):
         return
-    try:
-        registry = load_registry()
-        components_list = build_components_list(registry)
-
-        if hasattr(ctx.mqtt, "publish_retained_refresh"):
-            ctx.mqtt.publish_retained_refresh(components_list)
-        else:
-            state = build_state(components_list)
-            ctx.publish(
-                ctx.topics.metadata(),
-                build_metadata(ctx.agent_version),
-                retain=True,
-                qos=1,
-            )
-            ctx.publish(ctx.topics.state(), state, retain=True, qos=1)
-            raw_cfg = ctx.config_store.get_cached()
-            ctx.publish(ctx.topics.cfg(), build_cfg(raw_cfg), retain=True, qos=1)
-            ctx.publish(ctx.topics.cfg_logging(), build_cfg_logging(raw_cfg), retain=True, qos=1)
-            ctx.publish(ctx.topics.cfg_telemetry(), build_cfg_telemetry(raw_cfg), retain=True, qos=1)
+    registry = load_registry()
+    components_list = build_components_list(registry)
 
-        for cid, meta in registry.items():
-            _publish_component_metadata(ctx, cid, meta.get("version", "?"))
+    if hasattr(ctx.mqtt, "publish_retained_refresh"):
+        ctx.mqtt.publish_retained_refresh(components_list)
+    else:
+        state = build_state(components_list)
+        ctx.publish(
+            ctx.topics.metadata_topic,
+            build_metadata(ctx.agent_version),
+            retain=True,
+            qos=RETAINED_REPUBLISH_QOS,
+        )
+        ctx.publish(ctx.topics.state_topic, state, retain=True, qos=RETAINED_REPUBLISH_QOS)
+        raw_cfg = ctx.config_store.get_cached()
+        ctx.publish(
+            ctx.topics.cfg_topic, build_cfg(raw_cfg), retain=True, qos=RETAINED_REPUBLISH_QOS
+        )
+        ctx.publish(
+            ctx.topics.cfg_logging_topic,
+            build_cfg_logging(raw_cfg),
+            retain=True,
+            qos=RETAINED_REPUBLISH_QOS,
+        )
+        ctx.publish(
+            ctx.topics.cfg_telemetry_topic,
+            build_cfg_telemetry(raw_cfg),
+            retain=True,
+            qos=RETAINED_REPUBLISH_QOS,
+        )
+    # State was written from the registry, bypassing the coalescing publisher.
+    forget_published_state(ctx)
 
-        ctx.publish_result("refresh", rid, ok=True, error=None)
-        logger.info("Refresh completed for request_id=%s", rid)
-    except Exception as exc:
-        logger.exception("Refresh failed: %s", exc)
-        ctx.publish_result("refresh", rid, ok=False, error=str(exc))
+    messages = []
+    for cid, meta in registry.items():
+        try:
+            messages.append(
+                (
+                    ctx.topics.component_metadata(cid),
+                    _component_metadata(ctx, cid, meta.get("version", "?")),
+                    True,
+                    RETAINED_REPUBLISH_QOS,
+                )
+            )
+        except Exception as exc:
+            logger.warning("Failed to publish component metadata for %s: %s", cid, exc)
+    if messages:
+        try:
+            infos = ctx.publish_many(messages)
+            # Messages leave in order, so the last handle covers the whole batch.
+            infos[-1].wait_for_publish(timeout=_METADATA_PUBLISH_TIMEOUT_S)
+        except Exception as exc:
+            logger.warning("Failed to publish component metadata: %s", exc)
+
+    ctx.publish_result("refresh", rid, ok=True, error=None)
+    logger.info("Refresh completed for request_id=%s", rid)
@@ -6,17 +6,21 @@ import logging
 
 from lucid_agent_core.core.cmd_context import CoreCommandContext
 from lucid_agent_core.core.handlers._dedup import check_duplicate
-from lucid_agent_core.core.handlers._parsing import request_id
+from lucid_agent_core.core.handlers._errors import with_error_publish
+from lucid_agent_core.core.handlers._parsing import command_payload
 from lucid_agent_core.core.restart import request_systemd_restart
 
 logger = logging.getLogger(__name__)
 
 
-def on_restart(ctx: CoreCommandContext, payload_str: str) -> None:
+@with_error_publish("restart")
+def on_restart(
+    ctx: CoreCommandContext, raw_payload: str | bytes, payload: dict | None = None
+) -> None:
     """Handle cmd/restart → evt/restart/result; then request process restart."""
-    rid = request_id(payload_str)
+    rid = command_payload(raw_payload, payload).get("request_id", "")
     logger.info("cmd/restart received request_id=%s", rid)
-    if check_duplicate(ctx, rid, ctx.topics.evt_result("restart")):
+    if check_duplicate(ctx, rid, ctx.topics.evt_restart_result):
         return
     ok = request_systemd_restart(reason="cmd/restart")
     ctx.publish_result("restart", rid, ok=ok, error=None if ok else "restart not available")
@@ -3,100 +3,60 @@
 from __future__ import annotations
 
 import logging
-from dataclasses import asdict
 
-from lucid_agent_core.components.registry import load_registry
 from lucid_agent_core.core.cmd_context import CoreCommandContext
-from lucid_agent_core.core.handlers._dedup import check_duplicate
-from lucid_agent_core.core.handlers._parsing import parse_payload, request_id
+from lucid_agent_core.core.handlers._dedup import check_duplicate, remember_result
+from lucid_agent_core.core.handlers._errors import with_error_publish
+from lucid_agent_core.core.handlers._lifecycle import defer_restart, make_lifecycle_handler
+from lucid_agent_core.core.handlers._parsing import command_payload
 from lucid_agent_core.core.handlers.refresh_handler import _publish_component_metadata
-from lucid_agent_core.core.restart import request_systemd_restart
-from lucid_agent_core.core.snapshots import build_components_list, build_state
 from lucid_agent_core.core.upgrade import handle_component_upgrade, handle_core_upgrade
+from lucid_agent_core.core.upgrade.component_upgrader import ComponentUpgradeResult
 
 logger = logging.getLogger(__name__)
 
 
-def on_components_upgrade(ctx: CoreCommandContext, payload_str: str) -> None:
-    """
-    Handle cmd/components/upgrade → evt/components/upgrade/result.
+def _after_component_upgrade(ctx: CoreCommandContext, result: ComponentUpgradeResult) -> None:
+    if result.ok:
+        _publish_component_metadata(ctx, result.component_id, result.version)
+        logger.info("Republished component metadata with version %s", result.version)
 
-    Downloads wheel, verifies SHA256, upgrades venv, updates registry, then restarts.
-    """
-    rid = request_id(payload_str)
-    if check_duplicate(ctx, rid, ctx.topics.evt_components_result("upgrade")):
-        return
-    try:
-        result = handle_component_upgrade(payload_str)
-        result_dict = asdict(result)
 
-        msg_info = ctx.publish(
-            ctx.topics.evt_components_result("upgrade"), result_dict, retain=False, qos=1
-        )
-
-        registry = load_registry()
-        if result.ok:
-            registry[result.component_id] = registry.get(result.component_id, {})
-            registry[result.component_id]["version"] = result.version
-        components_list = build_components_list(registry)
-        ctx.publish(ctx.topics.state(), build_state(components_list), retain=True, qos=1)
-
-        if result.ok:
-            _publish_component_metadata(ctx, result.component_id, result.version)
-            logger.info("Republished component metadata with version %s", result.version)
-
-        logger.info(
-            "Component upgrade result: ok=%s component=%s version=%s restart=%s",
-            result.ok,
-            result.component_id,
-            result.version,
-            result.restart_required,
-        )
-
-        if result.ok and result.restart_required:
-            try:
-                msg_info.wait_for_publish(timeout=2.0)
-                logger.info("Component upgrade result published successfully")
-            except Exception as exc:
-                logger.warning(
-                    "wait_for_publish timed out for component upgrade result, "
-                    "proceeding with restart anyway: %s", exc,
-                )
-            logger.info(
-                "Requesting restart after component upgrade: %s to %s",
-                result.component_id, result.version,
-            )
-            request_systemd_restart(
-                reason=f"component upgrade: {result.component_id} to {result.version}"
-            )
+on_components_upgrade = make_lifecycle_handler(
+    "components/upgrade",
+    handle_component_upgrade,
+    restart_reason=lambda result: (
+        f"component upgrade: {result.component_id} to {result.version}"
+    ),
+    after=_after_component_upgrade,
+    doc="""
+    Handle cmd/components/upgrade → evt/components/upgrade/result.
 
-    except Exception as exc:
-        logger.exception("Unhandled error in on_components_upgrade")
-        payload = parse_payload(payload_str)
-        ctx.publish_result_error(
-            ctx.topics.evt_components_result("upgrade"),
-            payload.get("request_id", ""),
-            f"unhandled error: {exc}",
-        )
+    Downloads wheel, verifies SHA256, upgrades venv, updates registry, then restarts.
+    """,
+)
 
 
-def on_core_upgrade(ctx: CoreCommandContext, payload_str: str) -> None:
+@with_error_publish("core/upgrade")
+def on_core_upgrade(
+    ctx: CoreCommandContext, raw_payload: str | bytes, payload: dict | None = None
+) -> None:
     """
     Handle cmd/core/upgrade → evt/core/upgrade/result.
 
     Downloads wheel, verifies SHA256, upgrades venv, then restarts.
     """
-    rid = request_id(payload_str)
-    if check_duplicate(ctx, rid, ctx.topics.evt_result("core/upgrade")):
+    rid = command_payload(raw_payload, payload).get("request_id", "")
+    if check_duplicate(ctx, rid, ctx.topics.evt_core_upgrade_result):
         return
-    try:
-        result = handle_core_upgrade(payload_str)
-        result_dict = asdict(result)
+    result = handle_core_upgrade(raw_payload)
 
-        msg_info = ctx.publish(
-            ctx.topics.evt_result("core/upgrade"), result_dict, retain=False, qos=1
-        )
+    msg_info = ctx.publish_dataclass(
+        ctx.topics.evt_core_upgrade_result, result, retain=False, qos=1
+    )
+    remember_result(rid, ctx.topics.evt_core_upgrade_result, result)
 
+    if logger.isEnabledFor(logging.INFO):
         logger.info(
             "Core upgrade result: ok=%s version=%s restart=%s",
             result.ok,
@@ -104,23 +64,6 @@ def on_core_upgrade(ctx: CoreCommandContext, payload_str: str) -> None:
             result.restart_required,
         )
 
-        if result.ok and result.restart_required:
-            try:
-                msg_info.wait_for_publish(timeout=2.0)
-                logger.info("Core upgrade result published successfully")
-            except Exception as exc:
-                logger.warning(
-                    "wait_for_publish timed out for core upgrade result, "
-                    "proceeding with restart anyway: %s", exc,
-                )
-            logger.info("Requesting restart after core upgrade to %s", result.version)
-            request_systemd_restart(reason=f"core upgrade: {result.version}")
-
-    except Exception as exc:
-        logger.exception("Unhandled error in on_core_upgrade")
-        payload = parse_payload(payload_str)
-        ctx.publish_result_error(
-            ctx.topics.evt_result("core/upgrade"),
-            payload.get("request_id", ""),
-            f"unhandled error: {exc}",
-        )
+    if result.ok and result.restart_required:
+        logger.info("Requesting restart after core upgrade to %s", result.version)
+        defer_restart(msg_info, f"core upgrade: {result.version}", "core upgrade")
@@ -15,11 +15,29 @@ from lucid_agent_core.core.config._validation import DEFAULT_LOG_LEVEL
 
 _DEFAULT_INT = getattr(logging, DEFAULT_LOG_LEVEL)
 
+# Standard level names, resolved without a getattr on the logging module.
+_LEVELS = {
+    "CRITICAL": logging.CRITICAL,
+    "FATAL": logging.FATAL,
+    "ERROR": logging.ERROR,
+    "WARNING": logging.WARNING,
+    "WARN": logging.WARN,
+    "INFO": logging.INFO,
+    "DEBUG": logging.DEBUG,
+    "NOTSET": logging.NOTSET,
+}
+
 
 def _parse_level(raw: str) -> int:
+    level = _LEVELS.get(raw)
+    if level is not None:
+        return level
     if not raw or not str(raw).strip():
         return _DEFAULT_INT
     raw = str(raw).strip().upper()
+    level = _LEVELS.get(raw)
+    if level is not None:
+        return level
     if raw.isdigit():
         return int(raw)
     return int(getattr(logging, raw, _DEFAULT_INT))
@@ -42,5 +60,7 @@ def apply_log_level(cfg: dict[str, Any] | None) -> logging.Logger:
     """
     level = level_from_cfg_or_env(cfg)
     root = logging.getLogger()
-    root.setLevel(level)
+    # setLevel clears every logger's isEnabledFor cache; skip it when nothing changes.
+    if root.level != level:
+        root.setLevel(level)
     return root
@@ -2,19 +2,27 @@
 MQTT logging handler for core agent.
 
 Publishes log messages to MQTT /logs topic with rate limiting to prevent flooding.
+MQTTLogQueueHandler sits on the root logger in front of it, so application threads
+only enqueue records and batching and publishing run on a listener thread.
 """
 
 from __future__ import annotations
 
+import copy
 import json
 import logging
+import queue
 import sys
 import threading
 import time
 import traceback
-from datetime import datetime, timezone
+from collections import deque
+from logging.handlers import QueueHandler, QueueListener
 from typing import Any, Optional
 
+from lucid_agent_core import _json
+from lucid_agent_core.core.timeutil import utc_iso_from_epoch
+
 logger = logging.getLogger(__name__)
 
 # Batching and rate limiting configuration
@@ -23,6 +31,24 @@ BATCH_INTERVAL_S = 0.25  # Publish batch every 0.25 seconds if not full
 MAX_BATCHES_PER_WINDOW = 25  # Max batches per time window
 TIME_WINDOW_S = 2.0  # 2 second window for rate limiting
 
+# Python level -> /logs level; custom levels map to "info".
+_LEVEL_TO_MQTT = {
+    logging.DEBUG: "debug",
+    logging.INFO: "info",
+    logging.WARNING: "warning",
+    logging.ERROR: "error",
+    logging.CRITICAL: "error",
+}
+
+
+def _encode_batch(payload: dict[str, Any]) -> bytes:
+    try:
+        return _json.dumps(payload)
+    except TypeError:
+        # orjson rejects lone surrogates (e.g. surrogate-escaped file names in a
+        # message); the stdlib escapes them, so one odd line does not drop the batch.
+        return json.dumps(payload, separators=(",", ":")).encode("ascii")
+
 
 class MQTTLogHandler(logging.Handler):
     """
@@ -45,37 +71,29 @@ class MQTTLogHandler(logging.Handler):
         super().__init__()
         self.mqtt_client = mqtt_client
         self.topic = topic
+        # Bound once; the agent client swaps its paho client internally on reconnect.
+        self._is_connected = mqtt_client.is_connected
+        self._publish = mqtt_client.publish
 
         # Batching state
         self._lock = threading.Lock()
         self._buffer: list[dict[str, Any]] = []  # List of structured log line dicts
-        self._last_publish_ts = time.time()
+        # Rate-limit bookkeeping uses time.monotonic(); only deltas matter
+        self._last_publish_ts = time.monotonic()
         self._batch_timer: Optional[threading.Timer] = None
 
         # Rate limiting state
-        self._batch_timestamps: list[float] = []  # Timestamps of published batches
+        # Timestamps of the last MAX_BATCHES_PER_WINDOW published batches
+        self._batch_timestamps: deque[float] = deque(maxlen=MAX_BATCHES_PER_WINDOW)
         self._dropped_count = 0
-        self._last_warning_ts = 0.0
-
-    @staticmethod
-    def _level_to_mqtt(levelno: int) -> str:
-        level_map = {
-            logging.DEBUG: "debug",
-            logging.INFO: "info",
-            logging.WARNING: "warning",
-            logging.ERROR: "error",
-            logging.CRITICAL: "error",
-        }
-        return level_map.get(levelno, "info")
-
-    @staticmethod
-    def _utc_iso_from_epoch(ts: float) -> str:
-        return datetime.fromtimestamp(ts, timezone.utc).isoformat()
+        self._last_warning_ts = float("-inf")
 
     def _build_line(self, record: logging.LogRecord) -> dict[str, Any]:
+        # Each line is kept in the buffer until its batch is encoded, so it is
+        # built as a single dict literal rather than reused.
         line: dict[str, Any] = {
-            "ts": self._utc_iso_from_epoch(record.created),
-            "level": self._level_to_mqtt(record.levelno),
+            "ts": utc_iso_from_epoch(record.created),
+            "level": _LEVEL_TO_MQTT.get(record.levelno, "info"),
             "logger": record.name,
             "message": record.getMessage(),
         }
@@ -155,11 +173,10 @@ class MQTTLogHandler(logging.Handler):
             return
 
         # Check rate limit
-        now = time.time()
-        cutoff = now - TIME_WINDOW_S
-        self._batch_timestamps = [ts for ts in self._batch_timestamps if ts > cutoff]
-
-        if len(self._batch_timestamps) >= MAX_BATCHES_PER_WINDOW:
+        # The window is full when even the oldest of the last N batches is inside it.
+        now = time.monotonic()
+        timestamps = self._batch_timestamps
+        if len(timestamps) == MAX_BATCHES_PER_WINDOW and timestamps[0] > now - TIME_WINDOW_S:
             # Rate limit exceeded - drop oldest entries from buffer
             dropped = len(self._buffer)
             self._buffer = []
@@ -169,9 +186,8 @@ class MQTTLogHandler(logging.Handler):
             self._warn_rate_limit_drop(now)
             return
 
-        # Copy buffer and clear it
-        batch = list(self._buffer)
-        self._buffer = []
+        # Take the buffer; a fresh list collects the next batch
+        batch, self._buffer = self._buffer, []
         self._last_publish_ts = now
 
         # Cancel timer if it's running
@@ -179,8 +195,8 @@ class MQTTLogHandler(logging.Handler):
             self._batch_timer.cancel()
             self._batch_timer = None
 
-        # Record this batch publish
-        self._batch_timestamps.append(now)
+        # Record this batch publish (the bounded deque evicts the oldest)
+        timestamps.append(now)
 
         # Publish batch
         payload = {
@@ -188,12 +204,13 @@ class MQTTLogHandler(logging.Handler):
             "lines": batch,
         }
 
-        # Only publish if client is connected
-        if self.mqtt_client and self.mqtt_client.is_connected():
+        # Only publish if client is connected. Logs are QoS 0 best-effort: the
+        # returned MQTTMessageInfo is never waited on.
+        if self._is_connected():
             try:
-                self.mqtt_client.publish(
+                self._publish(
                     self.topic,
-                    json.dumps(payload),
+                    _encode_batch(payload),
                     qos=0,
                     retain=False,
                 )
@@ -208,3 +225,39 @@ class MQTTLogHandler(logging.Handler):
                     )
                 except Exception:
                     pass
+
+
+class MQTTLogQueueHandler(QueueHandler):
+    """
+    Queue front end for an MQTTLogHandler.
+
+    Records are enqueued on the logging thread and handed to *target* by a
+    QueueListener thread; call start() after adding it to a logger.
+    """
+
+    def __init__(self, target: MQTTLogHandler) -> None:
+        super().__init__(queue.SimpleQueue())
+        self.target = target
+        self.topic = target.topic
+        self._listener = QueueListener(self.queue, target, respect_handler_level=True)
+        self._started = False
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Resolve the message now, since args may be mutated once the call returns.
+        # exc_info is kept so the target formats the traceback on the listener thread.
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+    def start(self) -> None:
+        if not self._started:
+            self._listener.start()
+            self._started = True
+
+    def close(self) -> None:
+        """Drain queued records through the target, then stop the listener."""
+        if self._started:
+            self._started = False
+            self._listener.stop()
+        super().close()
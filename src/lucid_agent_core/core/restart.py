@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+import functools
 import logging
 import os
 import signal
 import sys
 import time
 from pathlib import Path
+from typing import Optional
 
 from lucid_agent_core.paths import get_paths
 
@@ -15,10 +17,13 @@ logger = logging.getLogger(__name__)
 _RESTART_DEBOUNCE_S = 10
 
 
+@functools.lru_cache(maxsize=1)
 def _is_managed() -> bool:
     """
     Best-effort check: running under a service manager (systemd or launchd).
 
+    Evaluated once; the environment and parent process do not change after start.
+
     Detects:
     - systemd: INVOCATION_ID env var or /run/systemd/system exists
     - launchd: macOS with parent PID 1 (launched by launchd)
@@ -61,15 +66,17 @@ def request_systemd_restart(reason: str = "restart requested") -> bool:
     now = time.time()
 
     try:
-        if sentinel_path.exists():
-            last = sentinel_path.stat().st_mtime
-            if now - last < _RESTART_DEBOUNCE_S:
-                logger.warning(
-                    "Restart requested (%s) but debounced (last %.1fs ago)",
-                    reason,
-                    now - last,
-                )
-                return False
+        try:
+            last: Optional[float] = os.stat(sentinel_path).st_mtime
+        except FileNotFoundError:
+            last = None
+        if last is not None and now - last < _RESTART_DEBOUNCE_S:
+            logger.warning(
+                "Restart requested (%s) but debounced (last %.1fs ago)",
+                reason,
+                now - last,
+            )
+            return False
 
         sentinel_path.parent.mkdir(parents=True, exist_ok=True)
         sentinel_path.write_text(
@@ -9,15 +9,15 @@ from __future__ import annotations
 
 import platform
 import socket
-from datetime import datetime, timezone
 from typing import Any
 
+from lucid_agent_core import _json
 from lucid_agent_core.core.config._validation import DEFAULT_LOG_LEVEL
 
 
-def now_iso8601() -> str:
-    """Return current UTC time as ISO8601 string."""
-    return datetime.now(timezone.utc).isoformat()
+# Fixed for the life of the process.
+_PLATFORM_SYSTEM = platform.system() or "unknown"
+_PLATFORM_MACHINE = platform.machine() or "unknown"
 
 
 def _get_ip_address() -> str:
@@ -37,8 +37,8 @@ def build_metadata(version: str) -> dict[str, Any]:
     """
     return {
         "version": version,
-        "platform": platform.system() or "unknown",
-        "architecture": platform.machine() or "unknown",
+        "platform": _PLATFORM_SYSTEM,
+        "architecture": _PLATFORM_MACHINE,
         "ip_address": _get_ip_address(),
     }
 
@@ -68,14 +68,16 @@ def build_components_list(
     Returns:
         List of component dicts: [{component_id, version, enabled}]
     """
-    return [
-        {
-            "component_id": cid,
-            "version": meta.get("version", "?"),
-            "enabled": meta.get("enabled", True),
-        }
-        for cid, meta in registry.items()
-    ]
+    return [build_component_entry(cid, meta) for cid, meta in registry.items()]
+
+
+def build_component_entry(component_id: str, meta: dict[str, Any]) -> dict[str, Any]:
+    """Build one state.components entry from its registry record."""
+    return {
+        "component_id": component_id,
+        "version": meta.get("version", "?"),
+        "enabled": meta.get("enabled", True),
+    }
 
 
 def build_state(
@@ -91,6 +93,18 @@ def build_state(
     }
 
 
+def build_state_bytes(registry: dict[str, dict[str, Any]]) -> bytes:
+    """
+    Build the retained state payload for *registry* as encoded JSON bytes.
+
+    Same document as build_state(build_components_list(registry)), encoded in
+    one pass without the intermediate list copy.
+    """
+    return _json.dumps(
+        {"components": [build_component_entry(cid, meta) for cid, meta in registry.items()]}
+    )
+
+
 def build_cfg(cfg: dict[str, Any]) -> dict[str, Any]:
     """
     Build retained cfg topic payload.
@@ -114,10 +128,15 @@ def build_cfg_logging(cfg: dict[str, Any]) -> dict[str, Any]:
 
 def build_agent_schema() -> dict[str, Any]:
     """
-    Build the agent-level MQTT topic schema.
+    Return the agent-level MQTT topic schema.
     Describes every topic the agent publishes and subscribes to.
+    The schema is static, so one shared dict is built at import; do not mutate it.
     """
-    _telemetry_metric_cfg = {
+    return _AGENT_SCHEMA
+
+
+def _agent_schema() -> dict[str, Any]:
+    telemetry_metric_schema = {
         "type": "object",
         "fields": {
             "enabled": {"type": "boolean"},
@@ -170,9 +189,9 @@ def build_agent_schema() -> dict[str, Any]:
             },
             "cfg/telemetry": {
                 "fields": {
-                    "cpu_percent": _telemetry_metric_cfg,
-                    "memory_percent": _telemetry_metric_cfg,
-                    "disk_percent": _telemetry_metric_cfg,
+                    "cpu_percent": telemetry_metric_schema,
+                    "memory_percent": telemetry_metric_schema,
+                    "disk_percent": telemetry_metric_schema,
                 },
             },
             "logs": {
@@ -279,6 +298,35 @@ def build_agent_schema() -> dict[str, Any]:
     }
 
 
+_AGENT_SCHEMA = _agent_schema()
+_AGENT_SCHEMA_BYTES = _json.dumps(_AGENT_SCHEMA)
+
+
+def build_agent_schema_bytes() -> bytes:
+    """Return the agent topic schema already encoded as JSON bytes."""
+    return _AGENT_SCHEMA_BYTES
+
+
+_TELEMETRY_METRICS = ("cpu_percent", "memory_percent", "disk_percent")
+_TELEMETRY_METRIC_DEFAULTS: dict[str, Any] = {
+    "enabled": False,
+    "interval_s": 2,
+    "change_threshold_percent": 2.0,
+}
+
+
+def _telemetry_metric_cfg(stored: Any) -> dict[str, Any]:
+    """Overlay one stored metric config on the defaults, coercing each field's type."""
+    if not isinstance(stored, dict) or not stored:
+        return dict(_TELEMETRY_METRIC_DEFAULTS)
+    merged = _TELEMETRY_METRIC_DEFAULTS | stored
+    return {
+        "enabled": bool(merged["enabled"]),
+        "interval_s": int(merged["interval_s"]),
+        "change_threshold_percent": float(merged["change_threshold_percent"]),
+    }
+
+
 def build_cfg_telemetry(cfg: dict[str, Any]) -> dict[str, Any]:
     """
     Build retained cfg/telemetry topic payload.
@@ -286,17 +334,5 @@ def build_cfg_telemetry(cfg: dict[str, Any]) -> dict[str, Any]:
     No nested "metrics" wrapper. Always includes all 3 system metrics so the user can see
     what is available and toggle them on/off.
     """
-    available_metrics = ["cpu_percent", "memory_percent", "disk_percent"]
     stored_metrics = cfg.get("telemetry", {}).get("metrics", {})
-
-    result: dict[str, Any] = {}
-    for metric_name in available_metrics:
-        metric_cfg = stored_metrics.get(metric_name, {})
-        if not isinstance(metric_cfg, dict):
-            metric_cfg = {}
-        result[metric_name] = {
-            "enabled": bool(metric_cfg.get("enabled", False)),
-            "interval_s": int(metric_cfg.get("interval_s", 2)),
-            "change_threshold_percent": float(metric_cfg.get("change_threshold_percent", 2.0)),
-        }
-    return result
+    return {name: _telemetry_metric_cfg(stored_metrics.get(name)) for name in _TELEMETRY_METRICS}
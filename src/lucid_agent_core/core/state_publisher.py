@@ -0,0 +1,177 @@
+"""
+Coalesced retained state publishing.
+
+Lifecycle handlers mark state dirty instead of rebuilding and publishing the
+retained state snapshot inline; a burst of commands results in one publish.
+The last published components list is kept and patched one entry at a time,
+so a single enable/disable does not rescan the whole registry, and the encoded
+snapshot is remembered so an unchanged state is not republished.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from typing import Any, Optional
+
+from lucid_agent_core import _json
+from lucid_agent_core.components.registry import load_registry
+from lucid_agent_core.core.cmd_context import RETAINED_REPUBLISH_QOS
+from lucid_agent_core.core.snapshots import (
+    build_component_entry,
+    build_state,
+    build_state_bytes,
+)
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_DELAY_S = 0.05
+
+
+def _patch_entry(
+    components: list[dict[str, Any]], component_id: str, meta: Optional[dict[str, Any]]
+) -> None:
+    for idx, entry in enumerate(components):
+        if entry.get("component_id") == component_id:
+            if meta is None:
+                del components[idx]
+            else:
+                entry.update(build_component_entry(component_id, meta))
+            return
+    if meta is not None:
+        components.append(build_component_entry(component_id, meta))
+
+
+class StatePublisher:
+    """Debounce retained state republishes for a command context."""
+
+    def __init__(self, ctx: Any, *, delay_s: float = _DEFAULT_DELAY_S) -> None:
+        self._ctx = ctx
+        self._delay_s = delay_s
+        self._lock = threading.Lock()
+        # Held for a whole publish so flush() waits for one already in flight.
+        self._publish_lock = threading.Lock()
+        self._timer: Optional[threading.Timer] = None
+        self._components: Optional[list[dict[str, Any]]] = None
+        self._last_payload: Optional[bytes] = None
+
+    def seed(self, components_list: list[dict[str, Any]]) -> None:
+        """Adopt *components_list* (e.g. the startup state, with load_failed markers) as current."""
+        with self._lock:
+            self._components = [dict(entry) for entry in components_list]
+
+    def update_component(self, component_id: str, meta: Optional[dict[str, Any]]) -> None:
+        """
+        Patch one component's entry from its registry record and schedule a publish.
+
+        *meta* None removes the entry. Extra keys on an existing entry (such as
+        load_failed) are preserved.
+        """
+        with self._lock:
+            if self._components is not None:
+                _patch_entry(self._components, component_id, meta)
+        self.mark_dirty()
+
+    def mark_dirty(self) -> None:
+        """Schedule a state republish unless one is already pending."""
+        with self._lock:
+            if self._timer is not None:
+                return
+            timer = threading.Timer(self._delay_s, self._on_timer)
+            timer.daemon = True
+            self._timer = timer
+        timer.start()
+
+    def flush(self) -> None:
+        """Publish immediately if a republish is pending; wait for one in flight."""
+        with self._publish_lock:
+            with self._lock:
+                timer, self._timer = self._timer, None
+            if timer is None:
+                return
+            timer.cancel()
+            self._publish()
+
+    def forget_published(self) -> None:
+        """Drop the last published payload after the state topic was written elsewhere."""
+        with self._lock:
+            self._last_payload = None
+
+    def _on_timer(self) -> None:
+        with self._publish_lock:
+            with self._lock:
+                # A flush() that ran while this timer waited has already published.
+                if self._timer is not threading.current_thread():
+                    return
+                self._timer = None
+            self._publish()
+
+    def _publish(self) -> None:
+        """Publish the current snapshot; callers hold _publish_lock."""
+        try:
+            # Encode the cached list under the lock rather than copying it out first.
+            with self._lock:
+                cached = self._components
+                if cached is not None:
+                    payload = _json.dumps(build_state(cached))
+                    count = len(cached)
+            if cached is None:
+                registry = load_registry()
+                payload = build_state_bytes(registry)
+                count = len(registry)
+            with self._lock:
+                unchanged = payload == self._last_payload
+            if unchanged:
+                logger.debug("Coalesced state unchanged; skipping retained publish")
+                return
+            self._ctx.publish_bytes(
+                self._ctx.topics.state_topic,
+                payload,
+                retain=True,
+                qos=RETAINED_REPUBLISH_QOS,
+            )
+            with self._lock:
+                self._last_payload = payload
+            logger.debug("Published coalesced state with %d components", count)
+        except Exception:
+            logger.exception("Failed to publish coalesced state")
+
+
+def publish_state(
+    ctx: Any,
+    registry: Optional[dict[str, dict[str, Any]]] = None,
+    *,
+    component_id: Optional[str] = None,
+) -> None:
+    """
+    Republish retained state after a registry change to *component_id*.
+
+    Defers to ctx.state_publisher when one is configured; otherwise publishes
+    the snapshot built from *registry* (loaded if not given) inline.
+    """
+    publisher = getattr(ctx, "state_publisher", None)
+    if registry is None:
+        registry = load_registry()
+    if publisher is not None:
+        if component_id is None:
+            publisher.mark_dirty()
+        else:
+            publisher.update_component(component_id, registry.get(component_id))
+        return
+    ctx.publish_bytes(
+        ctx.topics.state_topic, build_state_bytes(registry), retain=True, qos=RETAINED_REPUBLISH_QOS
+    )
+
+
+def flush_state(ctx: Any) -> None:
+    """Publish any pending coalesced state now, e.g. before the process restarts."""
+    publisher = getattr(ctx, "state_publisher", None)
+    if publisher is not None:
+        publisher.flush()
+
+
+def forget_published_state(ctx: Any) -> None:
+    """Tell the configured publisher the state topic was republished outside it (e.g. refresh)."""
+    publisher = getattr(ctx, "state_publisher", None)
+    if publisher is not None:
+        publisher.forget_published()
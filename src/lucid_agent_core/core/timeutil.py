@@ -0,0 +1,44 @@
+"""
+UTC timestamp formatting shared by the config store and the MQTT log handler.
+"""
+
+from __future__ import annotations
+
+import math
+from datetime import datetime, timezone
+
+
+def utc_iso() -> str:
+    """Return the current UTC time as an ISO8601 string."""
+    return datetime.now(timezone.utc).isoformat()
+
+
+# (whole epoch second, its "YYYY-MM-DDTHH:MM:SS" rendering), reused within the second.
+_iso_second: tuple[int, str] = (-1, "")
+
+
+def utc_iso_from_epoch(ts: float) -> str:
+    """
+    Format epoch seconds *ts* exactly like datetime.fromtimestamp(ts, timezone.utc).isoformat().
+
+    The date/time part is formatted once per second; only the microseconds are
+    rendered per call.
+    """
+    global _iso_second
+    # Split into whole seconds and microseconds the way datetime.fromtimestamp does.
+    frac, whole = math.modf(ts)
+    us = round(frac * 1e6)
+    if us >= 1_000_000:
+        whole += 1
+        us -= 1_000_000
+    elif us < 0:
+        whole -= 1
+        us += 1_000_000
+    sec = int(whole)
+    cached_sec, prefix = _iso_second
+    if cached_sec != sec:
+        prefix = datetime.fromtimestamp(sec, timezone.utc).replace(tzinfo=None).isoformat()
+        _iso_second = (sec, prefix)
+    if us:
+        return f"{prefix}.{us:06d}+00:00"
+    return f"{prefix}+00:00"
@@ -7,9 +7,11 @@ and a UTC timestamp helper used across all installer/upgrader modules.
 
 from __future__ import annotations
 
-import json
 import re
 from datetime import datetime, timezone
+from typing import Any
+
+from lucid_agent_core import _json
 
 _COMPONENT_ID_RE = re.compile(r"^[a-z0-9_]+$")
 _SEMVER_RE = re.compile(r"^\d+\.\d+\.\d+$")
@@ -26,36 +28,31 @@ def utc_now() -> str:
     return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
 
 
-def extract_request_id_best_effort(raw_payload: str) -> str:
-    """Extract request_id from a raw JSON payload, or return empty string."""
+def _as_object(raw_payload: str | bytes | dict[str, Any]) -> dict[str, Any]:
+    if isinstance(raw_payload, dict):
+        return raw_payload
     try:
-        obj = json.loads(raw_payload)
-        if isinstance(obj, dict) and isinstance(obj.get("request_id"), str):
-            return obj["request_id"]
+        obj = _json.loads(raw_payload)
     except Exception:
-        pass
-    return ""
+        return {}
+    return obj if isinstance(obj, dict) else {}
 
 
-def extract_component_id_best_effort(raw_payload: str) -> str:
-    """Extract component_id from a raw JSON payload, or return empty string."""
-    try:
-        obj = json.loads(raw_payload)
-        if isinstance(obj, dict) and isinstance(obj.get("component_id"), str):
-            return obj["component_id"]
-    except Exception:
-        pass
-    return ""
+def extract_request_id_best_effort(raw_payload: str | bytes | dict[str, Any]) -> str:
+    """Extract request_id from a raw or already-decoded payload, or return empty string."""
+    value = _as_object(raw_payload).get("request_id")
+    return value if isinstance(value, str) else ""
 
 
-def extract_version_best_effort(raw_payload: str) -> str:
-    """Extract version from a raw JSON payload's source field, or return empty string."""
-    try:
-        obj = json.loads(raw_payload)
-        if isinstance(obj, dict):
-            source = obj.get("source", {})
-            if isinstance(source, dict) and isinstance(source.get("version"), str):
-                return source["version"]
-    except Exception:
-        pass
+def extract_component_id_best_effort(raw_payload: str | bytes | dict[str, Any]) -> str:
+    """Extract component_id from a raw or already-decoded payload, or return empty string."""
+    value = _as_object(raw_payload).get("component_id")
+    return value if isinstance(value, str) else ""
+
+
+def extract_version_best_effort(raw_payload: str | bytes | dict[str, Any]) -> str:
+    """Extract version from a payload's source field, or return empty string."""
+    source = _as_object(raw_payload).get("source", {})
+    if isinstance(source, dict) and isinstance(source.get("version"), str):
+        return source["version"]
     return ""
@@ -8,13 +8,13 @@ verifies SHA256, runs pip install, discovers the entrypoint, and updates the reg
 from __future__ import annotations
 
 import importlib
-import json
 import logging
 import tempfile
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Literal, Optional
+from typing import Any, Literal, Optional
 
+from lucid_agent_core import _json
 from lucid_agent_core.components.registry import is_same_install, load_registry, write_registry
 from lucid_agent_core.core.upgrade._github_release import build_wheel_url, fetch_release_asset
 from lucid_agent_core.core.upgrade._download import DOWNLOAD_TIMEOUT_S, MAX_WHEEL_BYTES, download_wheel, verify_sha256
@@ -93,7 +93,7 @@ class InstallResult:
     restart_required: bool = False
 
 
-def handle_install_component(raw_payload: str) -> InstallResult:
+def handle_install_component(raw_payload: str | bytes) -> InstallResult:
     """
     Validates payload, fetches release asset from GitHub API, downloads wheel,
     verifies integrity, installs, discovers entrypoint, updates registry, and
@@ -101,18 +101,18 @@ def handle_install_component(raw_payload: str) -> InstallResult:
     """
     ts = utc_now()
 
+    payload: Any = None
     try:
-        req = _parse_and_validate(raw_payload)
+        payload = _decode_payload(raw_payload)
+        req = _validate_request(payload)
     except ValidationError as exc:
-        logger.warning(
-            "Install validation failed component=%s: %s",
-            extract_component_id_best_effort(raw_payload) or "?",
-            exc,
-        )
+        fields = payload if isinstance(payload, dict) else {}
+        component_id = extract_component_id_best_effort(fields)
+        logger.warning("Install validation failed component=%s: %s", component_id or "?", exc)
         return InstallResult(
-            request_id=extract_request_id_best_effort(raw_payload),
-            component_id=extract_component_id_best_effort(raw_payload),
-            version=extract_version_best_effort(raw_payload),
+            request_id=extract_request_id_best_effort(fields),
+            component_id=component_id,
+            version=extract_version_best_effort(fields),
             ok=False,
             ts=ts,
             error=f"validation_error: {exc}",
@@ -271,12 +271,14 @@ def handle_install_component(raw_payload: str) -> InstallResult:
         )
 
 
-def _parse_and_validate(raw_payload: str) -> InstallRequest:
+def _decode_payload(raw_payload: str | bytes) -> Any:
     try:
-        payload = json.loads(raw_payload)
-    except json.JSONDecodeError as exc:
+        return _json.loads(raw_payload)
+    except _json.JSONDecodeError as exc:
         raise ValidationError(f"payload must be valid JSON: {exc}") from exc
 
+
+def _validate_request(payload: Any) -> InstallRequest:
     if not isinstance(payload, dict):
         raise ValidationError("payload must be a JSON object")
 
@@ -7,11 +7,11 @@ and returns a structured result.
 
 from __future__ import annotations
 
-import json
 import logging
 from dataclasses import dataclass
-from typing import Optional
+from typing import Any, Optional
 
+from lucid_agent_core import _json
 from lucid_agent_core.components.registry import load_registry, write_registry
 from lucid_agent_core.core.upgrade._pip import pip_uninstall_dist
 from lucid_agent_core.core.upgrade._validation import (
@@ -38,19 +38,22 @@ class UninstallResult:
     restart_required: bool = False
 
 
-def handle_uninstall_component(raw_payload: str) -> UninstallResult:
+def handle_uninstall_component(raw_payload: str | bytes) -> UninstallResult:
     """
     Validate payload, uninstall component via pip, remove from registry, return result.
     Idempotent: returns ok=True, noop=True if the component is not installed.
     """
     ts = utc_now()
 
+    payload: Any = None
     try:
-        req = _parse_and_validate(raw_payload)
+        payload = _decode_payload(raw_payload)
+        req = _validate_request(payload)
     except ValidationError as exc:
+        fields = payload if isinstance(payload, dict) else {}
         return UninstallResult(
-            request_id=extract_request_id_best_effort(raw_payload),
-            component_id=extract_component_id_best_effort(raw_payload),
+            request_id=extract_request_id_best_effort(fields),
+            component_id=extract_component_id_best_effort(fields),
             ok=False,
             ts=ts,
             error=f"validation_error: {exc}",
@@ -116,12 +119,14 @@ def handle_uninstall_component(raw_payload: str) -> UninstallResult:
         )
 
 
-def _parse_and_validate(raw_payload: str) -> dict[str, str]:
+def _decode_payload(raw_payload: str | bytes) -> Any:
     try:
-        payload = json.loads(raw_payload)
-    except json.JSONDecodeError as exc:
+        return _json.loads(raw_payload)
+    except _json.JSONDecodeError as exc:
         raise ValidationError(f"payload must be valid JSON: {exc}") from exc
 
+
+def _validate_request(payload: Any) -> dict[str, str]:
     if not isinstance(payload, dict):
         raise ValidationError("payload must be a JSON object")
 
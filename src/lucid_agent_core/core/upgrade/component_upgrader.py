@@ -7,13 +7,13 @@ upgrades via pip, updates the registry, and signals a restart.
 
 from __future__ import annotations
 
-import json
 import logging
 import tempfile
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
+from lucid_agent_core import _json
 from lucid_agent_core.components.registry import load_registry, write_registry
 from lucid_agent_core.core.upgrade._download import DOWNLOAD_TIMEOUT_S, MAX_WHEEL_BYTES, download_wheel, verify_sha256
 from lucid_agent_core.core.upgrade._pip import pip_upgrade_wheel
@@ -87,20 +87,19 @@ class ComponentUpgradeResult:
     restart_required: bool = True
 
 
-def handle_component_upgrade(raw_payload: str) -> ComponentUpgradeResult:
+def handle_component_upgrade(raw_payload: str | bytes) -> ComponentUpgradeResult:
     """
     Validate payload, download wheel, verify SHA256, upgrade venv, update registry, return result.
     Always requires restart.
     """
     ts = utc_now()
 
+    obj: Any = None
     try:
-        req = _parse_and_validate(raw_payload)
+        obj = _decode_payload(raw_payload)
+        req = _validate_request(obj)
     except ValidationError as exc:
-        try:
-            payload_obj = json.loads(raw_payload) if raw_payload else {}
-        except json.JSONDecodeError:
-            payload_obj = {}
+        payload_obj = obj if isinstance(obj, dict) else {}
         logger.warning(
             "Component upgrade validation failed component=%s: %s",
             payload_obj.get("component_id", "?"),
@@ -231,13 +230,15 @@ def handle_component_upgrade(raw_payload: str) -> ComponentUpgradeResult:
         )
 
 
-def _parse_and_validate(raw_payload: str) -> ComponentUpgradeRequest:
-    """Parse and validate upgrade payload, enriching with registry data."""
+def _decode_payload(raw_payload: str | bytes) -> Any:
     try:
-        obj = json.loads(raw_payload) if raw_payload else {}
-    except json.JSONDecodeError as exc:
+        return _json.loads(raw_payload) if raw_payload else {}
+    except _json.JSONDecodeError as exc:
         raise ValidationError(f"invalid JSON: {exc}") from exc
 
+
+def _validate_request(obj: Any) -> ComponentUpgradeRequest:
+    """Validate a decoded upgrade payload, enriching with registry data."""
     if not isinstance(obj, dict):
         raise ValidationError("payload must be a dict")
 
@@ -7,15 +7,15 @@ verifies SHA256, upgrades the venv via pip, and signals a restart.
 
 from __future__ import annotations
 
-import json
 import logging
 import re
 import tempfile
 import zipfile
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
+from lucid_agent_core import _json
 from lucid_agent_core.core.upgrade._download import DOWNLOAD_TIMEOUT_S, MAX_WHEEL_BYTES, download_wheel, verify_sha256
 from lucid_agent_core.core.upgrade._github_release import fetch_release_wheel_sha256
 from lucid_agent_core.core.upgrade._pip import pip_upgrade_wheel
@@ -85,24 +85,23 @@ class UpgradeResult:
     restart_required: bool = True
 
 
-def handle_core_upgrade(raw_payload: str) -> UpgradeResult:
+def handle_core_upgrade(raw_payload: str | bytes) -> UpgradeResult:
     """
     Validate payload, download core wheel, verify SHA256, upgrade venv, return result.
     Always requires restart.
     """
     ts = utc_now()
 
+    obj: Any = None
     try:
-        req = _parse_and_validate(raw_payload)
+        obj = _decode_payload(raw_payload)
+        req = _validate_request(obj)
     except ValidationError as exc:
         logger.warning("Core upgrade validation failed: %s", exc)
-        try:
-            obj = json.loads(raw_payload) if raw_payload else {}
-        except json.JSONDecodeError:
-            obj = {}
+        fields = obj if isinstance(obj, dict) else {}
         return UpgradeResult(
-            request_id=obj.get("request_id", ""),
-            version=obj.get("version", ""),
+            request_id=fields.get("request_id", ""),
+            version=fields.get("version", ""),
             ok=False,
             ts=ts,
             error=f"validation_error: {exc}",
@@ -218,12 +217,14 @@ def _auto_upgrade_lucid_deps(wheel_path: Path) -> None:
             logger.warning("Failed to auto-upgrade dep %s to %s: %s", pkg, version, exc)
 
 
-def _parse_and_validate(raw_payload: str) -> UpgradeRequest:
+def _decode_payload(raw_payload: str | bytes) -> Any:
     try:
-        obj = json.loads(raw_payload) if raw_payload else {}
-    except json.JSONDecodeError as exc:
+        return _json.loads(raw_payload) if raw_payload else {}
+    except _json.JSONDecodeError as exc:
         raise ValidationError(f"invalid JSON: {exc}") from exc
 
+
+def _validate_request(obj: Any) -> UpgradeRequest:
     if not isinstance(obj, dict):
         raise ValidationError("payload must be a dict")
 
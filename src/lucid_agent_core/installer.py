@@ -16,10 +16,12 @@ Contract:
 
 from __future__ import annotations
 
+import functools
 import os
 import plistlib
 import pwd
 import shutil
+import stat
 import subprocess
 import sys
 from importlib import resources
@@ -44,6 +46,10 @@ VENV_DIR = BASE_DIR / "venv"
 
 UNIT_PATH = Path(f"/etc/systemd/system/{SERVICE_NAME}.service")
 
+# Skip byte-compiling every installed module; .pyc files are written lazily on
+# first import by the service user, who owns the venv.
+_PIP_INSTALL_ARGS = ("install", "--no-compile", "--upgrade")
+
 
 # =========================
 # Utilities
@@ -52,6 +58,18 @@ def _run(cmd: list[str], check: bool = True) -> subprocess.CompletedProcess:
     return subprocess.run(cmd, check=check)
 
 
+@functools.lru_cache(maxsize=1)
+def _pkg_version() -> str:
+    """Installed lucid-agent-core version (metadata lookup done once per process)."""
+    return pkg_version("lucid-agent-core")
+
+
+@functools.lru_cache(maxsize=1)
+def _pkg_resources() -> resources.abc.Traversable:
+    """Packaged data root for lucid_agent_core (templates, env.example)."""
+    return resources.files("lucid_agent_core")
+
+
 def _ensure_root() -> None:
     if os.geteuid() != 0:
         raise PermissionError("This command must be run as root (sudo).")
@@ -65,9 +83,12 @@ def _user_ids() -> tuple[int, int]:
     return entry.pw_uid, entry.pw_gid
 
 
-def _owner_spec() -> str:
-    uid, gid = _user_ids()
-    return f"{uid}:{gid}"
+def _user_exists() -> bool:
+    try:
+        pwd.getpwnam(SYSTEM_USER)
+    except KeyError:
+        return False
+    return True
 
 
 def _service_group_spec() -> str:
@@ -75,12 +96,41 @@ def _service_group_spec() -> str:
     return str(gid)
 
 
+def _chown_if_needed(path: str | Path, uid: int, gid: int, *, follow_symlinks: bool) -> None:
+    st = os.stat(path, follow_symlinks=follow_symlinks)
+    if st.st_uid != uid or st.st_gid != gid:
+        os.chown(path, uid, gid, follow_symlinks=follow_symlinks)
+
+
+def _chmod_if_needed(path: Path, mode: int) -> None:
+    if stat.S_IMODE(os.stat(path).st_mode) != mode:
+        os.chmod(path, mode)
+
+
+def _raise_walk_error(exc: OSError) -> None:
+    raise exc
+
+
+def _chown_tree(path: Path, uid: int, gid: int) -> None:
+    """
+    In-process `chown -R`: symlinks are re-owned themselves, never followed.
+
+    Entries that already have the right owner are only stat'ed, so re-runs over
+    an installed venv do not rewrite every inode. A directory that cannot be
+    listed fails the walk, as it fails `chown -R`, instead of being skipped.
+    """
+    _chown_if_needed(path, uid, gid, follow_symlinks=True)
+    for dirpath, dirnames, filenames in os.walk(path, onerror=_raise_walk_error):
+        for name in dirnames + filenames:
+            _chown_if_needed(os.path.join(dirpath, name), uid, gid, follow_symlinks=False)
+
+
 def _chown(path: Path, *, recursive: bool = False) -> None:
-    cmd = ["chown"]
+    uid, gid = _user_ids()
     if recursive:
-        cmd.append("-R")
-    cmd.extend([_owner_spec(), str(path)])
-    _run(cmd)
+        _chown_tree(path, uid, gid)
+    else:
+        os.chown(path, uid, gid)
 
 
 def _ensure_user() -> None:
@@ -99,15 +149,12 @@ def _ensure_user() -> None:
             f"Cannot create user '{SYSTEM_USER}': home path exists and is not a directory: {home_dir}"
         )
 
-    try:
-        _run(["id", SYSTEM_USER])
+    if _user_exists():
         print(f"User '{SYSTEM_USER}' already exists")
-    except subprocess.CalledProcessError:
-        print(f"Creating user '{SYSTEM_USER}'...")
-    else:
         home_dir.mkdir(parents=True, exist_ok=True)
         _chown(home_dir)
         return
+    print(f"Creating user '{SYSTEM_USER}'...")
 
     create_cmd = [
         "useradd",
@@ -169,11 +216,20 @@ def _ensure_dirs() -> None:
         (BASE_DIR / "run", 0o750),
     ]:
         path.mkdir(parents=True, exist_ok=True)
-        os.chmod(path, mode)
+        _chmod_if_needed(path, mode)
 
+    # Recursive so files already under the base dir (env file, data) are repaired too
     _chown(BASE_DIR, recursive=True)
 
 
+def _env_example_bytes() -> bytes:
+    """Packaged env.example, copied byte for byte (no decode/encode round trip)."""
+    try:
+        return _pkg_resources().joinpath("env.example").read_bytes()
+    except Exception:
+        return b"# LUCID Agent Core environment variables\n"
+
+
 def _ensure_env_file() -> None:
     """
     Create /home/lucid/lucid-agent-core/agent-core.env if it does not exist.
@@ -182,15 +238,7 @@ def _ensure_env_file() -> None:
         print(f"Environment file already exists: {ENV_PATH}")
         return
 
-    try:
-        env_example = resources.files("lucid_agent_core").joinpath("env.example")
-        with env_example.open("r", encoding="utf-8") as src:
-            content = src.read()
-    except Exception:
-        content = "# LUCID Agent Core environment variables\n"
-
-    with ENV_PATH.open("w", encoding="utf-8") as dst:
-        dst.write(content)
+    ENV_PATH.write_bytes(_env_example_bytes())
 
     os.chmod(ENV_PATH, 0o640)
     _chown(ENV_PATH)
@@ -227,9 +275,12 @@ def _ensure_venv_permissions() -> None:
     Ensure venv directory and all contents are owned by SYSTEM_USER.
     This is critical for pip upgrades to work correctly.
     """
-    if VENV_DIR.exists():
-        _chown(VENV_DIR, recursive=True)
-        print(f"Fixed venv permissions: {VENV_DIR}")
+    try:
+        os.stat(VENV_DIR)
+    except FileNotFoundError:
+        return
+    _chown(VENV_DIR, recursive=True)
+    print(f"Fixed venv permissions: {VENV_DIR}")
 
 
 def _create_venv() -> None:
@@ -247,6 +298,39 @@ def _create_venv() -> None:
     print(f"Virtual environment created: {VENV_DIR}")
 
 
+def _release_wheel_url(version: str) -> str:
+    return (
+        f"https://github.com/LucidLabPlatform/lucid-agent-core/"
+        f"releases/download/v{version}/"
+        f"lucid_agent_core-{version}-py3-none-any.whl"
+    )
+
+
+def _venv_pkg_version(venv_dir: Path) -> Optional[str]:
+    """
+    Version of lucid-agent-core installed in *venv_dir*, or None if unknown.
+
+    Used to skip re-downloading the release wheel when that version is already there.
+    """
+    python = venv_dir / "bin" / "python"
+    try:
+        proc = subprocess.run(
+            [
+                str(python),
+                "-c",
+                "from importlib.metadata import version; print(version('lucid-agent-core'))",
+            ],
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+    except OSError:  # no interpreter in the venv yet
+        return None
+    if proc.returncode != 0:
+        return None
+    return proc.stdout.strip() or None
+
+
 def _install_cli_into_venv(wheel_path: Optional[Path] = None) -> None:
     """
     Install lucid-agent-core into the venv.
@@ -272,19 +356,15 @@ def _install_cli_into_venv(wheel_path: Optional[Path] = None) -> None:
 
         print(f"Installing from local wheel: {wheel_path}")
         # Run pip as SYSTEM_USER to ensure correct ownership of installed files
-        _run(["sudo", "-u", SYSTEM_USER, str(pip), "install", "--upgrade", str(wheel_path)])
+        _run(["sudo", "-u", SYSTEM_USER, str(pip), *_PIP_INSTALL_ARGS, str(wheel_path)])
+    elif _venv_pkg_version(VENV_DIR) == _pkg_version():
+        print(f"lucid-agent-core {_pkg_version()} already installed in venv; skipping download")
     else:
         # Install from GitHub release
-        version = pkg_version("lucid-agent-core")
-        wheel_url = (
-            f"https://github.com/LucidLabPlatform/lucid-agent-core/"
-            f"releases/download/v{version}/"
-            f"lucid_agent_core-{version}-py3-none-any.whl"
-        )
-
+        wheel_url = _release_wheel_url(_pkg_version())
         print(f"Installing from GitHub release: {wheel_url}")
         # Run pip as SYSTEM_USER to ensure correct ownership of installed files
-        _run(["sudo", "-u", SYSTEM_USER, str(pip), "install", "--upgrade", wheel_url])
+        _run(["sudo", "-u", SYSTEM_USER, str(pip), *_PIP_INSTALL_ARGS, wheel_url])
 
     # Fix ownership again after installation (in case any files were created as root)
     _ensure_venv_permissions()
@@ -297,15 +377,14 @@ def _install_cli_into_venv(wheel_path: Optional[Path] = None) -> None:
     print(f"Installation successful: {cli}")
 
 
-def _write_systemd_unit() -> None:
+def _write_systemd_unit() -> bool:
     """
     Install systemd unit from packaged template.
-    """
-
-    from importlib import resources
 
+    Returns True if the unit file was written, False if it was already current.
+    """
     try:
-        unit_template = resources.files("lucid_agent_core").joinpath(
+        unit_template = _pkg_resources().joinpath(
             "systemd/lucid-agent-core.service"
         )
 
@@ -326,13 +405,24 @@ def _write_systemd_unit() -> None:
         ),
     )
 
+    try:
+        current = UNIT_PATH.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        current = None
+    if current == content:
+        print(f"Systemd unit unchanged: {UNIT_PATH}")
+        return False
+
     UNIT_PATH.write_text(content, encoding="utf-8")
     os.chmod(UNIT_PATH, 0o644)
     print(f"Systemd unit installed: {UNIT_PATH}")
+    return True
 
 
-def _reload_and_enable() -> None:
-    _run(["systemctl", "daemon-reload"])
+def _reload_and_enable(reload: bool = True) -> None:
+    # daemon-reload makes systemd re-parse every unit; only needed after a unit change.
+    if reload:
+        _run(["systemctl", "daemon-reload"])
     _run(["systemctl", "enable", SERVICE_NAME])
     print(f"Service enabled: {SERVICE_NAME}")
 
@@ -375,13 +465,7 @@ def install_service_macos(wheel_path: Optional[Path] = None) -> None:
 
     # Create env file (reuse shared helper by temporarily pointing module globals)
     if not env_path.exists():
-        try:
-            env_example = resources.files("lucid_agent_core").joinpath("env.example")
-            with env_example.open("r", encoding="utf-8") as src:
-                content = src.read()
-        except Exception:
-            content = "# LUCID Agent Core environment variables\n"
-        env_path.write_text(content, encoding="utf-8")
+        env_path.write_bytes(_env_example_bytes())
         os.chmod(env_path, 0o640)
         print(f"Created environment file: {env_path}")
     else:
@@ -405,16 +489,13 @@ def install_service_macos(wheel_path: Optional[Path] = None) -> None:
         if not wheel_path.exists():
             raise FileNotFoundError(f"Wheel file not found: {wheel_path}")
         print(f"Installing from local wheel: {wheel_path}")
-        _run([str(pip), "install", "--upgrade", str(wheel_path)])
+        _run([str(pip), *_PIP_INSTALL_ARGS, str(wheel_path)])
+    elif _venv_pkg_version(venv_dir) == _pkg_version():
+        print(f"lucid-agent-core {_pkg_version()} already installed in venv; skipping download")
     else:
-        version = pkg_version("lucid-agent-core")
-        wheel_url = (
-            f"https://github.com/LucidLabPlatform/lucid-agent-core/"
-            f"releases/download/v{version}/"
-            f"lucid_agent_core-{version}-py3-none-any.whl"
-        )
+        wheel_url = _release_wheel_url(_pkg_version())
         print(f"Installing from GitHub release: {wheel_url}")
-        _run([str(pip), "install", "--upgrade", wheel_url])
+        _run([str(pip), *_PIP_INSTALL_ARGS, wheel_url])
 
     cli = venv_dir / "bin" / "lucid-agent-core"
     if not cli.exists():
@@ -423,7 +504,7 @@ def install_service_macos(wheel_path: Optional[Path] = None) -> None:
 
     # Write launchd plist
     try:
-        plist_template = resources.files("lucid_agent_core").joinpath(
+        plist_template = _pkg_resources().joinpath(
             "launchd/com.lucid.agent-core.plist"
         )
         with plist_template.open("rb") as f:
@@ -499,8 +580,8 @@ def install_service(wheel_path: Optional[Path] = None) -> None:
     _ensure_env_file()
     _create_venv()
     _install_cli_into_venv(wheel_path)
-    _write_systemd_unit()
-    _reload_and_enable()
+    unit_changed = _write_systemd_unit()
+    _reload_and_enable(reload=unit_changed)
 
     print("\n" + "=" * 60)
     print(f"  {SERVICE_NAME} installed and enabled successfully!")
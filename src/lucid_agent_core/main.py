@@ -14,17 +14,18 @@ import logging
 import os
 import signal
 import threading
-import time
 from dataclasses import asdict, dataclass, is_dataclass
 from importlib.metadata import PackageNotFoundError, version as pkg_version
 from typing import Optional
 
 from lucid_agent_core.components.loader import load_components
+from lucid_agent_core.components.registry import flush_registry_writes
 from lucid_agent_core.config import AgentConfig
 from lucid_agent_core.core.config import ConfigStore
 
 _CONNECT_TIMEOUT_S = 5.0
-_CONNECT_POLL_INTERVAL_S = 0.1
+# How often the main thread checks for a shutdown request from a signal.
+_SHUTDOWN_POLL_S = 0.5
 
 
 def _configure_logging(cfg: dict | None = None) -> None:
@@ -56,12 +57,15 @@ class Runtime:
     shutdown: threading.Event
     agent: object
     components: Optional[list[object]] = None
+    ctx: Optional[object] = None
+    # Set by the signal handler. A plain attribute store takes no locks, unlike Event.set().
+    signalled: bool = False
 
 
 def _install_signal_handlers(rt: Runtime) -> None:
     def _handler(signum: int, frame) -> None:  # frame is unused, keep signature
         logger.info("Received signal %s; requesting shutdown", signum)
-        rt.shutdown.set()
+        rt.signalled = True
 
     signal.signal(signal.SIGINT, _handler)
     signal.signal(signal.SIGTERM, _handler)
@@ -94,16 +98,12 @@ def _bootstrap() -> _Bootstrap:
 
 
 def _connect_and_wait(agent: object, timeout_s: float = _CONNECT_TIMEOUT_S) -> bool:
-    """Connect MQTT and poll until connected or timeout. Returns False on connect failure."""
+    """Connect MQTT and wait until connected or timeout. Returns False on connect failure."""
     if not agent.connect():  # type: ignore[attr-defined]
         logger.error("MQTT connection failed")
         return False
 
-    for _ in range(int(timeout_s / _CONNECT_POLL_INTERVAL_S)):
-        if agent.is_connected():  # type: ignore[attr-defined]
-            break
-        time.sleep(_CONNECT_POLL_INTERVAL_S)
-    else:
+    if not agent.wait_connected(timeout_s):  # type: ignore[attr-defined]
         logger.warning(
             "Connection not established after %.1f seconds, proceeding anyway", timeout_s
         )
@@ -113,6 +113,7 @@ def _connect_and_wait(agent: object, timeout_s: float = _CONNECT_TIMEOUT_S) -> b
 def _load_and_start_components(
     agent: object,
     app_cfg: object,
+    state_publisher: Optional[object] = None,
 ) -> list[object]:
     """Load components from registry, register cmd handlers, publish retained state."""
     from lucid_agent_core.components.registry import load_registry
@@ -171,6 +172,8 @@ def _load_and_start_components(
             entry["load_failed"] = True
     agent.add_component_handlers(components, registry)  # type: ignore[attr-defined]
     agent.publish_retained_state(components_list)  # type: ignore[attr-defined]
+    if state_publisher is not None:
+        state_publisher.seed(components_list)  # type: ignore[attr-defined]
     return components
 
 
@@ -181,6 +184,7 @@ def run_agent() -> int:
     """
     from lucid_agent_core.mqtt import AgentMQTTClient
     from lucid_agent_core.core.cmd_context import CoreCommandContext
+    from lucid_agent_core.core.state_publisher import StatePublisher
 
     boot = _bootstrap()
 
@@ -210,17 +214,22 @@ def run_agent() -> int:
         config_store=boot.config_store,
         component_manager=agent,
     )
+    ctx.state_publisher = StatePublisher(ctx)
+    rt.ctx = ctx
     agent.set_context(ctx)
 
     if not _connect_and_wait(agent):
         return 1
 
-    rt.components = _load_and_start_components(agent, boot.app_cfg)
+    rt.components = _load_and_start_components(agent, boot.app_cfg, ctx.state_publisher)
 
     logger.info("Agent running (shutdown via SIGINT/SIGTERM)")
     try:
-        while not rt.shutdown.is_set():
-            time.sleep(0.5)
+        # Event.set() is not safe from a signal handler: it deadlocks if the signal
+        # lands while this thread holds the Event's lock inside wait(). The handler
+        # only sets rt.signalled, which is checked between bounded waits.
+        while not rt.signalled and not rt.shutdown.wait(_SHUTDOWN_POLL_S):
+            pass
     finally:
         _shutdown(rt)
 
@@ -244,6 +253,18 @@ def _shutdown(rt: Runtime) -> None:
                 logger.exception("Error stopping component")
         logger.info("Components stopped")
 
+    state_publisher = getattr(rt.ctx, "state_publisher", None)
+    if state_publisher is not None:
+        try:
+            state_publisher.flush()
+        except Exception:
+            logger.exception("Error flushing pending state publish")
+
+    try:
+        flush_registry_writes(timeout=5.0)
+    except Exception:
+        logger.exception("Error flushing registry writes")
+
     try:
         rt.agent.disconnect()
     except Exception:
@@ -8,7 +8,7 @@ and retained publishing to retained helpers.
 
 from __future__ import annotations
 
-import json
+import functools
 import logging
 import threading
 import time
@@ -20,25 +20,52 @@ from typing import Any, Callable, Optional
 
 import paho.mqtt.client as mqtt
 
-
-@dataclass
-class _PendingCommand:
-    """An in-flight command tracked so newer commands can displace it."""
-    future: Future
-    topic: str
-    request_id: str
-
+from lucid_agent_core import _json
+from lucid_agent_core.components.registry import load_registry
+from lucid_agent_core.core.handlers import HANDLERS, RAW_PAYLOAD_ACTIONS
+from lucid_agent_core.core.handlers._parsing import parse_payload, scan_request_id
+from lucid_agent_core.core.mqtt_log_handler import MQTTLogHandler, MQTTLogQueueHandler
+from lucid_agent_core.core.snapshots import (
+    build_agent_schema_bytes,
+    build_cfg,
+    build_cfg_logging,
+    build_cfg_telemetry,
+    build_metadata,
+    build_status,
+)
 from lucid_agent_core.mqtt_topics import TopicSchema
+from lucid_agent_core.mqtt.component_subscriptions import (
+    add_component_handlers as _add_component_handlers,
+    subscribe_component_topics,
+    unsubscribe_component_topics,
+)
 from lucid_agent_core.mqtt.heartbeat import HeartbeatLoop, StatusPayload
+from lucid_agent_core.mqtt.retained import (
+    publish_retained_refresh as _publish_retained_refresh,
+    publish_retained_state as _publish_retained_state,
+)
 from lucid_agent_core.mqtt.telemetry import TelemetryLoop
 
 logger = logging.getLogger(__name__)
 
+# QoS 1 publishes paho keeps unacknowledged at once (paho's default is 20), so a
+# burst of retained republishes does not stall waiting for PUBACKs.
+_MAX_INFLIGHT_MESSAGES = 128
+
 
 def _utc_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
+@dataclass(slots=True)
+class _PendingCommand:
+    """An in-flight command tracked so newer commands can displace it."""
+
+    future: Future
+    topic: str
+    request_id: str
+
+
 class AgentMQTTClient:
     """
     MQTT client for the LUCID agent.
@@ -74,7 +101,11 @@ class AgentMQTTClient:
         self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="mqtt-cmd")
 
         self._ctx: Optional[Any] = None
-        self._handlers: dict[str, Callable[[str], None]] = {}
+        self._handlers: dict[str, Callable[..., None]] = {}
+        # Agent cmd topics whose handlers take the payload pre-parsed; component cmd
+        # topics and RAW_PAYLOAD_ACTIONS share _handlers but receive only the raw payload.
+        self._parsed_cmd_topics: frozenset[str] = frozenset()
+        self._log_handler: Optional[MQTTLogQueueHandler] = None
         self._components: list[Any] = []
         self._components_lock = threading.Lock()
         # Serialises concurrent start/stop operations so the read-check-act
@@ -82,6 +113,8 @@ class AgentMQTTClient:
         self._lifecycle_lock = threading.Lock()
         self._connected_since_ts: Optional[str] = None
         self._connected_ts: Optional[float] = None
+        # Set once _on_connect has finished its setup; cleared on disconnect.
+        self._connected_evt = threading.Event()
 
         # Per-component cmd topics (for unsubscribe on stop)
         self._component_cmd_topics: dict[str, set[str]] = {}
@@ -143,21 +176,10 @@ class AgentMQTTClient:
         result_topic = cmd_topic.replace("/cmd/", "/evt/", 1) + "/result"
         self._paho_publish(
             result_topic,
-            json.dumps({"request_id": request_id, "ok": False, "error": error}),
+            _json.dumps({"request_id": request_id, "ok": False, "error": error}),
             qos=1,
         )
 
-    @staticmethod
-    def _extract_request_id(payload_str: str) -> str:
-        try:
-            obj = json.loads(payload_str) if payload_str else {}
-        except Exception:
-            return ""
-        if isinstance(obj, dict):
-            rid = obj.get("request_id", "")
-            return rid if isinstance(rid, str) else ""
-        return ""
-
     def _try_cancel_oldest_pending(self) -> Optional[_PendingCommand]:
         """Cancel the oldest queued (not-yet-running) cmd; return its entry.
 
@@ -195,54 +217,44 @@ class AgentMQTTClient:
 
     def _setup_mqtt_logging(self) -> None:
         try:
-            from lucid_agent_core.core.mqtt_log_handler import MQTTLogHandler
-
             root_logger = logging.getLogger()
+            topic = self.topics.logs()
             for handler in root_logger.handlers:
-                if isinstance(handler, MQTTLogHandler) and handler.topic == self.topics.logs():
+                if isinstance(handler, MQTTLogQueueHandler) and handler.topic == topic:
                     return
-            handler = MQTTLogHandler(self, self.topics.logs())
+            target = MQTTLogHandler(self, topic)
+            target.setLevel(logging.DEBUG)
+            handler = MQTTLogQueueHandler(target)
             handler.setLevel(logging.DEBUG)
             root_logger.addHandler(handler)
+            handler.start()
+            self._log_handler = handler
             logger.info("MQTT logging handler added for core logs")
         except Exception as exc:
             logger.warning("Failed to set up MQTT logging: %s", exc)
 
+    def _teardown_mqtt_logging(self) -> None:
+        handler, self._log_handler = self._log_handler, None
+        if handler is None:
+            return
+        logging.getLogger().removeHandler(handler)
+        handler.close()
+
     def _build_handlers(self) -> None:
         if not self._ctx:
             self._handlers = {}
+            self._parsed_cmd_topics = frozenset()
             return
 
-        from lucid_agent_core.core.handlers import (
-            on_ping,
-            on_restart,
-            on_refresh,
-            on_cfg_set,
-            on_cfg_logging_set,
-            on_cfg_telemetry_set,
-            on_components_install,
-            on_components_uninstall,
-            on_components_enable,
-            on_components_disable,
-            on_components_upgrade,
-            on_core_upgrade,
-        )
-
+        # partial binds ctx without adding a Python-level frame per dispatch.
         ctx = self._ctx
         self._handlers = {
-            self.topics.cmd_ping(): lambda p: on_ping(ctx, p),
-            self.topics.cmd_restart(): lambda p: on_restart(ctx, p),
-            self.topics.cmd_refresh(): lambda p: on_refresh(ctx, p),
-            self.topics.cmd_cfg_set(): lambda p: on_cfg_set(ctx, p),
-            self.topics.cmd_cfg_logging_set(): lambda p: on_cfg_logging_set(ctx, p),
-            self.topics.cmd_cfg_telemetry_set(): lambda p: on_cfg_telemetry_set(ctx, p),
-            self.topics.cmd_components_install(): lambda p: on_components_install(ctx, p),
-            self.topics.cmd_components_uninstall(): lambda p: on_components_uninstall(ctx, p),
-            self.topics.cmd_components_enable(): lambda p: on_components_enable(ctx, p),
-            self.topics.cmd_components_disable(): lambda p: on_components_disable(ctx, p),
-            self.topics.cmd_components_upgrade(): lambda p: on_components_upgrade(ctx, p),
-            self.topics.cmd_core_upgrade(): lambda p: on_core_upgrade(ctx, p),
+            self.topics.cmd(action): functools.partial(handler, ctx)
+            for action, handler in HANDLERS.items()
         }
+        self._parsed_cmd_topics = frozenset(
+            self.topics.cmd(action) for action in HANDLERS if action not in RAW_PAYLOAD_ACTIONS
+        )
         logger.debug("Built %d agent command handlers", len(self._handlers))
 
     # ------------------------------------------------------------------
@@ -255,12 +267,10 @@ class AgentMQTTClient:
 
     def add_component_handlers(self, components: list[Any], registry: dict[str, dict]) -> None:
         """Subscribe to each component's cmd topics. Call after connect() and load_components()."""
-        from lucid_agent_core.mqtt.component_subscriptions import add_component_handlers
-
         with self._components_lock:
             self._components = list(components)
 
-        add_component_handlers(
+        _add_component_handlers(
             self._client,
             self._handlers,
             self._component_cmd_topics,
@@ -271,8 +281,6 @@ class AgentMQTTClient:
 
     def _subscribe_component_topics(self, comp: Any, component_id: str) -> None:
         """Subscribe to a single component's command topics."""
-        from lucid_agent_core.mqtt.component_subscriptions import subscribe_component_topics
-
         subscribe_component_topics(
             self._client,
             self._handlers,
@@ -292,8 +300,6 @@ class AgentMQTTClient:
 
     def stop_component(self, component_id: str) -> bool:
         """Stop a running component and unsubscribe its cmd topics."""
-        from lucid_agent_core.mqtt.component_subscriptions import unsubscribe_component_topics
-
         with self._lifecycle_lock:
             comp = self.get_component(component_id)
             if comp is None:
@@ -323,9 +329,7 @@ class AgentMQTTClient:
 
     def _start_component_locked(self, component_id: str, registry: dict[str, dict]) -> bool:
         """Inner implementation — must be called with _lifecycle_lock held."""
-        from lucid_agent_core.components.registry import load_registry as _load_registry
-
-        reg = registry if registry else _load_registry()
+        reg = registry if registry else load_registry()
         if component_id not in reg:
             return False
 
@@ -417,15 +421,13 @@ class AgentMQTTClient:
         """Publish retained state with the current components list."""
         if not self._ctx or not self._client:
             return
-        from lucid_agent_core.mqtt.retained import publish_retained_state
-        publish_retained_state(self._ctx, self.topics, components_list)
+        _publish_retained_state(self._ctx, self.topics, components_list)
 
     def publish_retained_refresh(self, components_list: list[dict[str, Any]]) -> None:
         """Republish all retained snapshots: metadata, status, state, cfg, cfg/logging, cfg/telemetry."""
         if not self._ctx or not self._client:
             return
-        from lucid_agent_core.mqtt.retained import publish_retained_refresh
-        publish_retained_refresh(
+        _publish_retained_refresh(
             self._ctx,
             self.topics,
             components_list,
@@ -498,7 +500,6 @@ class AgentMQTTClient:
         # before the connection was ready and returned early), re-run it now.
         if not self._handlers and self._components:
             logger.info("Re-running add_component_handlers on connect (was called before connection was ready)")
-            from lucid_agent_core.mqtt.component_subscriptions import subscribe_component_topics
             with self._components_lock:
                 components = list(self._components)
             for comp in components:
@@ -515,15 +516,10 @@ class AgentMQTTClient:
 
         if not self._ctx:
             self._publish_status("online")
+            self._connected_evt.set()
             return
 
         try:
-            from lucid_agent_core.core.snapshots import (
-                build_metadata, build_status, build_cfg,
-                build_cfg_logging, build_cfg_telemetry,
-                build_agent_schema,
-            )
-
             ctx = self._ctx
             metadata = build_metadata(self.version)
             ctx.publish(self.topics.metadata(), metadata, retain=True, qos=1)
@@ -535,7 +531,7 @@ class AgentMQTTClient:
             ctx.publish(self.topics.cfg(), build_cfg(cfg), retain=True, qos=1)
             ctx.publish(self.topics.cfg_logging(), build_cfg_logging(cfg), retain=True, qos=1)
             ctx.publish(self.topics.cfg_telemetry(), build_cfg_telemetry(cfg), retain=True, qos=1)
-            ctx.publish(self.topics.schema(), build_agent_schema(), retain=True, qos=1)
+            ctx.publish_bytes(self.topics.schema(), build_agent_schema_bytes(), retain=True, qos=1)
 
             logger.info("Published all retained snapshots on connect")
         except Exception as exc:
@@ -545,6 +541,7 @@ class AgentMQTTClient:
             self._heartbeat.start(self._hb_interval_s)
 
         self._telemetry.start()
+        self._connected_evt.set()
 
     def _on_disconnect(
         self,
@@ -554,13 +551,15 @@ class AgentMQTTClient:
         reason_code: Any,
         properties: Any,
     ) -> None:
+        self._connected_evt.clear()
         if reason_code != 0:
             logger.warning("Unexpected disconnect: %s", reason_code)
         self._heartbeat.stop()
         self._telemetry.stop()
 
     def _on_message(self, client: mqtt.Client, userdata: Any, msg: mqtt.MQTTMessage) -> None:
-        logger.debug("Message received: topic=%s payload_len=%d", msg.topic, len(msg.payload))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Message received: topic=%s payload_len=%d", msg.topic, len(msg.payload))
         handler = self._handlers.get(msg.topic)
         if not handler:
             # Try wildcard subscriptions registered by components.
@@ -573,14 +572,21 @@ class AgentMQTTClient:
                     return
             logger.warning("Unhandled topic: %s", msg.topic)
             return
-        try:
-            payload_str = msg.payload.decode("utf-8")
-        except UnicodeDecodeError as exc:
-            logger.error("Payload decode failed topic=%s err=%s", msg.topic, exc)
-            return
+        # Agent handlers take the raw bytes; only non-ASCII payloads need a
+        # UTF-8 validity check (ASCII is always valid UTF-8).
+        payload = msg.payload
+        if not payload.isascii():
+            try:
+                payload.decode("utf-8")
+            except UnicodeDecodeError as exc:
+                logger.error("Payload decode failed topic=%s err=%s", msg.topic, exc)
+                return
 
         topic = msg.topic
-        request_id = self._extract_request_id(payload_str)
+        # Only the request_id is needed on the network thread (for overload and
+        # cancel results); the full parse happens on the worker.
+        request_id = scan_request_id(payload)
+        parsed = topic in self._parsed_cmd_topics
 
         if not self._inflight_sem.acquire(blocking=False):
             cancelled = self._try_cancel_oldest_pending()
@@ -617,7 +623,10 @@ class AgentMQTTClient:
 
         def _run() -> None:
             try:
-                handler(payload_str)
+                if parsed:
+                    handler(payload, parse_payload(payload))
+                else:
+                    handler(payload)
             except Exception as exc:
                 logger.exception("Unhandled exception in cmd handler topic=%s", topic)
                 self._publish_cmd_failure(topic, request_id, str(exc))
@@ -649,11 +658,12 @@ class AgentMQTTClient:
                 mqtt.CallbackAPIVersion.VERSION2, client_id=self.client_id, protocol=mqtt.MQTTv311
             )
             client.username_pw_set(self.username, self.password)
+            client.max_inflight_messages_set(_MAX_INFLIGHT_MESSAGES)
 
             lwt_payload = {"state": "offline"}
             client.will_set(
                 self.topics.status(),
-                payload=json.dumps(lwt_payload),
+                payload=_json.dumps(lwt_payload),
                 qos=1,
                 retain=True,
             )
@@ -678,6 +688,7 @@ class AgentMQTTClient:
             self._heartbeat.stop()
             self._telemetry.stop()
             self._publish_status("offline")
+            self._teardown_mqtt_logging()
             self._client.loop_stop()
             self._client.disconnect()
         finally:
@@ -687,6 +698,10 @@ class AgentMQTTClient:
     def is_connected(self) -> bool:
         return bool(self._client and self._client.is_connected())
 
+    def wait_connected(self, timeout: Optional[float] = None) -> bool:
+        """Block until the broker connection is up and set up; False on timeout."""
+        return self._connected_evt.wait(timeout)
+
     def subscribe(
         self,
         topic: str,
@@ -719,5 +734,5 @@ class AgentMQTTClient:
         if not self._client:
             raise RuntimeError("MQTT client not connected")
         if isinstance(payload, (dict, list)):
-            payload = json.dumps(payload)
+            payload = _json.dumps(payload)
         return self._client.publish(topic, payload=payload, qos=qos, retain=retain)
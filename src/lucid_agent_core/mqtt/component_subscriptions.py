@@ -5,11 +5,22 @@ Component subscription helpers — subscribe/unsubscribe MQTT cmd topics for com
 from __future__ import annotations
 
 import logging
-from typing import Any
+from typing import Any, Callable
 
 logger = logging.getLogger(__name__)
 
 
+def _with_str_payload(handler: Callable[[str], Any]) -> Callable[..., Any]:
+    """Adapt a component cmd handler to the client's raw-bytes dispatch; components receive str."""
+
+    def dispatch(payload: str | bytes) -> Any:
+        if isinstance(payload, bytes):
+            payload = payload.decode("utf-8")
+        return handler(payload)
+
+    return dispatch
+
+
 def action_to_method_name(action: str) -> str:
     """Convert a command action path (e.g. 'effect/color-wipe') to a handler method name."""
     return "on_cmd_" + action.replace("/", "_").replace("-", "_")
@@ -46,7 +57,7 @@ def subscribe_component_topics(
             continue
         if topic in handlers:
             continue
-        handlers[topic] = comp._make_cmd_handler(action, method)
+        handlers[topic] = _with_str_payload(comp._make_cmd_handler(action, method))
         paho_client.subscribe(topic, qos=1)
         topics_for_cid.add(topic)
         logger.info("Subscribed: %s", topic)
@@ -67,7 +78,7 @@ def subscribe_component_topics(
         else:
             topic = topics.component_cmd_cfg_telemetry_set(component_id)
         if topic not in handlers:
-            handlers[topic] = comp._make_cmd_handler(cfg_action, method)
+            handlers[topic] = _with_str_payload(comp._make_cmd_handler(cfg_action, method))
             paho_client.subscribe(topic, qos=1)
             topics_for_cid.add(topic)
             logger.info("Subscribed: %s", topic)
@@ -9,14 +9,17 @@ import logging
 import threading
 import time
 from dataclasses import dataclass
-from datetime import datetime, timezone
 from typing import Any, Callable, Optional
 
 logger = logging.getLogger(__name__)
 
 
-def _utc_iso() -> str:
-    return datetime.now(timezone.utc).isoformat()
+def _status_prefix(state: str, connected_since_ts: str) -> str:
+    # Everything up to the uptime value; only uptime changes between heartbeats.
+    return (
+        f'{{"state":{json.dumps(state)},'
+        f'"connected_since_ts":{json.dumps(connected_since_ts)},"uptime_s":'
+    )
 
 
 @dataclass(frozen=True, slots=True)
@@ -26,13 +29,8 @@ class StatusPayload:
     uptime_s: float
 
     def to_json(self) -> str:
-        return json.dumps(
-            {
-                "state": self.state,
-                "connected_since_ts": self.connected_since_ts,
-                "uptime_s": self.uptime_s,
-            }
-        )
+        # Same output as a compact json.dumps of the three fields.
+        return f"{_status_prefix(self.state, self.connected_since_ts)}{self.uptime_s!r}}}"
 
 
 class HeartbeatLoop:
@@ -59,6 +57,9 @@ class HeartbeatLoop:
         self._stop_event = threading.Event()
         self._interval_lock = threading.Lock()
         self._interval_s: int = 0
+        # Encoded status prefix for the current connection, owned by the loop thread.
+        self._prefix_ts: Optional[str] = None
+        self._prefix = b""
 
     def start(self, interval_s: int) -> None:
         """Start the heartbeat thread with the given interval (in seconds)."""
@@ -83,6 +84,13 @@ class HeartbeatLoop:
         with self._interval_lock:
             self._interval_s = interval_s
 
+    def _online_status(self, connected_since_ts: str, uptime_s: float) -> bytes:
+        """Encoded online StatusPayload, reusing the prefix while the connection is unchanged."""
+        if connected_since_ts != self._prefix_ts:
+            self._prefix = _status_prefix("online", connected_since_ts).encode("utf-8")
+            self._prefix_ts = connected_since_ts
+        return self._prefix + repr(uptime_s).encode("ascii") + b"}"
+
     def _loop(self) -> None:
         while not self._stop_event.is_set():
             with self._interval_lock:
@@ -97,14 +105,9 @@ class HeartbeatLoop:
             connected_since_ts, connected_ts = info
             try:
                 uptime_s = max(0.0, time.time() - connected_ts)
-                payload = StatusPayload(
-                    state="online",
-                    connected_since_ts=connected_since_ts,
-                    uptime_s=uptime_s,
-                )
                 self._paho_publish(
                     self._status_topic,
-                    payload=payload.to_json(),
+                    payload=self._online_status(connected_since_ts, uptime_s),
                     qos=1,
                     retain=True,
                 )
@@ -9,6 +9,17 @@ import time
 from datetime import datetime, timezone
 from typing import Any, Optional
 
+from lucid_agent_core.core.cmd_context import RETAINED_REPUBLISH_QOS
+from lucid_agent_core.core.snapshots import (
+    build_agent_schema_bytes,
+    build_cfg,
+    build_cfg_logging,
+    build_cfg_telemetry,
+    build_metadata,
+    build_state,
+    build_status,
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -25,10 +36,8 @@ def publish_retained_state(
     Publish retained state with the current components list.
     Call after load_components() so state.components is accurate.
     """
-    from lucid_agent_core.core.snapshots import build_state
-
     state = build_state(components_list)
-    ctx.publish(topics.state(), state, retain=True, qos=1)
+    ctx.publish(topics.state_topic, state, retain=True, qos=1)
     logger.info("Published retained state with %d components", len(components_list))
 
 
@@ -44,18 +53,8 @@ def publish_retained_refresh(
     Republish all retained snapshots: metadata, status, state, cfg, cfg/logging, cfg/telemetry, schema.
     Use after cmd/refresh to refresh topics without a restart.
     """
-    from lucid_agent_core.core.snapshots import (
-        build_metadata,
-        build_status,
-        build_state,
-        build_cfg,
-        build_cfg_logging,
-        build_cfg_telemetry,
-        build_agent_schema,
-    )
-
     metadata = build_metadata(version)
-    ctx.publish(topics.metadata(), metadata, retain=True, qos=1)
+    ctx.publish(topics.metadata_topic, metadata, retain=True, qos=RETAINED_REPUBLISH_QOS)
 
     uptime_s = 0.0
     if connected_ts is not None:
@@ -65,16 +64,28 @@ def publish_retained_refresh(
         connected_since_ts or _utc_iso(),
         uptime_s,
     )
-    ctx.publish(topics.status(), status, retain=True, qos=1)
+    ctx.publish(topics.status_topic, status, retain=True, qos=RETAINED_REPUBLISH_QOS)
 
     state = build_state(components_list)
-    ctx.publish(topics.state(), state, retain=True, qos=1)
+    ctx.publish(topics.state_topic, state, retain=True, qos=RETAINED_REPUBLISH_QOS)
 
     raw_cfg = ctx.config_store.get_cached()
-    ctx.publish(topics.cfg(), build_cfg(raw_cfg), retain=True, qos=1)
-    ctx.publish(topics.cfg_logging(), build_cfg_logging(raw_cfg), retain=True, qos=1)
-    ctx.publish(topics.cfg_telemetry(), build_cfg_telemetry(raw_cfg), retain=True, qos=1)
-    ctx.publish(topics.schema(), build_agent_schema(), retain=True, qos=1)
+    ctx.publish(topics.cfg_topic, build_cfg(raw_cfg), retain=True, qos=RETAINED_REPUBLISH_QOS)
+    ctx.publish(
+        topics.cfg_logging_topic,
+        build_cfg_logging(raw_cfg),
+        retain=True,
+        qos=RETAINED_REPUBLISH_QOS,
+    )
+    ctx.publish(
+        topics.cfg_telemetry_topic,
+        build_cfg_telemetry(raw_cfg),
+        retain=True,
+        qos=RETAINED_REPUBLISH_QOS,
+    )
+    ctx.publish_bytes(
+        topics.schema(), build_agent_schema_bytes(), retain=True, qos=RETAINED_REPUBLISH_QOS
+    )
     logger.info(
         "Published retained refresh (metadata, status, state, cfg, cfg/logging, cfg/telemetry, schema)"
     )
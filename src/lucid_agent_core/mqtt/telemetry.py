@@ -4,30 +4,48 @@ Telemetry loop — publishes per-metric telemetry streams based on config.
 
 from __future__ import annotations
 
-import json
 import logging
 import threading
 import time
 from typing import Any, Callable, Optional
 
+import psutil
+
+from lucid_agent_core import _json
+from lucid_agent_core.core.snapshots import build_cfg_telemetry
+
 logger = logging.getLogger(__name__)
 
 
 def _system_cpu_percent() -> float:
-    import psutil
     return psutil.cpu_percent(interval=0.1)
 
 
 def _system_memory_percent() -> float:
-    import psutil
     return psutil.virtual_memory().percent
 
 
 def _system_disk_percent() -> float:
-    import psutil
     return psutil.disk_usage("/").percent
 
 
+_SAMPLERS: dict[str, Callable[[], float]] = {
+    "cpu_percent": _system_cpu_percent,
+    "memory_percent": _system_memory_percent,
+    "disk_percent": _system_disk_percent,
+}
+
+
+def _sample_metrics(names: list[str]) -> dict[str, float]:
+    """
+    Read the current value of each tracked metric in *names*, in one pass.
+
+    Metrics that are not requested are not read; cpu_percent in particular
+    blocks for its 0.1 s sampling interval.
+    """
+    return {name: _SAMPLERS[name]() for name in names if name in _SAMPLERS}
+
+
 class TelemetryLoop:
     """
     Publishes core telemetry streams (cpu_percent, memory_percent, disk_percent) on a
@@ -62,9 +80,7 @@ class TelemetryLoop:
 
         ctx = self._get_ctx()
         if ctx is not None:
-            from lucid_agent_core.core.snapshots import build_cfg_telemetry
-
-            raw_cfg = ctx.config_store.get_cached()
+            raw_cfg = ctx.config_store.peek_cached()
             metrics_cfg = build_cfg_telemetry(raw_cfg)
             enabled = [
                 name for name, mcfg in metrics_cfg.items()
@@ -152,9 +168,7 @@ class TelemetryLoop:
                 continue
 
             try:
-                from lucid_agent_core.core.snapshots import build_cfg_telemetry
-
-                raw_cfg = ctx.config_store.get_cached()
+                raw_cfg = ctx.config_store.peek_cached()
                 metrics_cfg = build_cfg_telemetry(raw_cfg)
 
                 if not metrics_cfg:
@@ -163,17 +177,22 @@ class TelemetryLoop:
                         break
                     continue
 
-                state_values = {
-                    "cpu_percent": _system_cpu_percent(),
-                    "memory_percent": _system_memory_percent(),
-                    "disk_percent": _system_disk_percent(),
-                }
+                state_values = _sample_metrics(
+                    [
+                        name
+                        for name, mcfg in metrics_cfg.items()
+                        if isinstance(mcfg, dict) and mcfg.get("enabled", False)
+                    ]
+                )
 
                 published_count = 0
                 for metric_name, metric_cfg in metrics_cfg.items():
                     if not isinstance(metric_cfg, dict):
                         logger.debug("Telemetry loop: skipping %s (not a dict)", metric_name)
                         continue
+                    if not metric_cfg.get("enabled", False):
+                        logger.debug("Telemetry loop: skipping %s (disabled)", metric_name)
+                        continue
                     if metric_name not in state_values:
                         logger.debug("Telemetry loop: skipping %s (not tracked)", metric_name)
                         continue
@@ -182,7 +201,7 @@ class TelemetryLoop:
                     if self._should_publish(metric_name, value, metric_cfg):
                         try:
                             topic = self._topics.telemetry(metric_name)
-                            payload = json.dumps({"value": value})
+                            payload = _json.dumps({"value": value})
                             self._paho_publish(topic, payload, qos=0, retain=False)
                             self._last[metric_name] = (value, time.time())
                             published_count += 1
@@ -12,11 +12,27 @@ Component topics: components/<component_id>/...
 from __future__ import annotations
 
 import re
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 _AGENT_ID_RE = re.compile(r"^[a-z0-9_]+$")
 _COMPONENT_ID_RE = re.compile(r"^[a-z0-9_]+$")
 
+# Agent command actions whose evt/<action>/result topics are precomputed per schema.
+_RESULT_ACTIONS = (
+    "ping",
+    "restart",
+    "refresh",
+    "cfg/set",
+    "cfg/logging/set",
+    "cfg/telemetry/set",
+    "components/install",
+    "components/uninstall",
+    "components/enable",
+    "components/disable",
+    "components/upgrade",
+    "core/upgrade",
+)
+
 
 class TopicSchemaError(ValueError):
     """Raised when an invalid identifier is used to construct topics."""
@@ -47,8 +63,41 @@ class TopicSchema:
 
     agent_username: str  # agent_id
 
+    # Precomputed result topics (set in __post_init__), e.g. evt_components_install_result.
+    evt_ping_result: str = field(init=False, repr=False, compare=False)
+    evt_restart_result: str = field(init=False, repr=False, compare=False)
+    evt_refresh_result: str = field(init=False, repr=False, compare=False)
+    evt_cfg_set_result: str = field(init=False, repr=False, compare=False)
+    evt_cfg_logging_set_result: str = field(init=False, repr=False, compare=False)
+    evt_cfg_telemetry_set_result: str = field(init=False, repr=False, compare=False)
+    evt_components_install_result: str = field(init=False, repr=False, compare=False)
+    evt_components_uninstall_result: str = field(init=False, repr=False, compare=False)
+    evt_components_enable_result: str = field(init=False, repr=False, compare=False)
+    evt_components_disable_result: str = field(init=False, repr=False, compare=False)
+    evt_components_upgrade_result: str = field(init=False, repr=False, compare=False)
+    evt_core_upgrade_result: str = field(init=False, repr=False, compare=False)
+    _result_topics: dict[str, str] = field(init=False, repr=False, compare=False)
+
+    # Precomputed retained topics republished from command handlers.
+    metadata_topic: str = field(init=False, repr=False, compare=False)
+    status_topic: str = field(init=False, repr=False, compare=False)
+    state_topic: str = field(init=False, repr=False, compare=False)
+    cfg_topic: str = field(init=False, repr=False, compare=False)
+    cfg_logging_topic: str = field(init=False, repr=False, compare=False)
+    cfg_telemetry_topic: str = field(init=False, repr=False, compare=False)
+
     def __post_init__(self) -> None:
         _validate_agent_id(self.agent_username)
+        base = self.base
+        result_topics = {action: f"{base}/evt/{action}/result" for action in _RESULT_ACTIONS}
+        object.__setattr__(self, "_result_topics", result_topics)
+        for action, topic in result_topics.items():
+            attr = "evt_" + action.replace("/", "_") + "_result"
+            object.__setattr__(self, attr, topic)
+        for name in ("metadata", "status", "state", "cfg"):
+            object.__setattr__(self, f"{name}_topic", f"{base}/{name}")
+        object.__setattr__(self, "cfg_logging_topic", f"{base}/cfg/logging")
+        object.__setattr__(self, "cfg_telemetry_topic", f"{base}/cfg/telemetry")
 
     @property
     def base(self) -> str:
@@ -58,22 +107,22 @@ class TopicSchema:
     # Agent retained
     # -------------------------
     def metadata(self) -> str:
-        return f"{self.base}/metadata"
+        return self.metadata_topic
 
     def status(self) -> str:
-        return f"{self.base}/status"
+        return self.status_topic
 
     def state(self) -> str:
-        return f"{self.base}/state"
+        return self.state_topic
 
     def cfg(self) -> str:
-        return f"{self.base}/cfg"
+        return self.cfg_topic
 
     def cfg_telemetry(self) -> str:
-        return f"{self.base}/cfg/telemetry"
+        return self.cfg_telemetry_topic
 
     def cfg_logging(self) -> str:
-        return f"{self.base}/cfg/logging"
+        return self.cfg_logging_topic
 
     def schema(self) -> str:
         return f"{self.base}/schema"
@@ -90,6 +139,12 @@ class TopicSchema:
     # -------------------------
     # Agent commands
     # -------------------------
+    def cmd(self, action: str) -> str:
+        """Agent command topic for any action, e.g. 'ping', 'components/install'."""
+        if not action:
+            raise TopicSchemaError("action must be non-empty")
+        return f"{self.base}/cmd/{action}"
+
     def cmd_ping(self) -> str:
         return f"{self.base}/cmd/ping"
 
@@ -130,10 +185,11 @@ class TopicSchema:
     # Agent results
     # -------------------------
     def evt_result(self, action: str) -> str:
-        return f"{self.base}/evt/{action}/result"
+        topic = self._result_topics.get(action)
+        return topic if topic is not None else f"{self.base}/evt/{action}/result"
 
     def evt_components_result(self, action: str) -> str:
-        return f"{self.base}/evt/components/{action}/result"
+        return self.evt_result(f"components/{action}")
 
     # -------------------------
     # Component topics
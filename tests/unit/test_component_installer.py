@@ -286,3 +286,16 @@ def test_extract_version_best_effort_reads_from_source():
 def test_extract_version_best_effort_missing_returns_empty():
     assert ci.extract_version_best_effort("{}") == ""
     assert ci.extract_version_best_effort("not json") == ""
+
+
+def test_validation_error_decodes_payload_once(monkeypatch):
+    p = json.loads(valid_payload())
+    p["source"]["sha256"] = "not-a-sha"
+    loads = MagicMock(wraps=ci._json.loads)
+    monkeypatch.setattr(ci._json, "loads", loads)
+
+    res = ci.handle_install_component(json.dumps(p).encode())
+
+    assert res.ok is False
+    assert (res.request_id, res.component_id, res.version) == ("req-1", "cpu", "1.2.3")
+    assert loads.call_count == 1
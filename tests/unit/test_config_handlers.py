@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+from lucid_agent_core.core.cmd_context import CoreCommandContext
+from lucid_agent_core.core.config import ConfigStore
+from lucid_agent_core.core.handlers import on_cfg_logging_set, on_cfg_set, on_cfg_telemetry_set
+from lucid_agent_core.mqtt_topics import TopicSchema
+
+
+@pytest.fixture
+def ctx(tmp_path, monkeypatch):
+    monkeypatch.setenv("LUCID_AGENT_BASE_DIR", str(tmp_path))
+    store = ConfigStore()
+    store.load()
+    return CoreCommandContext(
+        mqtt=MagicMock(),
+        topics=TopicSchema("test"),
+        agent_id="test",
+        agent_version="1.0.0",
+        config_store=store,
+    )
+
+
+def _published_topics(ctx) -> list[str]:
+    return [c[0][0] for c in ctx.mqtt.publish.call_args_list]
+
+
+def test_cfg_set_publishes_cfg_when_changed(ctx):
+    on_cfg_set(ctx, json.dumps({"request_id": "c1", "set": {"heartbeat_s": 45}}))
+
+    assert ctx.topics.cfg() in _published_topics(ctx)
+    ctx.mqtt.set_heartbeat_interval.assert_called_once_with(45)
+
+
+def test_cfg_set_skips_cfg_publish_when_unchanged(ctx):
+    on_cfg_set(ctx, json.dumps({"request_id": "c1", "set": {"heartbeat_s": 45}}))
+    ctx.mqtt.reset_mock()
+
+    on_cfg_set(ctx, json.dumps({"request_id": "c2", "set": {"heartbeat_s": 45}}))
+
+    topics = _published_topics(ctx)
+    assert ctx.topics.cfg() not in topics
+    assert topics == [ctx.topics.evt_result("cfg/set")]
+    assert json.loads(ctx.mqtt.publish.call_args[0][1])["ok"] is True
+    ctx.mqtt.set_heartbeat_interval.assert_not_called()
+
+
+def test_cfg_logging_and_telemetry_set_skip_retained_publish_when_unchanged(ctx):
+    on_cfg_logging_set(ctx, json.dumps({"request_id": "l1", "set": {"log_level": "INFO"}}))
+    on_cfg_telemetry_set(ctx, json.dumps({"request_id": "t1", "set": {"cpu_percent": True}}))
+    ctx.mqtt.reset_mock()
+
+    on_cfg_logging_set(ctx, json.dumps({"request_id": "l2", "set": {"log_level": "INFO"}}))
+    on_cfg_telemetry_set(ctx, json.dumps({"request_id": "t2", "set": {"cpu_percent": True}}))
+
+    assert _published_topics(ctx) == [
+        ctx.topics.evt_cfg_logging_set_result,
+        ctx.topics.evt_cfg_telemetry_set_result,
+    ]
+
+
+def test_unchanged_set_does_not_rewrite_config_file(ctx, monkeypatch):
+    ctx.config_store.apply_set_general({"request_id": "r1", "set": {"heartbeat_s": 45}})
+    save = MagicMock(wraps=ctx.config_store.save)
+    monkeypatch.setattr(ctx.config_store, "save", save)
+
+    _, result = ctx.config_store.apply_set_general({"request_id": "r2", "set": {"heartbeat_s": 45}})
+
+    assert result["ok"] is True
+    save.assert_not_called()
+
+
+def test_apply_log_level_skips_set_level_when_unchanged(monkeypatch):
+    import logging
+
+    from lucid_agent_core.core.log_config import apply_log_level
+
+    root = logging.getLogger()
+    monkeypatch.setattr(root, "level", logging.WARNING)
+    set_level = MagicMock(wraps=root.setLevel)
+    monkeypatch.setattr(root, "setLevel", set_level)
+
+    apply_log_level({"log_level": "WARNING"})
+    set_level.assert_not_called()
+
+    apply_log_level({"log_level": "ERROR"})
+    set_level.assert_called_once_with(logging.ERROR)
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [("INFO", 20), (" warning ", 30), ("warn", 30), ("15", 15), ("", 20), ("bogus", 20)],
+)
+def test_parse_level_names_digits_and_fallback(raw, expected):
+    from lucid_agent_core.core.log_config import _parse_level
+
+    assert _parse_level(raw) == expected
+
+
+def test_peek_cached_returns_cache_without_copy_and_tracks_saves(ctx):
+    store = ctx.config_store
+    before = store.peek_cached()
+    assert store.peek_cached() is before
+
+    old_heartbeat = before.get("heartbeat_s", 30)
+    store.apply_set_general({"request_id": "p1", "set": {"heartbeat_s": old_heartbeat + 1}})
+
+    assert store.peek_cached() is not before
+    assert store.peek_cached()["heartbeat_s"] == old_heartbeat + 1
+    assert before.get("heartbeat_s", 30) == old_heartbeat
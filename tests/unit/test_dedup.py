@@ -1,6 +1,21 @@
 """Tests for request-ID deduplication."""
 
-from lucid_agent_core.core.handlers._dedup import _SeenRequestIds
+from dataclasses import dataclass
+from unittest.mock import MagicMock
+
+from lucid_agent_core.core.handlers._dedup import (
+    _RecentResults,
+    _SeenRequestIds,
+    _seen_request_ids,
+    check_duplicate,
+    remember_result,
+)
+
+
+@dataclass(frozen=True)
+class _Result:
+    request_id: str
+    ok: bool
 
 
 def test_new_id_is_not_duplicate():
@@ -42,3 +57,34 @@ def test_size_stays_bounded():
         seen.check_and_add(str(i))
     assert len(seen._queue) == maxsize
     assert len(seen._seen) == maxsize
+
+
+def test_recent_results_get_returns_stored_result():
+    results = _RecentResults()
+    results.put("abc", "topic/result", {"request_id": "abc", "ok": True})
+    assert results.get("abc") == ("topic/result", {"request_id": "abc", "ok": True})
+    assert results.get("missing") is None
+
+
+def test_recent_results_evicts_least_recently_used():
+    results = _RecentResults(maxsize=2)
+    results.put("a", "t", {})
+    results.put("b", "t", {})
+    results.get("a")
+    results.put("c", "t", {})
+    assert results.get("a") is not None
+    assert results.get("b") is None
+    assert results.get("c") is not None
+
+
+def test_duplicate_replays_cached_result():
+    ctx = MagicMock()
+    result = _Result(request_id="replay-1", ok=True)
+    _seen_request_ids.check_and_add("replay-1")
+    remember_result("replay-1", "topic/result", result)
+
+    assert check_duplicate(ctx, "replay-1", "topic/result") is True
+    ctx.publish_dataclass.assert_called_once_with(
+        "topic/result", result, retain=False, qos=1
+    )
+    ctx.publish.assert_not_called()
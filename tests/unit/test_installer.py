@@ -31,10 +31,24 @@ def sandbox_paths(monkeypatch, tmp_path: Path):
     # Mock pwd lookups so tests run on macOS (no 'lucid' user)
     fake_pw = MagicMock(pw_uid=1001, pw_gid=1001)
     monkeypatch.setattr(inst.pwd, "getpwnam", lambda name: fake_pw)
+    # Recursive chown runs in-process; don't re-own temp files for real
+    monkeypatch.setattr(inst.os, "chown", lambda *args, **kwargs: None)
 
     return tmp_path
 
 
+@pytest.fixture
+def chown_calls(monkeypatch):
+    """
+    Record in-process chown calls as (path, uid, gid) without changing ownership.
+    """
+    calls = []
+    monkeypatch.setattr(
+        inst.os, "chown", lambda path, uid, gid, **kwargs: calls.append((str(path), uid, gid))
+    )
+    return calls
+
+
 @pytest.fixture
 def mock_run(monkeypatch):
     """
@@ -44,11 +58,6 @@ def mock_run(monkeypatch):
 
     def fake_run(cmd, check=True):
         calls.append((tuple(cmd), check))
-        # Mimic CalledProcessError for "id lucid" when user doesn't exist
-        if cmd[0] == "id" and cmd[1] == "lucid":
-            # By default, user exists (no error)
-            # Tests can override this by checking calls before test
-            pass
         return MagicMock(returncode=0)
 
     monkeypatch.setattr(inst, "_run", fake_run)
@@ -58,29 +67,26 @@ def mock_run(monkeypatch):
 @pytest.fixture
 def mock_run_user_missing(monkeypatch):
     """
-    Mock _run where 'id lucid' raises CalledProcessError (user doesn't exist).
+    Mock _run with the system user reported missing.
     """
     calls = []
 
     def fake_run(cmd, check=True):
         calls.append((tuple(cmd), check))
-        if cmd[0] == "id" and cmd[1] == "lucid":
-            raise subprocess.CalledProcessError(1, cmd)
         return MagicMock(returncode=0)
 
     monkeypatch.setattr(inst, "_run", fake_run)
+    monkeypatch.setattr(inst, "_user_exists", lambda: False)
     return calls
 
 
-def test_ensure_user_creates_user_if_missing(sandbox_paths, mock_run_user_missing):
+def test_ensure_user_creates_user_if_missing(sandbox_paths, mock_run_user_missing, chown_calls):
     """Test that _ensure_user creates lucid user with correct parameters."""
     inst._ensure_user()
 
-    # Should call: id lucid (which raises CalledProcessError)
-    # Then call: useradd -m -d /home/lucid -s /bin/bash lucid
+    # Should call: useradd -m -d /home/lucid -s /bin/bash lucid
     cmds = [c[0] for c in mock_run_user_missing]
 
-    assert ("id", "lucid") in cmds
     assert (
         "useradd",
         "-m",
@@ -90,10 +96,12 @@ def test_ensure_user_creates_user_if_missing(sandbox_paths, mock_run_user_missin
         "/bin/bash",
         "lucid",
     ) in cmds
-    assert ("chown", "1001:1001", str(inst.SYSTEM_HOME)) in cmds
+    assert (str(inst.SYSTEM_HOME), 1001, 1001) in chown_calls
 
 
-def test_ensure_user_reuses_existing_home_if_missing(sandbox_paths, mock_run_user_missing):
+def test_ensure_user_reuses_existing_home_if_missing(
+    sandbox_paths, mock_run_user_missing, chown_calls
+):
     """Test that _ensure_user reuses a pre-existing home directory."""
     inst.SYSTEM_HOME.mkdir(parents=True, exist_ok=True)
 
@@ -101,7 +109,6 @@ def test_ensure_user_reuses_existing_home_if_missing(sandbox_paths, mock_run_use
 
     cmds = [c[0] for c in mock_run_user_missing]
 
-    assert ("id", "lucid") in cmds
     assert (
         "useradd",
         "-M",
@@ -111,10 +118,12 @@ def test_ensure_user_reuses_existing_home_if_missing(sandbox_paths, mock_run_use
         "/bin/bash",
         "lucid",
     ) in cmds
-    assert ("chown", "1001:1001", str(inst.SYSTEM_HOME)) in cmds
+    assert (str(inst.SYSTEM_HOME), 1001, 1001) in chown_calls
 
 
-def test_ensure_user_falls_back_when_useradd_m_cannot_create_home(sandbox_paths, monkeypatch):
+def test_ensure_user_falls_back_when_useradd_m_cannot_create_home(
+    sandbox_paths, monkeypatch, chown_calls
+):
     """Test that _ensure_user pre-creates the home directory and retries."""
     calls = []
     create_cmd = ("useradd", "-m", "-d", str(inst.SYSTEM_HOME), "-s", "/bin/bash", "lucid")
@@ -122,13 +131,12 @@ def test_ensure_user_falls_back_when_useradd_m_cannot_create_home(sandbox_paths,
 
     def fake_run(cmd, check=True):
         calls.append((tuple(cmd), check))
-        if cmd[0] == "id" and cmd[1] == "lucid":
-            raise subprocess.CalledProcessError(1, cmd)
         if tuple(cmd) == create_cmd:
             raise subprocess.CalledProcessError(12, cmd)
         return MagicMock(returncode=0)
 
     monkeypatch.setattr(inst, "_run", fake_run)
+    monkeypatch.setattr(inst, "_user_exists", lambda: False)
 
     inst._ensure_user()
 
@@ -136,7 +144,7 @@ def test_ensure_user_falls_back_when_useradd_m_cannot_create_home(sandbox_paths,
     assert create_cmd in cmds
     assert reuse_cmd in cmds
     assert inst.SYSTEM_HOME.is_dir()
-    assert ("chown", "1001:1001", str(inst.SYSTEM_HOME)) in cmds
+    assert (str(inst.SYSTEM_HOME), 1001, 1001) in chown_calls
 
 
 def test_ensure_user_rejects_non_directory_home(sandbox_paths, mock_run_user_missing):
@@ -150,16 +158,15 @@ def test_ensure_user_rejects_non_directory_home(sandbox_paths, mock_run_user_mis
     assert mock_run_user_missing == []
 
 
-def test_ensure_user_skips_if_exists(sandbox_paths, mock_run):
+def test_ensure_user_skips_if_exists(sandbox_paths, mock_run, chown_calls):
     """Test that _ensure_user doesn't call useradd if user exists."""
     inst._ensure_user()
 
     cmds = [c[0] for c in mock_run]
 
-    # Should only check id, not call useradd
-    assert ("id", "lucid") in cmds
-    assert not any("useradd" in cmd for cmd in cmds)
-    assert ("chown", "1001:1001", str(inst.SYSTEM_HOME)) in cmds
+    # User lookup goes through pwd; no id subprocess and no useradd
+    assert not any(cmd[0] in ("id", "useradd") for cmd in cmds)
+    assert (str(inst.SYSTEM_HOME), 1001, 1001) in chown_calls
 
 
 def test_install_cli_with_local_wheel(sandbox_paths, mock_run, monkeypatch, tmp_path):
@@ -195,7 +202,16 @@ def test_install_cli_with_local_wheel(sandbox_paths, mock_run, monkeypatch, tmp_
 
     # Verify pip install was called with wheel path (via sudo -u SYSTEM_USER)
     cmds = [c[0] for c in mock_run]
-    expected_cmd = ("sudo", "-u", inst.SYSTEM_USER, str(pip_path), "install", "--upgrade", str(wheel_path))
+    expected_cmd = (
+        "sudo",
+        "-u",
+        inst.SYSTEM_USER,
+        str(pip_path),
+        "install",
+        "--no-compile",
+        "--upgrade",
+        str(wheel_path),
+    )
     assert expected_cmd in cmds
 
 
@@ -203,7 +219,7 @@ def test_install_cli_from_github_when_no_wheel(sandbox_paths, mock_run, monkeypa
     """Test that install falls back to GitHub release when no wheel provided."""
     # Setup
     monkeypatch.setattr(inst.os, "geteuid", lambda: 0)
-    monkeypatch.setattr(inst, "pkg_version", lambda x: "1.2.3")
+    monkeypatch.setattr(inst, "_pkg_version", lambda: "1.2.3")
     
     # Create fake venv and pip
     venv_bin = inst.VENV_DIR / "bin"
@@ -244,6 +260,23 @@ def test_install_cli_from_github_when_no_wheel(sandbox_paths, mock_run, monkeypa
     assert "v1.2.3" in github_url
 
 
+def test_install_cli_skips_release_download_when_version_installed(
+    sandbox_paths, mock_run, monkeypatch
+):
+    """Test that a re-install of the same release version does not run pip."""
+    monkeypatch.setattr(inst, "_pkg_version", lambda: "1.2.3")
+    monkeypatch.setattr(inst, "_venv_pkg_version", lambda venv_dir: "1.2.3")
+
+    venv_bin = inst.VENV_DIR / "bin"
+    venv_bin.mkdir(parents=True, exist_ok=True)
+    (venv_bin / "pip").write_text("")
+    (venv_bin / "lucid-agent-core").write_text("")
+
+    inst._install_cli_into_venv(None)
+
+    assert not any("install" in c[0] for c in mock_run)
+
+
 def test_install_service_with_wheel_argument(sandbox_paths, mock_run, monkeypatch, tmp_path):
     """Test full install_service with --wheel argument."""
     # Setup
@@ -273,8 +306,8 @@ def test_install_service_with_wheel_argument(sandbox_paths, mock_run, monkeypatc
     monkeypatch.setattr(inst, "_install_cli_into_venv", fake_install)
     
     # Mock systemd
-    monkeypatch.setattr(inst, "_write_systemd_unit", lambda: None)
-    monkeypatch.setattr(inst, "_reload_and_enable", lambda: None)
+    monkeypatch.setattr(inst, "_write_systemd_unit", lambda: False)
+    monkeypatch.setattr(inst, "_reload_and_enable", lambda reload=True: None)
     
     # Run
     inst.install_service(wheel_path)
@@ -292,8 +325,8 @@ def test_install_service_with_env_var_wheel(sandbox_paths, mock_run, monkeypatch
     monkeypatch.setattr(inst, "_ensure_dirs", lambda: None)
     monkeypatch.setattr(inst, "_ensure_env_file", lambda: None)
     monkeypatch.setattr(inst, "_create_venv", lambda: None)
-    monkeypatch.setattr(inst, "_write_systemd_unit", lambda: None)
-    monkeypatch.setattr(inst, "_reload_and_enable", lambda: None)
+    monkeypatch.setattr(inst, "_write_systemd_unit", lambda: False)
+    monkeypatch.setattr(inst, "_reload_and_enable", lambda reload=True: None)
     
     # Create local wheel
     wheel_path = tmp_path / "env_test.whl"
@@ -324,8 +357,8 @@ def test_install_service_github_fallback_when_no_wheel(sandbox_paths, mock_run,
     monkeypatch.setattr(inst, "_ensure_dirs", lambda: None)
     monkeypatch.setattr(inst, "_ensure_env_file", lambda: None)
     monkeypatch.setattr(inst, "_create_venv", lambda: None)
-    monkeypatch.setattr(inst, "_write_systemd_unit", lambda: None)
-    monkeypatch.setattr(inst, "_reload_and_enable", lambda: None)
+    monkeypatch.setattr(inst, "_write_systemd_unit", lambda: False)
+    monkeypatch.setattr(inst, "_reload_and_enable", lambda reload=True: None)
     
     # Mock install
     install_called_with = []
@@ -355,6 +388,16 @@ def test_env_file_not_overwritten_if_exists(sandbox_paths, mock_run, monkeypatch
     assert inst.ENV_PATH.read_text() == "EXISTING_CONFIG\n"
 
 
+def test_env_file_created_as_exact_copy_of_packaged_example(sandbox_paths, mock_run):
+    """Test that a new env file is a byte-for-byte copy of env.example."""
+    inst.ENV_PATH.parent.mkdir(parents=True, exist_ok=True)
+
+    inst._ensure_env_file()
+
+    packaged = inst._pkg_resources().joinpath("env.example").read_bytes()
+    assert inst.ENV_PATH.read_bytes() == packaged
+
+
 def test_detect_python_prefers_python311(monkeypatch):
     """Test that _detect_python prefers python3.11 if available."""
     monkeypatch.setattr(inst.shutil, "which", lambda x: "/usr/bin/python3.11" if x == "python3.11" else None)
@@ -384,6 +427,14 @@ def test_reload_and_enable_calls_systemctl(mock_run):
     assert ("systemctl", "enable", "lucid-agent-core") in cmds
 
 
+def test_reload_and_enable_skips_daemon_reload_when_unit_unchanged(mock_run):
+    inst._reload_and_enable(reload=False)
+
+    cmds = [c[0] for c in mock_run]
+    assert ("systemctl", "daemon-reload") not in cmds
+    assert ("systemctl", "enable", "lucid-agent-core") in cmds
+
+
 def test_write_systemd_unit_uses_overridden_user_and_base_dir(sandbox_paths, monkeypatch):
     """Test that the generated unit reflects configured user and base path."""
     monkeypatch.setattr(inst, "SYSTEM_USER", "forfaly")
@@ -396,7 +447,8 @@ def test_write_systemd_unit_uses_overridden_user_and_base_dir(sandbox_paths, mon
     monkeypatch.setattr(inst.pwd, "getpwnam", lambda name: fake_pw)
     inst.UNIT_PATH.parent.mkdir(parents=True, exist_ok=True)
 
-    inst._write_systemd_unit()
+    assert inst._write_systemd_unit() is True
+    assert inst._write_systemd_unit() is False
 
     unit = inst.UNIT_PATH.read_text()
     assert "User=forfaly" in unit
@@ -406,3 +458,106 @@ def test_write_systemd_unit_uses_overridden_user_and_base_dir(sandbox_paths, mon
     assert "ExecStart=/home/forfaly/lucid-agent-core/venv/bin/lucid-agent-core run" in unit
     assert "ReadWritePaths=/home/forfaly/lucid-agent-core" in unit
     assert "Environment=LUCID_AGENT_BASE_DIR=/home/forfaly/lucid-agent-core" in unit
+
+
+def test_chown_tree_walks_tree_without_following_symlinks(monkeypatch, tmp_path):
+    """Test that _chown_tree re-owns every entry once and never follows symlinks."""
+    root = tmp_path / "venv"
+    (root / "bin").mkdir(parents=True)
+    (root / "bin" / "pip").write_text("")
+    (root / "bin" / "python").symlink_to(tmp_path / "outside")
+    calls = []
+    monkeypatch.setattr(
+        inst.os,
+        "chown",
+        lambda path, uid, gid, follow_symlinks=True: calls.append((str(path), follow_symlinks)),
+    )
+
+    inst._chown_tree(root, 1001, 1001)
+
+    assert calls[0] == (str(root), True)
+    assert sorted(calls[1:]) == [
+        (str(root / "bin"), False),
+        (str(root / "bin" / "pip"), False),
+        (str(root / "bin" / "python"), False),
+    ]
+
+
+def test_chown_tree_skips_entries_already_owned(monkeypatch, tmp_path):
+    """Test that _chown_tree leaves correctly owned entries untouched."""
+    root = tmp_path / "data"
+    (root / "sub").mkdir(parents=True)
+    (root / "sub" / "file").write_text("")
+    calls = []
+    monkeypatch.setattr(inst.os, "chown", lambda *args, **kwargs: calls.append(args[0]))
+
+    st = root.stat()
+    inst._chown_tree(root, st.st_uid, st.st_gid)
+
+    assert calls == []
+
+
+def test_ensure_venv_permissions_skips_missing_venv(sandbox_paths, monkeypatch):
+    """Test that a missing venv is skipped but errors from the walk propagate."""
+    monkeypatch.setattr(inst, "_chown_tree", MagicMock())
+    inst._ensure_venv_permissions()
+    inst._chown_tree.assert_not_called()
+
+    inst.VENV_DIR.mkdir(parents=True)
+    inst._chown_tree.side_effect = FileNotFoundError("vanished mid-walk")
+    with pytest.raises(FileNotFoundError):
+        inst._ensure_venv_permissions()
+
+
+def test_chown_tree_fails_on_unlistable_directory(monkeypatch, tmp_path):
+    """Test that _chown_tree raises instead of skipping a directory it cannot list."""
+    root = tmp_path / "venv"
+    (root / "lib").mkdir(parents=True)
+    monkeypatch.setattr(inst.os, "chown", lambda *args, **kwargs: None)
+    real_scandir = inst.os.scandir
+
+    def scandir(path):
+        if str(path) == str(root / "lib"):
+            raise PermissionError(13, "Permission denied", str(path))
+        return real_scandir(path)
+
+    monkeypatch.setattr(inst.os, "scandir", scandir)
+
+    with pytest.raises(PermissionError):
+        inst._chown_tree(root, 1001, 1001)
+
+
+def test_user_exists_uses_pwd_lookup(monkeypatch):
+    """Test that _user_exists maps a missing passwd entry to False."""
+
+    def missing(name):
+        raise KeyError(name)
+
+    monkeypatch.setattr(inst.pwd, "getpwnam", missing)
+    assert inst._user_exists() is False
+
+    monkeypatch.setattr(inst.pwd, "getpwnam", lambda name: MagicMock(pw_uid=1001, pw_gid=1001))
+    assert inst._user_exists() is True
+
+
+def test_ensure_dirs_only_chmods_on_mode_change(sandbox_paths, monkeypatch):
+    """Test that _ensure_dirs sets modes on first run and leaves them alone on re-run."""
+    chmods = []
+    real_chmod = inst.os.chmod
+
+    def recording_chmod(path, mode):
+        chmods.append((Path(path), mode))
+        real_chmod(path, mode)
+
+    monkeypatch.setattr(inst.os, "chmod", recording_chmod)
+
+    inst._ensure_dirs()
+    assert (inst.BASE_DIR / "data", 0o750) in chmods
+
+    chmods.clear()
+    inst._ensure_dirs()
+    assert chmods == []
+
+
+def test_venv_pkg_version_is_none_without_interpreter(tmp_path):
+    assert inst._venv_pkg_version(tmp_path / "venv") is None
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+
+import pytest
+
+from lucid_agent_core import _json
+
+
+@dataclass(frozen=True, slots=True)
+class _Result:
+    request_id: str
+    ok: bool
+    error: str | None = None
+
+
+def test_dumps_encodes_dataclasses_compactly_as_bytes():
+    out = _json.dumps({"result": _Result("r1", True)})
+    assert out == b'{"result":{"request_id":"r1","ok":true,"error":null}}'
+    assert _json.dumps(_Result("r2", False, "boom")) == (
+        b'{"request_id":"r2","ok":false,"error":"boom"}'
+    )
+
+
+def test_dumps_rejects_unknown_types():
+    with pytest.raises(TypeError):
+        _json.dumps(object())
+    with pytest.raises(TypeError):
+        _json.dumps(_Result)
+
+
+def test_dumps_stdlib_fallback_matches(monkeypatch):
+    obj = {"request_id": "r1", "components": [{"id": 1}], 2: _Result("r", True)}
+    fast = _json.dumps(obj)
+    monkeypatch.setattr(_json, "orjson", None)
+    assert _json.dumps(obj) == fast
+
+
+def test_agent_schema_bytes_match_schema_dict():
+    from lucid_agent_core.core.snapshots import build_agent_schema, build_agent_schema_bytes
+
+    assert json.loads(build_agent_schema_bytes()) == build_agent_schema()
@@ -2,6 +2,7 @@
 Tests for component lifecycle commands (install, uninstall, enable, disable).
 """
 import json
+import threading
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -70,7 +71,7 @@ def test_enable_command_updates_registry_and_state(mock_ctx, mock_registry, monk
     payload = json.dumps({"request_id": "req123", "component_id": "fixture_cpu"})
 
     with patch("lucid_agent_core.core.handlers.component_handlers.load_registry") as mock_load:
-        with patch("lucid_agent_core.core.handlers.component_handlers.write_registry") as mock_write:
+        with patch("lucid_agent_core.core.handlers.component_handlers.write_registry_async") as mock_write:
             mock_load.return_value = {
                 "fixture_cpu": {
                     "component_id": "fixture_cpu",
@@ -108,7 +109,7 @@ def test_disable_command_updates_registry_and_state(mock_ctx, mock_registry, mon
     payload = json.dumps({"request_id": "req123", "component_id": "fixture_cpu"})
 
     with patch("lucid_agent_core.core.handlers.component_handlers.load_registry") as mock_load:
-        with patch("lucid_agent_core.core.handlers.component_handlers.write_registry") as mock_write:
+        with patch("lucid_agent_core.core.handlers.component_handlers.write_registry_async") as mock_write:
             mock_load.return_value = {
                 "fixture_cpu": {
                     "component_id": "fixture_cpu",
@@ -132,6 +133,23 @@ def test_disable_command_updates_registry_and_state(mock_ctx, mock_registry, mon
             assert len(state_publishes) > 0
 
 
+def test_enable_already_enabled_component_skips_write_and_state(mock_ctx):
+    """Idempotent enable publishes success without rewriting the registry or state."""
+    payload = json.dumps({"request_id": "req-idem", "component_id": "fixture_cpu"})
+
+    with patch("lucid_agent_core.core.handlers.component_handlers.load_registry") as mock_load:
+        with patch("lucid_agent_core.core.handlers.component_handlers.write_registry_async") as mock_write:
+            mock_load.return_value = {"fixture_cpu": {"version": "1.0.0", "enabled": True}}
+
+            on_components_enable(mock_ctx, payload)
+
+            mock_write.assert_not_called()
+
+    topics = [c[0][0] for c in mock_ctx.mqtt.publish.call_args_list]
+    assert topics == [mock_ctx.topics.evt_components_enable_result]
+    assert json.loads(mock_ctx.mqtt.publish.call_args[0][1])["ok"] is True
+
+
 def test_enable_missing_component_id_returns_error(mock_ctx):
     """Test enable without component_id returns error."""
     payload = json.dumps({"request_id": "req123"})
@@ -188,7 +206,7 @@ def test_duplicate_request_id_rejected_with_error(mock_ctx):
         mock_load.return_value = {
             "fixture_cpu": {"component_id": "fixture_cpu", "version": "1.0.0", "enabled": True}
         }
-        with patch("lucid_agent_core.core.handlers.component_handlers.write_registry"):
+        with patch("lucid_agent_core.core.handlers.component_handlers.write_registry_async"):
             # First call — should succeed
             on_components_enable(mock_ctx, payload)
             first_calls = mock_ctx.mqtt.publish.call_count
@@ -210,7 +228,7 @@ def test_different_request_ids_both_processed(mock_ctx):
         mock_load.return_value = {
             "fixture_cpu": {"component_id": "fixture_cpu", "version": "1.0.0", "enabled": False}
         }
-        with patch("lucid_agent_core.core.handlers.component_handlers.write_registry"):
+        with patch("lucid_agent_core.core.handlers.component_handlers.write_registry_async"):
             on_components_enable(mock_ctx, json.dumps({"request_id": "id-a", "component_id": "fixture_cpu"}))
             on_components_enable(mock_ctx, json.dumps({"request_id": "id-b", "component_id": "fixture_cpu"}))
 
@@ -223,3 +241,234 @@ def test_different_request_ids_both_processed(mock_ctx):
                 assert result.get("error") != "duplicate request_id"
         except Exception:
             pass
+
+
+def test_unhandled_error_publishes_error_result(mock_ctx):
+    """An exception escaping the handler body is reported on the result topic."""
+    payload = json.dumps({"request_id": "boom-001", "component_id": "fixture_cpu"})
+
+    with patch("lucid_agent_core.core.handlers.component_handlers.load_registry") as mock_load:
+        mock_load.side_effect = OSError("disk gone")
+        on_components_enable(mock_ctx, payload)
+
+    last_publish = mock_ctx.mqtt.publish.call_args_list[-1]
+    assert "evt/components/enable/result" in last_publish[0][0]
+    result = json.loads(last_publish[0][1])
+    assert result["ok"] is False
+    assert result["request_id"] == "boom-001"
+    assert result["error"] == "unhandled error: disk gone"
+
+
+def test_refresh_publishes_metadata_for_every_component(mock_ctx):
+    """cmd/refresh republishes retained metadata for each registry entry, then the result."""
+    from lucid_agent_core.core.handlers import on_refresh
+
+    with patch("lucid_agent_core.core.handlers.refresh_handler.load_registry") as mock_load:
+        mock_load.return_value = {
+            "cpu": {"version": "1.0.0", "enabled": True},
+            "led": {"version": "0.2.0", "enabled": False},
+        }
+        on_refresh(mock_ctx, json.dumps({"request_id": "refresh-1"}))
+
+    topics = [c[0][0] for c in mock_ctx.mqtt.publish.call_args_list]
+    assert topics == [
+        mock_ctx.topics.component_metadata("cpu"),
+        mock_ctx.topics.component_metadata("led"),
+        mock_ctx.topics.evt_result("refresh"),
+    ]
+    meta = json.loads(mock_ctx.mqtt.publish.call_args_list[1][0][1])
+    assert meta == {"component_id": "led", "version": "0.2.0", "capabilities": []}
+    assert mock_ctx.mqtt.publish.call_args_list[0][1] == {"qos": 0, "retain": True}
+    assert mock_ctx.mqtt.publish.call_args_list[-1][1] == {"qos": 1, "retain": False}
+
+
+def test_refresh_skips_component_whose_metadata_fails(mock_ctx):
+    from lucid_agent_core.core.handlers import on_refresh
+
+    bad = MagicMock()
+    bad.capabilities.side_effect = RuntimeError("boom")
+    good = MagicMock()
+    good.capabilities.return_value = ["reset"]
+    mock_ctx.component_manager = MagicMock()
+    mock_ctx.component_manager.get_component.side_effect = {"cpu": bad, "led": good}.get
+
+    with patch("lucid_agent_core.core.handlers.refresh_handler.load_registry") as mock_load:
+        mock_load.return_value = {
+            "cpu": {"version": "1.0.0", "enabled": True},
+            "led": {"version": "2.0.0", "enabled": True},
+        }
+        on_refresh(mock_ctx, json.dumps({"request_id": "refresh-partial"}))
+
+    calls = mock_ctx.mqtt.publish.call_args_list
+    assert [c[0][0] for c in calls] == [
+        mock_ctx.topics.component_metadata("led"),
+        mock_ctx.topics.evt_refresh_result,
+    ]
+    assert json.loads(calls[-1][0][1])["ok"] is True
+    mock_ctx.mqtt.publish.return_value.wait_for_publish.assert_called_once()
+
+
+def test_back_to_back_refreshes_each_republish(mock_ctx):
+    """A retried refresh (e.g. after lost QoS 0 publishes) republishes again."""
+    from lucid_agent_core.core.handlers import on_refresh
+
+    with patch("lucid_agent_core.core.handlers.refresh_handler.load_registry") as mock_load:
+        mock_load.return_value = {"cpu": {"version": "1.0.0", "enabled": True}}
+        on_refresh(mock_ctx, json.dumps({"request_id": "refresh-1"}))
+        on_refresh(mock_ctx, json.dumps({"request_id": "refresh-2"}))
+
+    assert mock_load.call_count == 2
+    topics = [c[0][0] for c in mock_ctx.mqtt.publish.call_args_list]
+    assert topics == [
+        mock_ctx.topics.component_metadata("cpu"),
+        mock_ctx.topics.evt_refresh_result,
+        mock_ctx.topics.component_metadata("cpu"),
+        mock_ctx.topics.evt_refresh_result,
+    ]
+
+
+def test_component_metadata_payload_is_cached_until_invalidated(mock_ctx):
+    from lucid_agent_core.core.handlers import refresh_handler
+
+    refresh_handler.invalidate_component_metadata("cpu")
+    first = refresh_handler._component_metadata(mock_ctx, "cpu", "1.0.0")
+    assert refresh_handler._component_metadata(mock_ctx, "cpu", "1.0.0") is first
+
+    refresh_handler.invalidate_component_metadata("cpu")
+    assert refresh_handler._component_metadata(mock_ctx, "cpu", "1.0.0") is not first
+
+
+def test_metadata_cache_safe_under_concurrent_invalidation(mock_ctx):
+    from lucid_agent_core.core.handlers import refresh_handler
+
+    errors: list[BaseException] = []
+
+    def fill():
+        try:
+            for i in range(500):
+                refresh_handler._component_metadata(mock_ctx, "cpu", f"1.0.{i}")
+        except BaseException as exc:  # pragma: no cover - reported below
+            errors.append(exc)
+
+    def invalidate():
+        try:
+            for _ in range(500):
+                refresh_handler.invalidate_component_metadata("cpu")
+        except BaseException as exc:  # pragma: no cover - reported below
+            errors.append(exc)
+
+    threads = [threading.Thread(target=fill), threading.Thread(target=invalidate)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    refresh_handler.invalidate_component_metadata("cpu")
+
+    assert errors == []
+
+
+def test_component_capabilities_cached_per_instance():
+    from lucid_agent_core.core.handlers import refresh_handler
+
+    comp = MagicMock()
+    comp.capabilities.return_value = ["reset"]
+    ctx = MagicMock()
+    ctx.component_manager.get_component.return_value = comp
+
+    assert refresh_handler._component_capabilities(ctx, "cpu") == ["reset"]
+    assert refresh_handler._component_capabilities(ctx, "cpu") == ["reset"]
+    assert comp.capabilities.call_count == 1
+
+    reloaded = MagicMock()
+    reloaded.capabilities.return_value = ["reset", "ping"]
+    ctx.component_manager.get_component.return_value = reloaded
+    assert refresh_handler._component_capabilities(ctx, "cpu") == ["reset", "ping"]
+
+
+def test_component_capabilities_cache_does_not_keep_instances_alive():
+    import gc
+    import weakref
+
+    from lucid_agent_core.core.handlers import refresh_handler
+
+    class _Comp:
+        def capabilities(self):
+            return ["reset"]
+
+    comp = _Comp()
+    ref = weakref.ref(comp)
+    ctx = MagicMock()
+    ctx.component_manager.get_component.return_value = comp
+    assert refresh_handler._component_capabilities(ctx, "cpu") == ["reset"]
+
+    ctx.component_manager.get_component.return_value = None
+    del comp
+    gc.collect()
+
+    assert ref() is None
+
+
+def test_ok_result_bytes_matches_json_encoding():
+    from lucid_agent_core.core.cmd_context import ok_result_bytes
+
+    for rid in ["abc", 'quo"te\\', "ünï", "", 42]:
+        assert json.loads(ok_result_bytes(rid)) == {"request_id": rid, "ok": True, "error": None}
+
+
+def test_lifecycle_handler_restarts_even_if_result_publish_unconfirmed(mock_ctx):
+    from dataclasses import dataclass
+
+    from lucid_agent_core.core.handlers._lifecycle import make_lifecycle_handler
+
+    @dataclass(frozen=True, slots=True)
+    class _Result:
+        request_id: str
+        component_id: str
+        ok: bool = True
+        restart_required: bool = True
+
+    after = MagicMock()
+    handler = make_lifecycle_handler(
+        "components/install",
+        lambda raw: _Result("life-1", "cpu"),
+        restart_reason=lambda r: f"test: {r.component_id}",
+        after=after,
+    )
+    mock_ctx.mqtt.publish.return_value.wait_for_publish.side_effect = RuntimeError("offline")
+
+    restarted = threading.Event()
+    with patch("lucid_agent_core.core.handlers._lifecycle.request_systemd_restart") as restart:
+        restart.side_effect = lambda **_kw: restarted.set()
+        handler(mock_ctx, json.dumps({"request_id": "life-1"}))
+        assert restarted.wait(timeout=5)
+
+    restart.assert_called_once_with(reason="test: cpu")
+    after.assert_called_once()
+    assert handler.__name__ == "on_components_install"
+    result_topics = [c[0][0] for c in mock_ctx.mqtt.publish.call_args_list]
+    assert mock_ctx.topics.evt_components_install_result in result_topics
+
+
+def test_ping_result_is_published_at_qos_0(mock_ctx):
+    on_ping(mock_ctx, json.dumps({"request_id": "ping-1"}))
+
+    (topic, payload), kwargs = mock_ctx.mqtt.publish.call_args
+    assert topic == mock_ctx.topics.evt_ping_result
+    assert json.loads(payload) == {"request_id": "ping-1", "ok": True, "error": None}
+    assert kwargs == {"qos": 0, "retain": False}
+
+
+def test_deferred_restart_does_not_block_on_publish_ack():
+    from lucid_agent_core.core.handlers._lifecycle import defer_restart
+
+    acked = threading.Event()
+    msg_info = MagicMock()
+    msg_info.wait_for_publish.side_effect = lambda timeout: acked.wait(timeout)
+
+    with patch("lucid_agent_core.core.handlers._lifecycle.request_systemd_restart") as restart:
+        thread = defer_restart(msg_info, "test", "test")
+        assert not restart.called
+        acked.set()
+        thread.join(timeout=5)
+
+    restart.assert_called_once_with(reason="test")
@@ -84,6 +84,18 @@ def test_connect_sets_lwt_and_starts_loop(client, fake_paho_client):
 
     fake_paho_client.connect.assert_called_with("localhost", 1883, keepalive=60)
     fake_paho_client.loop_start.assert_called_once()
+    fake_paho_client.max_inflight_messages_set.assert_called_once_with(128)
+
+
+def test_wait_connected_follows_connect_and_disconnect_callbacks(client, fake_paho_client):
+    client.connect()
+    assert client.wait_connected(0) is False
+
+    client._on_connect(fake_paho_client, None, {}, _SuccessRC(), None)
+    assert client.wait_connected(0) is True
+
+    client._on_disconnect(fake_paho_client, None, {}, _SuccessRC(), None)
+    assert client.wait_connected(0) is False
 
 
 def test_on_connect_subscribes_and_publishes_retained(client, fake_paho_client, tmp_path):
@@ -151,26 +163,47 @@ def test_on_message_dispatches_known_topic(client, fake_paho_client, tmp_path):
 
     called = {"n": 0, "payload": None}
 
-    def handler(p: str) -> None:
+    def handler(p: bytes, command: dict) -> None:
         called["n"] += 1
         called["payload"] = p
+        called["command"] = command
 
     topics = TopicSchema("agent_1")
-    client._handlers = {topics.cmd_ping(): handler}
+    client._handlers = {topics.cmd("refresh"): handler}
 
     payload = '{"request_id":"abc"}'.encode("utf-8")
-    msg = FakeMQTTMessage(topics.cmd_ping(), payload)
+    msg = FakeMQTTMessage(topics.cmd("refresh"), payload)
 
     client._on_message(fake_paho_client, None, msg)
 
     assert called["n"] == 1
-    assert called["payload"] == '{"request_id":"abc"}'
+    assert called["payload"] == b'{"request_id":"abc"}'
+    assert called["command"] == {"request_id": "abc"}
+
+
+def test_on_message_dispatches_ping_without_full_parse(client, fake_paho_client, monkeypatch):
+    ctx = MagicMock()
+    ctx.topics = client.topics
+    client.set_context(ctx)
+
+    def no_parse(_raw):
+        raise AssertionError("ping payload fully parsed")
+
+    monkeypatch.setattr("lucid_agent_core.mqtt.client.parse_payload", no_parse)
+    monkeypatch.setattr("lucid_agent_core.core.handlers._parsing.parse_payload", no_parse)
+    msg = FakeMQTTMessage(client.topics.cmd_ping(), b'{"request_id":"p-9"}')
+    client._on_message(fake_paho_client, None, msg)
+
+    ctx.publish_bytes.assert_called_once_with(
+        client.topics.evt_ping_result, ANY, retain=False, qos=0
+    )
+    assert json.loads(ctx.publish_bytes.call_args[0][1])["request_id"] == "p-9"
 
 
 def test_on_message_ignores_unknown_topic(client, fake_paho_client):
     called = {"n": 0}
 
-    def handler(p: str) -> None:
+    def handler(p: bytes, command: dict) -> None:
         called["n"] += 1
 
     topics = TopicSchema("agent_1")
@@ -185,7 +218,7 @@ def test_on_message_ignores_unknown_topic(client, fake_paho_client):
 def test_on_message_rejects_non_utf8_payload(client, fake_paho_client):
     called = {"n": 0}
 
-    def handler(p: str) -> None:
+    def handler(p: bytes, command: dict) -> None:
         called["n"] += 1
 
     topics = TopicSchema("agent_1")
@@ -249,6 +282,59 @@ def test_add_component_handlers_subscribes_hyphenated_actions(client, fake_paho_
         fake_paho_client.subscribe.assert_any_call(topic, qos=1)
 
 
+def test_component_cmd_handlers_receive_str_payload(client, fake_paho_client):
+    received = []
+
+    class FakeComponent:
+        component_id = "led_strip"
+
+        def capabilities(self):
+            return ["set-color"]
+
+        def _make_cmd_handler(self, action, method):
+            return lambda p: method(p)
+
+        def on_cmd_set_color(self, payload: str) -> None:
+            received.append(payload)
+
+    client._client = fake_paho_client
+    fake_paho_client.is_connected.return_value = True
+    client.add_component_handlers([FakeComponent()], {"led_strip": {"enabled": True}})
+
+    topic = TopicSchema("agent_1").component_cmd("led_strip", "set-color")
+    client._handlers[topic](b'{"request_id":"c1"}')
+
+    assert received == ['{"request_id":"c1"}']
+
+
+def test_component_cmd_dispatch_skips_json_parse(client, fake_paho_client, monkeypatch):
+    received = []
+
+    class FakeComponent:
+        component_id = "led_strip"
+
+        def capabilities(self):
+            return ["set-color"]
+
+        def _make_cmd_handler(self, action, method):
+            return lambda p: method(p)
+
+        def on_cmd_set_color(self, payload: str) -> None:
+            received.append(payload)
+
+    def no_parse(_raw):
+        raise AssertionError("component payload parsed by the dispatcher")
+
+    monkeypatch.setattr("lucid_agent_core.mqtt.client.parse_payload", no_parse)
+    client._client = fake_paho_client
+    client.add_component_handlers([FakeComponent()], {"led_strip": {"enabled": True}})
+
+    topic = TopicSchema("agent_1").component_cmd("led_strip", "set-color")
+    client._on_message(fake_paho_client, None, FakeMQTTMessage(topic, b'{"request_id":"c2"}'))
+
+    assert received == ['{"request_id":"c2"}']
+
+
 def test_subscribe_component_topics_subscribes_hyphenated_actions(client, fake_paho_client):
     class FakeComponent:
         def capabilities(self):
@@ -369,7 +455,7 @@ def test_drop_old_when_capacity_full_and_cancellable_future_exists(
     cmd_topic = topics.cmd_ping()
 
     handler_calls = []
-    c._handlers = {cmd_topic: lambda p: handler_calls.append(p)}
+    c._handlers = {cmd_topic: lambda p, command: handler_calls.append(p)}
 
     # First message — acquires the only slot, future stays PENDING in queue.
     c._on_message(fake_paho_client, None, FakeMQTTMessage(
@@ -411,7 +497,7 @@ def test_drop_new_fallback_when_no_cancellable_future(
     topics = TopicSchema("agent_1")
     cmd_topic = topics.cmd_ping()
 
-    c._handlers = {cmd_topic: lambda p: None}
+    c._handlers = {cmd_topic: lambda p, command: None}
 
     # First message — acquires slot, queued future.
     c._on_message(fake_paho_client, None, FakeMQTTMessage(
@@ -445,7 +531,7 @@ def test_cancellation_publishes_failure_with_distinct_error(
     c = client_manual_exec
     topics = TopicSchema("agent_1")
     cmd_topic = topics.cmd_ping()
-    c._handlers = {cmd_topic: lambda p: None}
+    c._handlers = {cmd_topic: lambda p, command: None}
 
     c._on_message(fake_paho_client, None, FakeMQTTMessage(
         cmd_topic, b'{"request_id":"victim"}'
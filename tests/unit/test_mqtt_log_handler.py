@@ -5,7 +5,7 @@ import logging
 
 from lucid_agent_core.core.log_config import level_from_cfg_or_env
 from lucid_agent_core.core.mqtt_log_handler import MQTTLogHandler
-from lucid_agent_core.core.snapshots import build_cfg, build_cfg_logging
+from lucid_agent_core.core.snapshots import build_cfg, build_cfg_logging, build_cfg_telemetry
 
 
 class _FakeConnectedClient:
@@ -53,6 +53,18 @@ def test_build_cfg_logging_reflects_stored_log_level():
     assert "logs_enabled" not in cfg
 
 
+def test_build_cfg_telemetry_fills_defaults_and_coerces_stored_values():
+    cfg = build_cfg_telemetry(
+        {"telemetry": {"metrics": {"cpu_percent": {"enabled": 1, "interval_s": "5"}, "disk_percent": 3}}}
+    )
+    assert cfg["cpu_percent"] == {"enabled": True, "interval_s": 5, "change_threshold_percent": 2.0}
+    default = {"enabled": False, "interval_s": 2, "change_threshold_percent": 2.0}
+    assert cfg["memory_percent"] == default
+    assert cfg["disk_percent"] == default
+    cfg["memory_percent"]["enabled"] = True
+    assert build_cfg_telemetry({})["memory_percent"] == default
+
+
 def test_level_from_cfg_or_env_defaults_info(monkeypatch):
     monkeypatch.delenv("LUCID_LOG_LEVEL", raising=False)
     assert level_from_cfg_or_env(None) == logging.INFO
@@ -145,3 +157,62 @@ def test_mqtt_log_handler_publishes():
     assert line["level"] == "error"
     assert line["message"] == "hello mqtt"
     assert line["logger"] == "lucid.test"
+
+
+def test_batches_beyond_window_limit_are_dropped(monkeypatch):
+    from lucid_agent_core.core import mqtt_log_handler as mlh
+
+    fake_mqtt = _FakeMQTTClient()
+    handler = MQTTLogHandler(fake_mqtt, "lucid/agents/agent_1/logs")
+    monkeypatch.setattr(mlh.time, "monotonic", lambda: 1000.0)
+
+    for _ in range(mlh.MAX_BATCHES_PER_WINDOW + 3):
+        handler._buffer.append({"message": "x"})
+        handler._publish_batch()
+
+    assert len(fake_mqtt.published) == mlh.MAX_BATCHES_PER_WINDOW
+    assert handler._buffer == []
+
+    monkeypatch.setattr(mlh.time, "monotonic", lambda: 1000.0 + mlh.TIME_WINDOW_S + 0.1)
+    handler._buffer.append({"message": "x"})
+    handler._publish_batch()
+    assert len(fake_mqtt.published) == mlh.MAX_BATCHES_PER_WINDOW + 1
+
+
+def test_queue_handler_forwards_records_to_mqtt_handler_on_listener_thread():
+    from lucid_agent_core.core.mqtt_log_handler import MQTTLogQueueHandler
+
+    fake_mqtt = _FakeMQTTClient()
+    target = MQTTLogHandler(fake_mqtt, "lucid/agents/agent_1/logs")
+    front = MQTTLogQueueHandler(target)
+    front.start()
+
+    args = ["mqtt"]
+    record = logging.LogRecord("lucid.test", logging.INFO, __file__, 1, "hello %s", (args,), None)
+    front.handle(record)
+    args.append("later")  # mutation after the call must not change the message
+    front.close()  # drains the queue through the target
+
+    target._publish_batch()
+    line = json.loads(fake_mqtt.published[0]["payload"])["lines"][0]
+    assert line["message"] == "hello ['mqtt']"
+    assert front.topic == target.topic
+
+
+def test_batch_with_lone_surrogate_is_still_published():
+    fake_mqtt = _FakeMQTTClient()
+    handler = MQTTLogHandler(fake_mqtt, "lucid/agents/agent_1/logs")
+    handler._buffer.append({"message": "bad name \udcff"})
+    handler._publish_batch()
+
+    payload = json.loads(fake_mqtt.published[0]["payload"])
+    assert payload["lines"][0]["message"] == "bad name \udcff"
+
+
+def test_utc_iso_from_epoch_matches_datetime_isoformat():
+    from datetime import datetime, timezone
+
+    from lucid_agent_core.core.timeutil import utc_iso_from_epoch
+
+    for ts in (1700000000.0, 1700000000.25, 1700000000.9999996, 1700000001.000001, 12.5):
+        assert utc_iso_from_epoch(ts) == datetime.fromtimestamp(ts, timezone.utc).isoformat()
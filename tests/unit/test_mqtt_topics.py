@@ -32,6 +32,26 @@ def test_agent_topic_paths() -> None:
     assert t.evt_components_result("uninstall") == "lucid/agents/agent_1/evt/components/uninstall/result"
 
 
+def test_precomputed_result_topics_match_formatted() -> None:
+    t = TopicSchema("agent_1")
+
+    assert t.evt_ping_result == t.evt_result("ping")
+    assert t.evt_cfg_logging_set_result == "lucid/agents/agent_1/evt/cfg/logging/set/result"
+    assert t.evt_components_install_result == t.evt_components_result("install")
+    assert t.evt_core_upgrade_result == "lucid/agents/agent_1/evt/core/upgrade/result"
+    assert t.evt_result("custom/action") == "lucid/agents/agent_1/evt/custom/action/result"
+    assert t == TopicSchema("agent_1")
+
+
+def test_precomputed_retained_topics() -> None:
+    t = TopicSchema("agent_1")
+
+    assert t.state_topic == t.state() == "lucid/agents/agent_1/state"
+    assert t.cfg_logging_topic == t.cfg_logging() == "lucid/agents/agent_1/cfg/logging"
+    assert t.cfg_telemetry_topic == "lucid/agents/agent_1/cfg/telemetry"
+    assert t.metadata_topic == t.metadata()
+
+
 def test_component_topic_paths() -> None:
     t = TopicSchema("agent_1")
 
@@ -62,3 +82,27 @@ def test_component_id_validation(bad: str) -> None:
     t = TopicSchema("agent_1")
     with pytest.raises(TopicSchemaError):
         t.component_base(bad)
+
+
+def test_cmd_topic_for_every_handler_action() -> None:
+    from lucid_agent_core.core.handlers import HANDLERS
+
+    t = TopicSchema("agent_1")
+    assert t.cmd("ping") == t.cmd_ping()
+    assert t.cmd("components/install") == t.cmd_components_install()
+    assert {t.cmd(action) for action in HANDLERS} == {
+        t.cmd_ping(),
+        t.cmd_restart(),
+        t.cmd_refresh(),
+        t.cmd_cfg_set(),
+        t.cmd_cfg_logging_set(),
+        t.cmd_cfg_telemetry_set(),
+        t.cmd_components_install(),
+        t.cmd_components_uninstall(),
+        t.cmd_components_enable(),
+        t.cmd_components_disable(),
+        t.cmd_components_upgrade(),
+        t.cmd_core_upgrade(),
+    }
+    with pytest.raises(TopicSchemaError):
+        t.cmd("")
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import pytest
+
+from lucid_agent_core.core.handlers._parsing import parse_payload
+
+
+def test_parse_payload_accepts_str_and_bytes():
+    assert parse_payload('{"request_id":"a"}') == {"request_id": "a"}
+    assert parse_payload(b'{"request_id":"a"}') == {"request_id": "a"}
+
+
+def test_parse_payload_invalid_or_non_object_returns_empty():
+    assert parse_payload("") == {}
+    assert parse_payload("{not json") == {}
+    assert parse_payload(b"[1, 2]") == {}
+
+
+def test_parse_payload_invalid_utf8_returns_empty_without_orjson(monkeypatch):
+    from lucid_agent_core import _json
+
+    monkeypatch.setattr(_json, "orjson", None)
+    assert parse_payload(b"\xff\xfe\xfd") == {}
+    assert parse_payload(b'{"request_id":"a"}') == {"request_id": "a"}
+
+
+def test_scan_request_id_fast_path_and_fallback():
+    from lucid_agent_core.core.handlers._parsing import scan_request_id
+
+    assert scan_request_id(b'{"request_id": "p-1"}') == "p-1"
+    assert scan_request_id('{"ts":1,"request_id":"p-2"}') == "p-2"
+    assert scan_request_id(b'{"request_id":"a\\"b"}') == 'a"b'
+    assert scan_request_id(b'{"request_id":7}') == ""
+    assert scan_request_id(b"") == ""
+
+
+@pytest.mark.parametrize(
+    "raw, expected",
+    [
+        (b'{"set":{"request_id":"inner"},"request_id":"outer"}', "outer"),
+        ('{"set":{"request_id":"inner"},"request_id":"outer"}', "outer"),
+        (b'{"items":[{"request_id":"inner"}]}', ""),
+        (b'{"set":{"request_id":"inner"}}', ""),
+        (b'{"request_id":"first","request_id":"last"}', "last"),
+        (b'{"request_id":"top","set":{"request_id":"inner"}}', "top"),
+    ],
+)
+def test_scan_request_id_ignores_nested_keys(raw, expected):
+    from lucid_agent_core.core.handlers._parsing import scan_request_id
+
+    assert scan_request_id(raw) == expected
+
+
+def test_command_payload_prefers_pre_parsed_dict():
+    from lucid_agent_core.core.handlers._parsing import command_payload
+
+    parsed = {"request_id": "pre"}
+    assert command_payload(b'{"request_id":"raw"}', parsed) is parsed
+    assert command_payload(b'{"request_id":"raw"}', None) == {"request_id": "raw"}
+
+
+def test_empty_and_invalid_payloads_share_read_only_mapping():
+    from lucid_agent_core.core.handlers._parsing import EMPTY_PAYLOAD
+
+    assert parse_payload("") is EMPTY_PAYLOAD
+    assert parse_payload(b"[1]") is EMPTY_PAYLOAD
+    with pytest.raises(TypeError):
+        EMPTY_PAYLOAD["request_id"] = "x"  # type: ignore[index]
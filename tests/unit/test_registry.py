@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+import threading
 from pathlib import Path
 
 import pytest
@@ -74,3 +75,105 @@ def test_written_file_is_valid_json(tmp_registry):
 
     assert isinstance(parsed, dict)
     assert parsed["cpu"]["version"] == "1.0.0"
+
+
+def test_async_write_is_visible_before_and_after_flush(tmp_registry):
+    data = {"cpu": {"repo": "Org/repo", "version": "1.0.0", "entrypoint": "x.y:CPU"}}
+
+    future = r.write_registry_async(data)
+    assert r.load_registry() == data
+
+    future.result(timeout=5)
+    r.flush_registry_writes(timeout=5)
+    assert json.loads(tmp_registry.read_text()) == data
+    assert r.load_registry() == data
+
+
+def test_cached_load_returns_independent_copies(tmp_registry):
+    r.write_registry({"cpu": {"version": "1.0.0", "enabled": True}})
+
+    first = r.load_registry()
+    first["cpu"]["enabled"] = False
+
+    assert r.load_registry()["cpu"]["enabled"] is True
+
+
+def test_cached_load_notices_external_rewrite(tmp_registry):
+    r.write_registry({"cpu": {"version": "1.0.0"}})
+    assert r.load_registry()["cpu"]["version"] == "1.0.0"
+
+    tmp_registry.write_text(json.dumps({"cpu": {"version": "2.0.0", "pad": "x"}}))
+
+    assert r.load_registry()["cpu"]["version"] == "2.0.0"
+
+
+def test_load_after_write_is_served_without_rereading(tmp_registry, monkeypatch):
+    data = {"cpu": {"version": "1.0.0", "enabled": True}}
+    r.write_registry(data)
+
+    def fail(*_args, **_kwargs):
+        raise AssertionError("registry file re-read after write")
+
+    monkeypatch.setattr(r.json, "load", fail)
+    assert r.load_registry() == data
+
+
+def test_queued_async_writes_coalesce_into_latest_snapshot(tmp_registry, monkeypatch):
+    gate = threading.Event()
+    r._writer.submit(gate.wait, 5)
+
+    writes = []
+    real_write = r._write_registry_file
+    monkeypatch.setattr(r, "_write_registry_file", lambda d: (writes.append(d), real_write(d)))
+
+    futures = [r.write_registry_async({"cpu": {"version": f"1.0.{i}"}}) for i in range(5)]
+    gate.set()
+    for future in futures:
+        future.result(timeout=5)
+
+    assert writes == [{"cpu": {"version": "1.0.4"}}]
+    assert json.loads(tmp_registry.read_text()) == {"cpu": {"version": "1.0.4"}}
+
+
+def test_failed_async_write_keeps_snapshot_until_a_write_succeeds(tmp_registry, monkeypatch):
+    r.write_registry({"cpu": {"version": "1.0.0", "enabled": True}})
+    real_write = r._write_registry_file
+
+    def disk_full(_data):
+        raise OSError(28, "No space left on device")
+
+    monkeypatch.setattr(r, "_write_registry_file", disk_full)
+    future = r.write_registry_async({"cpu": {"version": "1.0.0", "enabled": False}})
+    with pytest.raises(OSError):
+        future.result(timeout=5)
+
+    # The state published from this snapshot must not revert to what is on disk.
+    assert r.load_registry()["cpu"]["enabled"] is False
+
+    monkeypatch.setattr(r, "_write_registry_file", real_write)
+    r.write_registry(r.load_registry())
+    assert json.loads(tmp_registry.read_text())["cpu"]["enabled"] is False
+    assert r._pending is None
+
+
+def test_failed_sync_write_restores_previous_state(tmp_registry, monkeypatch):
+    r.write_registry({"cpu": {"version": "1.0.0", "enabled": True}})
+    real_write = r._write_registry_file
+
+    def disk_full(_data):
+        raise OSError(28, "No space left on device")
+
+    monkeypatch.setattr(r, "_write_registry_file", disk_full)
+    with pytest.raises(OSError):
+        r.write_registry(
+            {"cpu": {"version": "1.0.0", "enabled": True}, "led": {"version": "9.9"}}
+        )
+
+    assert "led" not in r.load_registry()
+    assert r._pending is None
+
+    monkeypatch.setattr(r, "_write_registry_file", real_write)
+    registry = r.load_registry()
+    registry["cpu"]["enabled"] = False
+    r.write_registry_async(registry).result(timeout=5)
+    assert json.loads(tmp_registry.read_text()) == {"cpu": {"version": "1.0.0", "enabled": False}}
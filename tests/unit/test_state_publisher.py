@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import json
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+from lucid_agent_core.core.snapshots import build_components_list, build_state
+from lucid_agent_core.core.state_publisher import StatePublisher, publish_state
+from lucid_agent_core.mqtt_topics import TopicSchema
+
+_REGISTRY = {"cpu": {"version": "1.0.0", "enabled": True}}
+
+
+def _ctx() -> MagicMock:
+    ctx = MagicMock()
+    ctx.topics = TopicSchema("test")
+    return ctx
+
+
+def _published_state(ctx: MagicMock) -> tuple[str, dict]:
+    topic, payload = ctx.publish_bytes.call_args[0]
+    return topic, json.loads(payload)
+
+
+def test_burst_of_marks_publishes_once():
+    ctx = _ctx()
+    publisher = StatePublisher(ctx, delay_s=0.02)
+
+    with patch("lucid_agent_core.core.state_publisher.load_registry", return_value=_REGISTRY):
+        for _ in range(5):
+            publisher.mark_dirty()
+        time.sleep(0.2)
+
+    assert ctx.publish_bytes.call_count == 1
+    topic, state = _published_state(ctx)
+    assert topic == ctx.topics.state()
+    assert state["components"][0]["component_id"] == "cpu"
+
+
+def test_flush_publishes_pending_state_immediately():
+    ctx = _ctx()
+    publisher = StatePublisher(ctx, delay_s=60.0)
+
+    with patch("lucid_agent_core.core.state_publisher.load_registry", return_value=_REGISTRY):
+        publisher.mark_dirty()
+        publisher.flush()
+        publisher.flush()
+
+    assert ctx.publish_bytes.call_count == 1
+
+
+def test_publish_state_without_publisher_is_inline():
+    ctx = _ctx()
+    ctx.state_publisher = None
+
+    publish_state(ctx, _REGISTRY)
+
+    assert ctx.publish_bytes.call_count == 1
+    topic, state = _published_state(ctx)
+    assert topic == ctx.topics.state()
+    assert state == build_state(build_components_list(_REGISTRY))
+
+
+def test_update_component_patches_seeded_list_without_registry_scan():
+    ctx = _ctx()
+    publisher = StatePublisher(ctx, delay_s=60.0)
+    publisher.seed(
+        [
+            {"component_id": "cpu", "version": "1.0.0", "enabled": True, "load_failed": True},
+            {"component_id": "led", "version": "0.2.0", "enabled": True},
+        ]
+    )
+
+    with patch("lucid_agent_core.core.state_publisher.load_registry") as mock_load:
+        publisher.update_component("cpu", {"version": "1.0.0", "enabled": False})
+        publisher.update_component("led", None)
+        publisher.update_component("new", {"version": "3.0.0"})
+        publisher.flush()
+        mock_load.assert_not_called()
+
+    _, state = _published_state(ctx)
+    assert state["components"] == [
+        {"component_id": "cpu", "version": "1.0.0", "enabled": False, "load_failed": True},
+        {"component_id": "new", "version": "3.0.0", "enabled": True},
+    ]
+
+
+def test_flush_state_flushes_configured_publisher():
+    from lucid_agent_core.core.state_publisher import flush_state
+
+    ctx = _ctx()
+    ctx.state_publisher = StatePublisher(ctx, delay_s=60.0)
+    ctx.state_publisher.seed([])
+    ctx.state_publisher.update_component("cpu", _REGISTRY["cpu"])
+
+    flush_state(ctx)
+
+    assert ctx.publish_bytes.call_count == 1
+    ctx.state_publisher = None
+    flush_state(ctx)
+
+
+def test_unchanged_state_is_not_republished():
+    ctx = _ctx()
+    publisher = StatePublisher(ctx, delay_s=60.0)
+    publisher.seed([])
+
+    publisher.update_component("cpu", _REGISTRY["cpu"])
+    publisher.flush()
+    publisher.update_component("cpu", _REGISTRY["cpu"])
+    publisher.flush()
+    assert ctx.publish_bytes.call_count == 1
+
+    publisher.update_component("cpu", {"version": "1.0.0", "enabled": False})
+    publisher.flush()
+    assert ctx.publish_bytes.call_count == 2
+
+
+def test_flush_waits_for_timer_publish_in_flight():
+    ctx = _ctx()
+    publisher = StatePublisher(ctx, delay_s=0.0)
+    publisher.seed([])
+    started = threading.Event()
+    release = threading.Event()
+    finished: list[str] = []
+
+    def slow_publish(*args, **kwargs):
+        started.set()
+        release.wait(2.0)
+        finished.append("timer")
+
+    ctx.publish_bytes.side_effect = slow_publish
+    publisher.update_component("cpu", _REGISTRY["cpu"])
+    assert started.wait(2.0)
+
+    flusher = threading.Thread(target=lambda: (publisher.flush(), finished.append("flush")))
+    flusher.start()
+    time.sleep(0.05)
+    assert finished == []
+    release.set()
+    flusher.join(2.0)
+
+    assert finished == ["timer", "flush"]
+
+
+def test_forget_published_allows_same_state_to_republish():
+    ctx = _ctx()
+    publisher = StatePublisher(ctx, delay_s=60.0)
+    publisher.seed([])
+
+    publisher.update_component("cpu", _REGISTRY["cpu"])
+    publisher.flush()
+    publisher.forget_published()
+    publisher.update_component("cpu", _REGISTRY["cpu"])
+    publisher.flush()
+
+    assert ctx.publish_bytes.call_count == 2
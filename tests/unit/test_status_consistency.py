@@ -146,3 +146,29 @@ def test_status_uptime_increases(client, fake_paho_client, tmp_path):
     updated_uptime = updated_status["uptime_s"]
     
     assert updated_uptime > initial_uptime
+
+
+def test_status_payload_json_is_compact():
+    """Status payloads are encoded without separator whitespace."""
+    from lucid_agent_core.mqtt import StatusPayload
+
+    payload = StatusPayload(state="online", connected_since_ts="t0", uptime_s=1.5).to_json()
+    assert payload == '{"state":"online","connected_since_ts":"t0","uptime_s":1.5}'
+
+
+def test_heartbeat_status_bytes_match_status_payload():
+    """The heartbeat's cached-prefix encoding matches StatusPayload.to_json."""
+    from lucid_agent_core.mqtt import StatusPayload
+    from lucid_agent_core.mqtt.heartbeat import HeartbeatLoop
+
+    loop = HeartbeatLoop(MagicMock(), "lucid/agents/test/status", lambda: None)
+    cases = [
+        ("2026-01-01T00:00:00+00:00", 12.5),
+        ("2026-01-01T00:00:00+00:00", 0.0),
+        ('odd"ts', 3.25),
+    ]
+    for ts, uptime in cases:
+        expected = StatusPayload(state="online", connected_since_ts=ts, uptime_s=uptime).to_json()
+        assert loop._online_status(ts, uptime) == expected.encode()
+        decoded = json.loads(expected)
+        assert decoded == {"state": "online", "connected_since_ts": ts, "uptime_s": uptime}
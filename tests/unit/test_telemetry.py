@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import lucid_agent_core.mqtt.telemetry as telemetry
+
+
+def test_sample_metrics_reads_only_requested_metrics(monkeypatch):
+    cpu = MagicMock(return_value=12.5)
+    memory = MagicMock(return_value=40.0)
+    disk = MagicMock(return_value=70.0)
+    monkeypatch.setitem(telemetry._SAMPLERS, "cpu_percent", cpu)
+    monkeypatch.setitem(telemetry._SAMPLERS, "memory_percent", memory)
+    monkeypatch.setitem(telemetry._SAMPLERS, "disk_percent", disk)
+
+    values = telemetry._sample_metrics(["memory_percent", "unknown"])
+
+    assert values == {"memory_percent": 40.0}
+    cpu.assert_not_called()
+    disk.assert_not_called()